@@ -0,0 +1,91 @@
+"""
+Benchmark script comparing find_matching_symptoms called once per string with
+find_matching_symptoms_batch (serial and with a process pool) on a batch of
+free-text symptom strings
+"""
+
+import random
+import sys
+import os
+import time
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from main import (DATASET_SYMPTOMS, find_matching_symptoms, find_matching_symptoms_batch,
+                  configure_symptom_cache, get_symptom_cache_stats)
+
+BATCH_SIZES = [1000, 10000, 50000]
+ENGINES = ['bitparallel', 'ngram']
+PROCESSES = max(2, os.cpu_count() or 1)
+FILLER_WORDS = ['i', 'have', 'a', 'and', 'my', 'is', 'really', 'bad', 'since', 'yesterday', 'also', 'some',
+                'caller', 'reports', 'patient', 'says', 'complains', 'of', 'for', 'two', 'days', 'worse', 'at', 'night']
+
+def add_typo(word, rng):
+    """Delete, double or swap one letter of word"""
+    if len(word) < 4:
+        return word
+    i = rng.randrange(1, len(word) - 1)
+    edit = rng.choice(['delete', 'double', 'swap'])
+    if edit == 'delete':
+        return word[:i] + word[i + 1:]
+    if edit == 'double':
+        return word[:i] + word[i] + word[i:]
+    return word[:i] + word[i + 1] + word[i] + word[i + 2:]
+
+def build_batch(size, seed=3):
+    """Build call-center style symptom strings mixing fillers, symptoms and typos"""
+    rng = random.Random(seed)
+    symptom_words = sorted({word for symptom in DATASET_SYMPTOMS for word in symptom.replace('_', ' ').split()})
+    batch = []
+
+    for _ in range(size):
+        words = [rng.choice(FILLER_WORDS) for _ in range(rng.randint(2, 6))]
+        for _ in range(rng.randint(1, 3)):
+            word = rng.choice(symptom_words)
+            words.insert(rng.randint(0, len(words)), add_typo(word, rng) if rng.random() < 0.5 else word)
+        batch.append(' '.join(words))
+
+    return batch
+
+def time_function(function):
+    """Return the elapsed time (seconds) and the result of function()"""
+    start = time.perf_counter()
+    result = function()
+    return time.perf_counter() - start, result
+
+def main():
+    """Run the benchmark for every batch size"""
+    print("BATCH SYMPTOM MATCHING BENCHMARK")
+    print("=" * 60)
+
+    # Measure the matching work itself, not the LRU cache
+    original_size = get_symptom_cache_stats()['capacity']
+    configure_symptom_cache(size=0)
+
+    all_identical = True
+
+    for size in BATCH_SIZES:
+        batch = build_batch(size)
+        print(f"Batch size: {size} strings")
+
+        for engine_name in ENGINES:
+            one_time, expected = time_function(lambda: [find_matching_symptoms(text, 0.7, engine_name) for text in batch])
+            batch_time, results = time_function(lambda: list(find_matching_symptoms_batch(batch, 0.7, engine_name)))
+            pool_time, pool_results = time_function(
+                lambda: list(find_matching_symptoms_batch(batch, 0.7, engine_name, processes=PROCESSES)))
+            identical = results == expected and pool_results == expected
+            all_identical = all_identical and identical
+
+            print(f"  {engine_name:<11} one at a time {one_time:8.3f} s   batch {batch_time:8.3f} s "
+                  f"({one_time / batch_time:5.1f}x)   {PROCESSES} processes {pool_time:8.3f} s ({one_time / pool_time:5.1f}x)   "
+                  f"identical: {'YES' if identical else 'NO'}")
+        print()
+
+    configure_symptom_cache(size=original_size)
+
+    return all_identical
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,84 @@
+"""
+Benchmark script comparing the cost of the single-label prediction paths, before
+and now, with the ranked top-k differential from the scoring engine and the
+trained model, and argpartition top-k selection with a full sort of the scores
+"""
+
+import random
+import sys
+import os
+import time
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+
+from main import (DISEASE_SYMPTOMS, predict_disease_from_symptoms, get_predicted_value, rank_diseases,
+                  rank_model_diseases, top_k_indices)
+from benchmark_disease_scoring import best_disease_loop
+from benchmark_model_inference import predict_previous
+
+REQUEST_COUNT = 2000
+REPEATS = 5
+TOP_K = 5
+SCORE_SIZES = [41, 1000, 100000]
+# A top-k differential may cost at most this much more than the single-label prediction did before it existed
+DIFFERENTIAL_BUDGET = 1.5
+
+def build_requests(count, seed=11):
+    """Build matched-symptom lists of 2-5 dataset symptoms"""
+    rng = random.Random(seed)
+    vocabulary = sorted({symptom for symptoms in DISEASE_SYMPTOMS.values() for symptom in symptoms})
+    return [rng.sample(vocabulary, rng.randint(2, 5)) for _ in range(count)]
+
+def time_per_call(function, inputs):
+    """Return the mean time (seconds) of function over inputs"""
+    start = time.perf_counter()
+    for value in inputs:
+        function(value)
+    return (time.perf_counter() - start) / len(inputs)
+
+def main():
+    """Run the benchmark"""
+    print("DIFFERENTIAL DIAGNOSIS BENCHMARK")
+    print("=" * 60)
+
+    requests = build_requests(REQUEST_COUNT)
+    print(f"{len(requests)} symptom lists, top {TOP_K}")
+
+    # The previous single-label paths: the per-disease scoring loop and predict on a list-wrapped vector
+    rows = [
+        ('Scoring engine', lambda matched: best_disease_loop(matched, DISEASE_SYMPTOMS),
+         lambda matched: predict_disease_from_symptoms(matched), lambda matched: rank_diseases(matched, TOP_K)),
+        ('Trained model', lambda matched: predict_previous(matched),
+         lambda matched: get_predicted_value(matched), lambda matched: rank_model_diseases(matched, TOP_K)),
+    ]
+    within_budget = True
+    for name, previous, single, ranked in rows:
+        # Alternate the paths within each repeat so machine noise hits all three alike
+        times = [[time_per_call(function, requests) for function in (previous, single, ranked)] for _ in range(REPEATS)]
+        previous_time, single_time, ranked_time = np.min(times, axis=0).tolist()
+        within_budget = within_budget and ranked_time <= previous_time * DIFFERENTIAL_BUDGET
+        print(f"  {name:<15} previous label {previous_time * 1000:7.3f} ms   single label {single_time * 1000:7.3f} ms   "
+              f"top {TOP_K} {ranked_time * 1000:7.3f} ms ({ranked_time / previous_time:4.2f}x previous)")
+    print(f"  Budget: top {TOP_K} within {DIFFERENTIAL_BUDGET}x the previous single-label prediction: "
+          f"{'YES' if within_budget else 'NO'}")
+    print()
+
+    print("Top-k selection")
+    rng = np.random.default_rng(0)
+    for size in SCORE_SIZES:
+        # Rounded scores produce ties like the coverage scores do
+        score_arrays = [np.round(rng.random(size), 2) for _ in range(200)]
+        sort_time = time_per_call(lambda scores: np.argsort(-scores, kind='stable')[:TOP_K], score_arrays)
+        partition_time = time_per_call(lambda scores: top_k_indices(scores, TOP_K), score_arrays)
+        print(f"  {size:>6} scores   full sort {sort_time * 1000:7.3f} ms   argpartition {partition_time * 1000:7.3f} ms "
+              f"({sort_time / partition_time:5.1f}x)")
+    print()
+
+    return within_budget
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,67 @@
+"""
+Benchmark script comparing predict_disease_from_symptoms called once per
+record with predict_diseases_batch on triage-log sized batches of matched
+symptom lists, and the memory the batch scorer needs for a million records
+"""
+
+import random
+import resource
+import sys
+import os
+import time
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from main import DATASET_SYMPTOMS, predict_disease_from_symptoms, predict_diseases_batch
+
+BATCH_SIZES = [10000, 100000, 1000000]
+# Above this size only the batch scorer is timed
+PER_RECORD_LIMIT = 100000
+RULE_SYMPTOMS = ['fever', 'cold', 'cough', 'headache']
+
+def generate_records(count, seed=29):
+    """Yield matched-symptom lists of 1-6 symptoms, some hitting the special-case rules"""
+    rng = random.Random(seed)
+    vocabulary = sorted(DATASET_SYMPTOMS)
+    for _ in range(count):
+        matched = rng.sample(vocabulary, rng.randint(1, 6))
+        if rng.random() < 0.05:
+            matched.append(rng.choice(RULE_SYMPTOMS))
+        yield matched
+
+def main():
+    """Run the benchmark for every batch size"""
+    print("BATCH DISEASE SCORING BENCHMARK")
+    print("=" * 60)
+
+    all_identical = True
+
+    for size in BATCH_SIZES:
+        print(f"Batch size: {size} records")
+        peak_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+        # Records are streamed from a generator, so only one chunk is held at a time
+        start = time.perf_counter()
+        batch_results = [disease for disease, _ in predict_diseases_batch(generate_records(size))]
+        batch_time = time.perf_counter() - start
+        peak_growth = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - peak_before
+
+        print(f"  Batch scorer     {batch_time:8.3f} s   {size / batch_time:10.0f} records/s   "
+              f"peak memory growth {peak_growth / 1024:.1f} MB")
+
+        if size <= PER_RECORD_LIMIT:
+            start = time.perf_counter()
+            expected = [predict_disease_from_symptoms(matched) for matched in generate_records(size)]
+            one_time = time.perf_counter() - start
+            identical = batch_results == expected
+            all_identical = all_identical and identical
+            print(f"  One per record   {one_time:8.3f} s   {size / one_time:10.0f} records/s   "
+                  f"speedup {one_time / batch_time:4.1f}x   identical: {'YES' if identical else 'NO'}")
+        print()
+
+    return all_identical
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
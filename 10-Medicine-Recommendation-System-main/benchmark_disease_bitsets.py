@@ -0,0 +1,68 @@
+"""
+Benchmark script comparing disease scoring throughput of the sparse incidence
+matrix, int bitmasks with bit_count() and a vectorized popcount over packed
+uint64 profiles, as the disease catalog grows to 100k diseases
+"""
+
+import sys
+import os
+import time
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+
+from main import (build_disease_incidence, build_disease_bitsets, score_diseases, score_diseases_bitset,
+                  score_diseases_popcount)
+from benchmark_disease_scoring import build_catalog, build_requests
+
+CATALOG_SIZES = [41, 1000, 10000, 100000]
+
+def main():
+    """Run the benchmark for every catalog size"""
+    print("DISEASE BITSET SCORING BENCHMARK")
+    print("=" * 60)
+
+    sizes = [int(arg) for arg in sys.argv[1:]] or CATALOG_SIZES
+    all_identical = True
+
+    for size in sizes:
+        catalog = build_catalog(size)
+        # /predict passes distinct symptoms, which the bitset engines rely on
+        requests = [list(dict.fromkeys(matched)) for matched in build_requests(catalog, max(20, min(1000, 2000000 // size)))]
+
+        start = time.perf_counter()
+        incidence = build_disease_incidence(catalog)
+        bitsets = build_disease_bitsets(incidence)
+        build_time = time.perf_counter() - start
+
+        engines = [
+            ('Incidence matrix', lambda matched: score_diseases(matched, incidence)),
+            ('Int bitmasks', lambda matched: score_diseases_bitset(matched, incidence, bitsets)),
+            ('Packed popcount', lambda matched: score_diseases_popcount(matched, incidence, bitsets)),
+        ]
+
+        print(f"Catalog size: {size} diseases ({len(requests)} requests, {bitsets['words']} words per profile, "
+              f"build {build_time * 1000:.1f} ms)")
+
+        expected = None
+        for name, score in engines:
+            start = time.perf_counter()
+            results = [score(matched) for matched in requests]
+            elapsed = time.perf_counter() - start
+
+            if expected is None:
+                expected = results
+            identical = all(np.array_equal(result, reference) for result, reference in zip(results, expected))
+            all_identical = all_identical and identical
+
+            print(f"  {name:<17} {len(requests) / elapsed:10.0f} requests/s   "
+                  f"{elapsed / len(requests) * 1000:8.3f} ms/request   identical: {'YES' if identical else 'NO'}")
+        print()
+
+    return all_identical
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,80 @@
+"""
+Benchmark script comparing the sparse incidence-matrix scorer, which scores
+every disease, with inverted-index candidate generation, which scores only
+the diseases sharing a symptom with the request, as the catalog grows
+"""
+
+import sys
+import os
+import time
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+
+from main import build_disease_incidence, build_disease_postings, score_diseases, score_candidate_diseases
+from benchmark_disease_scoring import build_catalog, build_requests
+
+CATALOG_SIZES = [41, 1000, 10000, 100000]
+
+def build_symptom_to_diseases(catalog):
+    """Invert a disease -> symptoms catalog into symptom -> diseases"""
+    symptom_to_diseases = {}
+    for disease, symptoms in catalog.items():
+        for symptom in symptoms:
+            symptom_to_diseases.setdefault(symptom, set()).add(disease)
+    return symptom_to_diseases
+
+def best_row(rows, scores):
+    """Return the best-scoring incidence row, or None when nothing scores above 0.1"""
+    if not len(scores):
+        return None
+    best = int(np.argmax(scores))
+    if scores[best] <= 0.1:
+        return None
+    return best if rows is None else int(rows[best])
+
+def main():
+    """Run the benchmark for every catalog size"""
+    print("DISEASE CANDIDATE GENERATION BENCHMARK")
+    print("=" * 60)
+
+    sizes = [int(arg) for arg in sys.argv[1:]] or CATALOG_SIZES
+    all_identical = True
+
+    for size in sizes:
+        catalog = build_catalog(size)
+        requests = build_requests(catalog, max(20, min(1000, 2000000 // size)))
+        incidence = build_disease_incidence(catalog)
+        postings = build_disease_postings(build_symptom_to_diseases(catalog), incidence)
+
+        candidates = [len(score_candidate_diseases(matched, incidence, postings)[0]) for matched in requests]
+        print(f"Catalog size: {size} diseases ({len(requests)} requests, "
+              f"{np.mean(candidates):.0f} candidates per request on average)")
+
+        engines = [
+            ('Incidence matrix', lambda matched: best_row(None, score_diseases(matched, incidence))),
+            ('Inverted index', lambda matched: best_row(*score_candidate_diseases(matched, incidence, postings))),
+        ]
+
+        expected = None
+        for name, predict in engines:
+            start = time.perf_counter()
+            results = [predict(matched) for matched in requests]
+            elapsed = time.perf_counter() - start
+
+            if expected is None:
+                expected = results
+            identical = results == expected
+            all_identical = all_identical and identical
+
+            print(f"  {name:<17} {len(requests) / elapsed:10.0f} requests/s   "
+                  f"{elapsed / len(requests) * 1000:8.3f} ms/request   identical: {'YES' if identical else 'NO'}")
+        print()
+
+    return all_identical
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
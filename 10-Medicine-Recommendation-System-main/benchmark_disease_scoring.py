@@ -0,0 +1,127 @@
+"""
+Benchmark script comparing the per-disease scoring loop previously used by
+predict_disease_from_symptoms with the sparse incidence-matrix scorer, on
+disease catalogs of increasing size (the shipped dataset padded with
+synthetic diseases)
+"""
+
+import random
+import sys
+import os
+import time
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+
+from main import DISEASE_SYMPTOMS, SYMPTOM_RULES_PATH, build_disease_incidence, load_symptom_rules, score_diseases
+
+CATALOG_SIZES = [41, 1000, 10000, 100000]
+SYMPTOM_VOCABULARY_SIZE = 2000
+# Bonus rules as the per-disease loop used them: (disease, symptoms, bonus)
+DISEASE_BONUS_RULES = [(rule['disease'], set(rule['symptoms']), rule['bonus'])
+                       for rule in load_symptom_rules(SYMPTOM_RULES_PATH)['bonuses']]
+
+def build_catalog(size, seed=17):
+    """Build a disease -> symptoms catalog of the given size from the dataset plus synthetic diseases"""
+    rng = random.Random(seed)
+    catalog = {disease: set(symptoms) for disease, symptoms in list(DISEASE_SYMPTOMS.items())[:size]}
+
+    # Synthetic diseases mix real symptoms with a larger synthetic symptom vocabulary
+    real_symptoms = sorted({symptom for symptoms in DISEASE_SYMPTOMS.values() for symptom in symptoms})
+    vocabulary = real_symptoms + [f'symptom_{i}' for i in range(SYMPTOM_VOCABULARY_SIZE - len(real_symptoms))]
+    while len(catalog) < size:
+        catalog[f'disease_{len(catalog)}'] = set(rng.sample(vocabulary, rng.randint(3, 17)))
+
+    return catalog
+
+def build_requests(catalog, count, seed=23):
+    """Build matched-symptom lists: a few symptoms of one disease plus some noise"""
+    rng = random.Random(seed)
+    diseases = list(catalog)
+    all_symptoms = sorted({symptom for symptoms in catalog.values() for symptom in symptoms})
+    requests = []
+
+    for _ in range(count):
+        symptoms = sorted(catalog[rng.choice(diseases)])
+        matched = rng.sample(symptoms, min(len(symptoms), rng.randint(1, 4)))
+        if rng.random() < 0.3:
+            matched.append(rng.choice(all_symptoms))
+        requests.append(matched)
+
+    return requests
+
+def best_disease_loop(matched_symptoms, disease_symptoms):
+    """Previous implementation: score each disease with a Python membership loop"""
+    disease_scores = {}
+
+    for disease, symptoms in disease_symptoms.items():
+        if not symptoms:
+            continue
+
+        matching_count = sum(1 for symptom in matched_symptoms if symptom in symptoms)
+        if matching_count == 0:
+            continue
+
+        match_percentage = matching_count / len(symptoms)
+        user_match_percentage = matching_count / len(matched_symptoms)
+
+        common_disease_bonus = 0
+        for bonus_disease, bonus_symptoms, bonus in DISEASE_BONUS_RULES:
+            if disease == bonus_disease and any(symptom in bonus_symptoms for symptom in matched_symptoms):
+                common_disease_bonus = bonus
+                break
+
+        disease_scores[disease] = (match_percentage * 0.3) + (user_match_percentage * 0.7) + common_disease_bonus
+
+    if disease_scores:
+        predicted_disease, score = max(disease_scores.items(), key=lambda x: x[1])
+        if score > 0.1:
+            return predicted_disease
+    return None
+
+def best_disease_matrix(matched_symptoms, incidence):
+    """Incidence-matrix scoring: one sparse product and an argmax"""
+    scores = score_diseases(matched_symptoms, incidence)
+    best = int(np.argmax(scores))
+    return incidence['diseases'][best] if scores[best] > 0.1 else None
+
+def time_requests(function, requests):
+    """Return the time per request (seconds) and the results"""
+    start = time.perf_counter()
+    results = [function(matched) for matched in requests]
+    return (time.perf_counter() - start) / len(requests), results
+
+def main():
+    """Run the benchmark for every catalog size"""
+    print("DISEASE SCORING BENCHMARK")
+    print("=" * 60)
+
+    sizes = [int(arg) for arg in sys.argv[1:]] or CATALOG_SIZES
+    all_identical = True
+
+    for size in sizes:
+        catalog = build_catalog(size)
+        requests = build_requests(catalog, max(20, min(1000, 2000000 // size)))
+
+        start = time.perf_counter()
+        incidence = build_disease_incidence(catalog)
+        build_time = time.perf_counter() - start
+
+        loop_time, expected = time_requests(lambda matched: best_disease_loop(matched, catalog), requests)
+        matrix_time, results = time_requests(lambda matched: best_disease_matrix(matched, incidence), requests)
+        identical = results == expected
+        all_identical = all_identical and identical
+
+        print(f"Catalog size: {size} diseases ({len(requests)} requests, matrix build {build_time * 1000:.1f} ms)")
+        print(f"  Per-disease loop:  {loop_time * 1000:9.3f} ms/request")
+        print(f"  Incidence matrix:  {matrix_time * 1000:9.3f} ms/request   {loop_time / matrix_time:6.1f}x")
+        print(f"  Identical predictions: {'YES' if identical else 'NO'}")
+        print()
+
+    return all_identical
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
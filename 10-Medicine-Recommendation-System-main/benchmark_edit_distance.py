@@ -0,0 +1,61 @@
+"""
+Micro-benchmark comparing the full-matrix calculate_similarity with the
+bit-parallel (Myers/Hyyro) implementation, with and without a threshold cutoff
+"""
+
+import sys
+import os
+import time
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from main import DATASET_SYMPTOMS, calculate_similarity, calculate_similarity_bitparallel
+from benchmark_fuzzy_matching import build_queries
+
+THRESHOLD = 0.7
+REPEATS = 3
+
+def time_pairs(similarity, pairs):
+    """Return the best time (seconds) over REPEATS runs and the scores of the last run"""
+    best = None
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        scores = [similarity(word, symptom) for word, symptom in pairs]
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, scores
+
+def main():
+    """Run the micro-benchmark on misspelled words against every dataset symptom"""
+    print("EDIT DISTANCE MICRO-BENCHMARK")
+    print("=" * 60)
+
+    queries = build_queries(50)
+    pairs = [(word, symptom) for word in queries for symptom in DATASET_SYMPTOMS]
+    print(f"{len(pairs)} word/symptom pairs, threshold {THRESHOLD}")
+    print()
+
+    matrix_time, matrix_scores = time_pairs(calculate_similarity, pairs)
+    parallel_time, parallel_scores = time_pairs(calculate_similarity_bitparallel, pairs)
+    cutoff_time, cutoff_scores = time_pairs(
+        lambda word, symptom: calculate_similarity_bitparallel(word, symptom, THRESHOLD), pairs)
+
+    identical_scores = matrix_scores == parallel_scores
+    identical_outcomes = ([score >= THRESHOLD for score in matrix_scores] ==
+                          [score >= THRESHOLD for score in cutoff_scores])
+
+    print(f"  Full matrix:              {matrix_time / len(pairs) * 1e6:7.2f} us/pair")
+    print(f"  Bit-parallel:             {parallel_time / len(pairs) * 1e6:7.2f} us/pair"
+          f"   {matrix_time / parallel_time:5.1f}x")
+    print(f"  Bit-parallel with cutoff: {cutoff_time / len(pairs) * 1e6:7.2f} us/pair"
+          f"   {matrix_time / cutoff_time:5.1f}x")
+    print()
+    print(f"  Identical scores: {'YES' if identical_scores else 'NO'}")
+    print(f"  Identical threshold outcomes with cutoff: {'YES' if identical_outcomes else 'NO'}")
+
+    return identical_scores and identical_outcomes
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
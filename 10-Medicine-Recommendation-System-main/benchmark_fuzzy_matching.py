@@ -0,0 +1,145 @@
+"""
+Benchmark script comparing the fuzzy symptom matching engines on vocabularies
+of increasing size (the shipped dataset padded with synthetic symptom names)
+"""
+
+import random
+import sys
+import os
+import time
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from main import (DATASET_SYMPTOMS, SYMSPELL_MAX_DISTANCE, NGRAM_SIZE, build_bk_tree, bk_tree_best_match,
+                  linear_best_match, bitparallel_best_match, build_symspell_index, get_correction_vocabulary,
+                  get_symspell_index_size, build_ngram_index, ngram_best_match,
+                  build_char_matrix, numpy_best_match)
+
+VOCABULARY_SIZES = [130, 10000, 100000]
+THRESHOLD = 0.7
+
+def build_vocabulary(size, seed=42):
+    """Build a symptom vocabulary of the given size from the dataset plus synthetic names"""
+    rng = random.Random(seed)
+    vocabulary = list(DATASET_SYMPTOMS)[:size]
+    seen = set(vocabulary)
+
+    # Synthetic symptoms are new combinations of the words used in real symptom names
+    words = sorted({part for symptom in DATASET_SYMPTOMS for part in symptom.replace(' ', '_').split('_') if part})
+    while len(vocabulary) < size:
+        term = '_'.join(rng.choice(words) for _ in range(rng.randint(1, 4)))
+        if term not in seen:
+            seen.add(term)
+            vocabulary.append(term)
+
+    return vocabulary
+
+def build_queries(count, seed=7):
+    """Build misspelled single-word queries like the ones typed or spoken by users"""
+    rng = random.Random(seed)
+    words = sorted({part for symptom in DATASET_SYMPTOMS for part in symptom.replace(' ', '_').split('_') if len(part) > 3})
+    queries = []
+
+    for _ in range(count):
+        word = list(rng.choice(words))
+        position = rng.randrange(len(word))
+        edit = rng.choice(['delete', 'insert', 'replace'])
+        if edit == 'delete':
+            del word[position]
+        elif edit == 'insert':
+            word.insert(position, rng.choice('abcdefghijklmnopqrstuvwxyz'))
+        else:
+            word[position] = rng.choice('abcdefghijklmnopqrstuvwxyz')
+        queries.append(''.join(word))
+
+    return queries
+
+def build_engines(vocabulary, stats):
+    """Build each exact engine for a vocabulary, returning name -> (build time, match function); the BK-tree
+    counts its distance computations in stats"""
+    order = {term: position for position, term in enumerate(vocabulary)}
+    engines = {'linear': (0.0, lambda word: linear_best_match(word, THRESHOLD, vocabulary)),
+               'bitparallel': (0.0, lambda word: bitparallel_best_match(word, THRESHOLD, vocabulary))}
+
+    start = time.perf_counter()
+    tree = build_bk_tree(vocabulary)
+    engines['bktree'] = (time.perf_counter() - start,
+                         lambda word: bk_tree_best_match(word, THRESHOLD, tree, order, stats))
+
+    start = time.perf_counter()
+    ngram_index = build_ngram_index(vocabulary, NGRAM_SIZE)
+    engines['ngram'] = (time.perf_counter() - start,
+                        lambda word: ngram_best_match(word, THRESHOLD, ngram_index, order))
+
+    start = time.perf_counter()
+    char_matrix = build_char_matrix(vocabulary)
+    engines['numpy'] = (time.perf_counter() - start,
+                        lambda word: numpy_best_match(word, THRESHOLD, char_matrix))
+
+    return engines
+
+def benchmark_vocabulary(size, queries):
+    """Time every exact engine against the linear scan for one vocabulary size"""
+    vocabulary = build_vocabulary(size)
+    stats = {}
+    engines = build_engines(vocabulary, stats)
+
+    print(f"Vocabulary size: {size} ({len(queries)} queries, threshold {THRESHOLD})")
+
+    expected = None
+    linear_time = None
+    all_identical = True
+
+    for name, (build_time, match) in engines.items():
+        start = time.perf_counter()
+        results = [match(query) for query in queries]
+        elapsed = time.perf_counter() - start
+
+        if expected is None:
+            expected, linear_time = results, elapsed
+        identical = results == expected
+        all_identical = all_identical and identical
+
+        print(f"  {name:<11} build {build_time:7.2f}s   {elapsed / len(queries) * 1000:9.3f} ms/query   "
+              f"{linear_time / elapsed:6.1f}x   identical: {'YES' if identical else 'NO'}")
+
+    compared = stats.get('comparisons', 0) / (len(queries) * size)
+    print(f"  BK-tree symptoms compared per query: {compared:.1%}")
+    print()
+    return all_identical
+
+def benchmark_symspell_build():
+    """Time building the deletion dictionary for the shipped dataset and report its size"""
+    vocabulary = get_correction_vocabulary()
+
+    start = time.perf_counter()
+    index = build_symspell_index(vocabulary, SYMSPELL_MAX_DISTANCE)
+    build_time = time.perf_counter() - start
+
+    print(f"SymSpell deletion dictionary ({len(vocabulary)} terms, max distance {SYMSPELL_MAX_DISTANCE})")
+    print(f"  Build time: {build_time * 1000:.1f} ms")
+    print(f"  Deletion variants: {len(index['keys'])}")
+    print(f"  Memory size: {get_symspell_index_size(index) / 1024:.0f} KiB")
+    print()
+
+def main():
+    """Run the benchmark for every vocabulary size"""
+    print("FUZZY SYMPTOM MATCHING BENCHMARK")
+    print("=" * 60)
+
+    benchmark_symspell_build()
+
+    sizes = [int(arg) for arg in sys.argv[1:]] or VOCABULARY_SIZES
+    all_identical = True
+
+    for size in sizes:
+        # Keep the total linear-scan work bounded for the large vocabularies
+        queries = build_queries(max(5, min(100, 200000 // size)))
+        all_identical = benchmark_vocabulary(size, queries) and all_identical
+
+    return all_identical
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,104 @@
+"""
+Benchmark script comparing the one-pass /predict matching cascade with the
+previous sequence of up to three find_matching_symptoms calls
+"""
+
+import sys
+import os
+import time
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from main import (find_matching_symptoms, find_matching_symptoms_cascade, clean_speech_input,
+                  configure_symptom_cache, get_symptom_cache_stats, EXACT_FUZZY_MATCH_ENGINES)
+
+# Inputs that match nothing run every step of the cascade (the worst case)
+UNMATCHED_INPUTS = [
+    'i feel terrible today',
+    'not good, i do not feel ok',
+    'help me doctor i am not well',
+    'i have been unwell for two days, worse at night',
+]
+
+# Inputs only matched by the comma-separated step at the lower threshold
+CHUNK_MATCHED_INPUTS = [
+    'my whole body feels strange, something is wrong, please help',
+    'xyzzy plugh, frobnicate, quux',
+]
+
+MATCHED_INPUTS = [
+    'itching, skin rash',
+    'fever, cough, headache',
+    'nausia and vomitting',
+    'head ache',
+]
+
+REPEATS = 30
+
+def find_matching_symptoms_three_calls(symptoms, engine=None):
+    """Previous /predict matching: whole input at 0.7, then each comma-separated symptom at 0.6, then whole input at 0.6"""
+    matched_symptoms = find_matching_symptoms(symptoms, threshold=0.7, engine=engine)
+
+    if not matched_symptoms:
+        user_symptoms = [s.strip() for s in symptoms.split(',')]
+        user_symptoms = [symptom.strip("[]' \"") for symptom in user_symptoms]
+        user_symptoms = [s for s in user_symptoms if s]
+
+        for symptom in user_symptoms:
+            matched_symptoms.extend(find_matching_symptoms(symptom, threshold=0.6, engine=engine))
+
+        seen = set()
+        matched_symptoms = [x for x in matched_symptoms if not (x in seen or seen.add(x))]
+
+    if not matched_symptoms:
+        single_symptom = symptoms.strip().lower()
+        if single_symptom and single_symptom != "symptoms":
+            matched_symptoms = find_matching_symptoms(single_symptom, threshold=0.6, engine=engine)
+
+    return matched_symptoms
+
+def time_inputs(function, inputs, engine):
+    """Return the best time per input (seconds) over REPEATS runs and the results"""
+    best = None
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        results = [function(text, engine=engine) for text in inputs]
+        elapsed = (time.perf_counter() - start) / len(inputs)
+        best = elapsed if best is None else min(best, elapsed)
+    return best, results
+
+def main():
+    """Run the benchmark for every exact fuzzy engine"""
+    print("MATCHING CASCADE BENCHMARK")
+    print("=" * 60)
+
+    # Measure the matching work itself, not the LRU cache
+    original_size = get_symptom_cache_stats()['capacity']
+    configure_symptom_cache(size=0)
+
+    all_identical = True
+
+    for label, inputs in [('Unmatched input (worst case)', UNMATCHED_INPUTS),
+                          ('Input matched by comma-separated symptoms', CHUNK_MATCHED_INPUTS),
+                          ('Matched input', MATCHED_INPUTS)]:
+        inputs = [clean_speech_input(text) for text in inputs]
+        print(label)
+        for engine in sorted(EXACT_FUZZY_MATCH_ENGINES):
+            three_calls_time, expected = time_inputs(find_matching_symptoms_three_calls, inputs, engine)
+            cascade_time, results = time_inputs(find_matching_symptoms_cascade, inputs, engine)
+            identical = results == expected
+            all_identical = all_identical and identical
+
+            print(f"  {engine:<11} three calls {three_calls_time * 1000:8.3f} ms   "
+                  f"one pass {cascade_time * 1000:8.3f} ms   {three_calls_time / cascade_time:5.1f}x   "
+                  f"identical: {'YES' if identical else 'NO'}")
+        print()
+
+    configure_symptom_cache(size=original_size)
+
+    return all_identical
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,147 @@
+"""
+Benchmark script comparing the previous model inference (predict, then
+predict_proba, on a list-wrapped vector) with a single evaluation on a
+pre-shaped float32 input, for the RandomForest and SVC artifacts: latency of
+a prediction, and of a prediction plus its top-k differential, checked against
+scikit-learn's own scores, and how often the SVC falls back to model.predict
+"""
+
+import copy
+import pickle
+import random
+import sys
+import os
+import time
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+from sklearn.ensemble import RandomForestClassifier
+
+import main
+from main import (BASE_DIR, DATASET_SYMPTOMS, DIFFERENTIAL_DEFAULT_RESULTS, get_model_prediction, get_predicted_value,
+                  rank_model_diseases, symptoms_to_vector, top_k_indices, training_data)
+
+REQUEST_COUNT = 1000
+FOREST_PATH = os.path.join(BASE_DIR, 'models/disease_prediction_model.pkl')
+# The previous differential took a linear SVC's pairwise values from its weights
+PREVIOUS_SVC_WEIGHTS = None
+if main.symptom_to_index is None and getattr(main.model, 'kernel', None) == 'linear':
+    PREVIOUS_SVC_WEIGHTS = (np.asarray(main.model.coef_), main.model.intercept_)
+
+def load_forest():
+    """Load the RandomForest artifact, or train one like train_model.py on Training.csv when it is missing"""
+    if os.path.exists(FOREST_PATH):
+        with open(FOREST_PATH, 'rb') as f:
+            model_data = pickle.load(f)
+        return model_data['model'], model_data['symptom_to_index'], 'models/disease_prediction_model.pkl'
+
+    features = training_data.drop(columns='prognosis')
+    forest = RandomForestClassifier(n_estimators=100, random_state=42)
+    forest.fit(features.to_numpy(), training_data['prognosis'].to_numpy())
+    return forest, {symptom: column for column, symptom in enumerate(features.columns)}, 'trained on Training.csv'
+
+def predict_previous(patient_symptoms):
+    """Previous get_predicted_value: predict and predict_proba on a list-wrapped float64 vector"""
+    input_vector = symptoms_to_vector(patient_symptoms)
+    if main.symptom_to_index is not None and isinstance(main.model, RandomForestClassifier):
+        prediction = main.model.predict([input_vector])[0]
+        probabilities = main.model.predict_proba([input_vector])[0]
+        if np.max(probabilities) < 0.1:
+            return None
+        return prediction
+    return main.diseases_list[main.model.predict([input_vector])[0]]
+
+def differential_previous(patient_symptoms):
+    """Previous prediction plus differential: get_predicted_value, then a separate ranking evaluation"""
+    disease = predict_previous(patient_symptoms)
+    input_vector = symptoms_to_vector(patient_symptoms)
+    if main.symptom_to_index is not None and isinstance(main.model, RandomForestClassifier):
+        scores = main.model.predict_proba([input_vector])[0]
+    else:
+        decision = PREVIOUS_SVC_WEIGHTS[0] @ input_vector + PREVIOUS_SVC_WEIGHTS[1]
+        scores = main.count_svc_votes(decision, len(main.model.classes_))
+    return disease, [main.MODEL_LABELS[i] for i in top_k_indices(scores, DIFFERENTIAL_DEFAULT_RESULTS).tolist()]
+
+def differential_reference(patient_symptoms):
+    """Top-k differential from scikit-learn's own predict_proba or decision_function"""
+    input_vector = symptoms_to_vector(patient_symptoms)
+    if main.symptom_to_index is not None and isinstance(main.model, RandomForestClassifier):
+        scores = main.model.predict_proba([input_vector])[0]
+    else:
+        ovo_model = copy.copy(main.model)
+        ovo_model.decision_function_shape = 'ovo'
+        scores = main.count_svc_votes(ovo_model.decision_function([input_vector])[0], len(main.model.classes_))
+    return [main.MODEL_LABELS[i] for i in top_k_indices(scores, DIFFERENTIAL_DEFAULT_RESULTS).tolist()]
+
+def differential_single(patient_symptoms):
+    """Prediction plus differential from one get_model_prediction evaluation"""
+    disease, ranked = get_model_prediction(patient_symptoms)
+    return disease, [entry['disease'] for entry in ranked]
+
+def time_requests(function, requests):
+    """Return the time per request (seconds) and the results"""
+    start = time.perf_counter()
+    results = [function(matched) for matched in requests]
+    return (time.perf_counter() - start) / len(requests), results
+
+def main_benchmark():
+    """Run the benchmark for both model artifacts"""
+    print("MODEL INFERENCE BENCHMARK")
+    print("=" * 60)
+
+    rng = random.Random(37)
+    vocabulary = sorted(DATASET_SYMPTOMS)
+    requests = [rng.sample(vocabulary, rng.randint(1, 6)) for _ in range(REQUEST_COUNT)]
+
+    forest, forest_index, forest_source = load_forest()
+    artifacts = [
+        ('SVC (models/svc.pkl)', main.model, None),
+        (f'RandomForest ({forest_source})', forest, forest_index),
+    ]
+
+    all_identical = True
+    saved = main.model, main.symptom_to_index, main.MODEL_LABELS
+    try:
+        for name, model, symptom_to_index in artifacts:
+            main.model, main.symptom_to_index = model, symptom_to_index
+            main.MODEL_LABELS = (list(model.classes_) if symptom_to_index is not None
+                                 else [main.diseases_list[label] for label in model.classes_])
+
+            previous_time, expected = time_requests(predict_previous, requests)
+            single_time, results = time_requests(get_predicted_value, requests)
+            both_previous_time, both_expected = time_requests(differential_previous, requests)
+            both_single_time, both_results = time_requests(differential_single, requests)
+            rank_time, _ = time_requests(rank_model_diseases, requests)
+
+            labels_identical = results == expected and [disease for disease, _ in both_results] == expected
+            reference = [differential_reference(matched) for matched in requests]
+            previous_rankings = sum(top != expected_top for (_, top), expected_top in zip(both_expected, reference))
+            single_rankings = sum(top != expected_top for (_, top), expected_top in zip(both_results, reference))
+            all_identical = all_identical and labels_identical and not single_rankings
+
+            print(f"{name}: {len(requests)} requests")
+            print(f"  Prediction, previous:         {previous_time * 1000:8.3f} ms/request")
+            print(f"  Prediction, single pass:      {single_time * 1000:8.3f} ms/request   "
+                  f"{previous_time / single_time:5.1f}x")
+            print(f"  With differential, previous:  {both_previous_time * 1000:8.3f} ms/request")
+            print(f"  With differential, single:    {both_single_time * 1000:8.3f} ms/request   "
+                  f"{both_previous_time / both_single_time:5.1f}x")
+            print(f"  rank_model_diseases:          {rank_time * 1000:8.3f} ms/request")
+            print(f"  Identical labels: {'YES' if labels_identical else 'NO'}; "
+                  f"top-{DIFFERENTIAL_DEFAULT_RESULTS} differing from scikit-learn's scores: "
+                  f"previous {previous_rankings}, single pass {single_rankings}")
+            if symptom_to_index is None:
+                # A tied top vote is settled by model.predict
+                fallbacks = sum(main.get_model_scores(matched)[0] is None for matched in requests)
+                print(f"  model.predict fallbacks (tied top vote): {fallbacks / len(requests):.1%}")
+            print()
+    finally:
+        main.model, main.symptom_to_index, main.MODEL_LABELS = saved
+
+    return all_identical
+
+if __name__ == "__main__":
+    success = main_benchmark()
+    sys.exit(0 if success else 1)
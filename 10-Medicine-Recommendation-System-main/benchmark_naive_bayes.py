@@ -0,0 +1,80 @@
+"""
+Benchmark script comparing the latency of the precomputed Bernoulli Naive
+Bayes engine with scikit-learn's BernoulliNB and the trained SVC, per request
+and in batches, and how often Naive Bayes agrees with the SVC
+"""
+
+import random
+import sys
+import os
+import time
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+from sklearn.naive_bayes import BernoulliNB
+
+from main import (DATASET_SYMPTOMS, DISEASE_INCIDENCE, NAIVE_BAYES_ALPHA, get_predicted_value,
+                  predict_diseases_batch, score_diseases_naive_bayes, training_data)
+
+REQUEST_COUNT = 2000
+BATCH_SIZE = 100000
+
+def build_requests(count, seed=29):
+    """Build random lists of 1-6 distinct dataset symptoms"""
+    rng = random.Random(seed)
+    vocabulary = sorted(DATASET_SYMPTOMS)
+    return [rng.sample(vocabulary, rng.randint(1, 6)) for _ in range(count)]
+
+def time_requests(function, requests):
+    """Return the time per request (seconds) and the results"""
+    start = time.perf_counter()
+    results = [function(matched) for matched in requests]
+    return (time.perf_counter() - start) / len(requests), results
+
+def main():
+    """Run the benchmark"""
+    print("NAIVE BAYES SCORING BENCHMARK")
+    print("=" * 60)
+
+    requests = build_requests(REQUEST_COUNT)
+    features = training_data.drop(columns='prognosis')
+    columns = {symptom: column for column, symptom in enumerate(features.columns)}
+    reference = BernoulliNB(alpha=NAIVE_BAYES_ALPHA).fit(features.to_numpy(), training_data['prognosis'])
+
+    # BernoulliNB sorts its classes; the engine follows the incidence rows
+    order = [list(reference.classes_).index(disease) for disease in DISEASE_INCIDENCE['diseases']]
+
+    def sklearn_posteriors(matched):
+        present = np.zeros((1, len(columns)))
+        present[0, [columns[symptom] for symptom in matched]] = 1
+        return reference.predict_proba(present)[0][order]
+
+    sklearn_time, expected = time_requests(sklearn_posteriors, requests)
+    engine_time, results = time_requests(score_diseases_naive_bayes, requests)
+    svc_time, svc_results = time_requests(get_predicted_value, requests)
+    identical = all(np.allclose(result, posteriors) for result, posteriors in zip(results, expected))
+    predictions = [DISEASE_INCIDENCE['diseases'][int(np.argmax(result))] for result in results]
+
+    print(f"{len(requests)} requests of 1-6 symptoms, {len(columns)} Training.csv symptoms, "
+          f"{len(DISEASE_INCIDENCE['diseases'])} diseases")
+    print(f"  sklearn BernoulliNB:     {sklearn_time * 1000:8.3f} ms/request")
+    print(f"  Naive Bayes engine:      {engine_time * 1000:8.3f} ms/request   {sklearn_time / engine_time:6.1f}x")
+    print(f"  SVC get_predicted_value: {svc_time * 1000:8.3f} ms/request")
+    print(f"  Identical posteriors to BernoulliNB: {'YES' if identical else 'NO'}; "
+          f"agrees with the SVC on {sum(a == b for a, b in zip(predictions, svc_results)) / len(requests):.1%}")
+    print()
+
+    batch = build_requests(BATCH_SIZE, seed=31)
+    start = time.perf_counter()
+    batch_predictions = list(predict_diseases_batch(batch, 'naive_bayes'))
+    batch_time = time.perf_counter() - start
+    print(f"Batch of {len(batch)} lists: {batch_time:.2f} s ({batch_time / len(batch) * 1e6:.1f} us/list, "
+          f"{sum(disease is not None for disease, _ in batch_predictions)} predicted)")
+
+    return identical
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
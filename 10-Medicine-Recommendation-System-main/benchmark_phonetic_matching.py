@@ -0,0 +1,146 @@
+"""
+Benchmark script for the phonetic symptom index: hit rate and matching latency
+on noisy speech transcripts, with and without the phonetic lookup in front of
+fuzzy matching, and false matches on filler and everyday words
+"""
+
+import random
+import sys
+import os
+import time
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import main
+from main import (find_phonetic_match, find_best_fuzzy_match, get_phonetic_vocabulary, normalize_input,
+                  configure_symptom_cache, get_symptom_cache_stats)
+
+TRANSCRIPT_COUNT = 500
+REPEATS = 5
+FILLER_WORDS = ['i', 'have', 'a', 'and', 'my', 'is', 'really', 'bad', 'since', 'yesterday', 'also', 'some',
+                'doctor', 'please', 'help', 'feel', 'very', 'could', 'night', 'today', 'been', 'having']
+# Everyday words outside the transcripts above, several sharing a phonetic key with a symptom
+EVERYDAY_WORDS = ['knees', 'noise', 'nice', 'coffee', 'cuff', 'cove', 'cave', 'drank', 'loud', 'water',
+                  'walking', 'morning', 'evening', 'office', 'phone', 'house', 'travel',
+                  'weekend', 'garden', 'kitchen', 'bottle', 'coat', 'cake', 'rain', 'voice', 'music',
+                  'money', 'sister', 'brother', 'mother', 'father', 'window', 'ticket', 'village', 'lunch']
+
+# Spelling changes a speech recognizer makes for words that sound the same
+SOUND_ALIKE_RULES = [
+    ('ph', 'f'), ('f', 'ph'), ('ck', 'k'), ('c', 'k'), ('k', 'c'), ('ee', 'ea'), ('ea', 'ee'),
+    ('y', 'ie'), ('ie', 'y'), ('ss', 's'), ('s', 'ss'), ('tt', 't'), ('t', 'tt'), ('z', 's'),
+    ('gue', 'g'), ('ache', 'ake'), ('ough', 'off'), ('ia', 'ya'), ('oe', 'e'), ('er', 'ur'),
+]
+
+def make_sound_alike(word, rng):
+    """Apply one or two sound-alike spelling changes to word"""
+    for _ in range(rng.choice([1, 2])):
+        rules = [(old, new) for old, new in SOUND_ALIKE_RULES if old in word[1:]]
+        if not rules:
+            break
+        old, new = rng.choice(rules)
+        positions = [i for i in range(1, len(word)) if word.startswith(old, i)]
+        i = rng.choice(positions)
+        word = word[:i] + new + word[i + len(old):]
+    return word
+
+def build_corpus(count, seed=5):
+    """Build noisy transcripts as (text, expected symptoms) pairs"""
+    rng = random.Random(seed)
+    vocabulary = sorted(get_phonetic_vocabulary().items())
+    corpus = []
+
+    for _ in range(count):
+        words = [rng.choice(FILLER_WORDS) for _ in range(rng.randint(3, 8))]
+        expected = []
+        for _ in range(rng.randint(1, 3)):
+            spelling, symptom = rng.choice(vocabulary)
+            words.insert(rng.randint(0, len(words)), make_sound_alike(spelling, rng))
+            if symptom not in expected:
+                expected.append(symptom)
+        corpus.append((' '.join(words), expected))
+
+    return corpus
+
+def measure_token_hit_rate(corpus):
+    """Share of noisy symptom tokens resolved correctly, and filler tokens matched wrongly, per method"""
+    vocabulary = get_phonetic_vocabulary()
+    methods = {
+        'Fuzzy only': lambda word: find_best_fuzzy_match(word, 0.7),
+        'Phonetic only': lambda word: find_phonetic_match(word, 0.7),
+        'Phonetic then fuzzy': lambda word: find_phonetic_match(word, 0.7) or find_best_fuzzy_match(word, 0.7),
+    }
+    everyday = [word for word in EVERYDAY_WORDS if word not in vocabulary]
+    results = {}
+
+    for name, method in methods.items():
+        hits = symptom_tokens = false_matches = filler_tokens = 0
+        for text, expected in corpus:
+            for word in text.split():
+                if word in FILLER_WORDS:
+                    filler_tokens += 1
+                    false_matches += method(word) is not None
+                else:
+                    symptom_tokens += 1
+                    hits += method(word) in expected
+        everyday_matches = sum(method(word) is not None for word in everyday)
+        results[name] = (hits / symptom_tokens, false_matches / filler_tokens, everyday_matches / len(everyday))
+
+    return results
+
+def time_corpus(corpus):
+    """Return the best time per transcript (seconds) for matching the whole corpus"""
+    best = None
+    texts = [normalize_input(text) for text, _ in corpus]
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        for text in texts:
+            main.match_normalized_symptoms(text, 0.7)
+        elapsed = (time.perf_counter() - start) / len(texts)
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+def main_benchmark():
+    """Run the benchmark"""
+    print("PHONETIC MATCHING BENCHMARK")
+    print("=" * 60)
+
+    corpus = build_corpus(TRANSCRIPT_COUNT)
+    print(f"{len(corpus)} noisy transcripts, {len(main.SYMPTOM_PHONETIC_INDEX)} phonetic keys, "
+          f"fuzzy engine '{main.FUZZY_MATCH_ENGINE}'")
+    print()
+
+    print(f"{'Method':<24}{'Hit rate':>12}{'False matches':>16}{'Everyday words':>16}")
+    hit_rates = measure_token_hit_rate(corpus)
+    for name, (hit_rate, false_rate, everyday_rate) in hit_rates.items():
+        print(f"{name:<24}{hit_rate:>12.1%}{false_rate:>16.1%}{everyday_rate:>16.1%}")
+    print()
+
+    # Time the matching itself, not the LRU cache
+    original_size = get_symptom_cache_stats()['capacity']
+    configure_symptom_cache(size=0)
+
+    phonetic_index = main.SYMPTOM_PHONETIC_INDEX
+    main.SYMPTOM_PHONETIC_INDEX = {}
+    try:
+        fuzzy_time = time_corpus(corpus)
+    finally:
+        main.SYMPTOM_PHONETIC_INDEX = phonetic_index
+    phonetic_time = time_corpus(corpus)
+
+    configure_symptom_cache(size=original_size)
+
+    print("Latency per transcript")
+    print(f"  Fuzzy matching only:        {fuzzy_time * 1000:8.3f} ms")
+    print(f"  Phonetic lookup then fuzzy: {phonetic_time * 1000:8.3f} ms")
+    print(f"  Speedup:                    {fuzzy_time / phonetic_time:8.1f}x")
+    print()
+
+    # The phonetic lookup must not match anything the fuzzy matcher alone would reject
+    return (hit_rates['Phonetic then fuzzy'][0] >= hit_rates['Fuzzy only'][0]
+            and hit_rates['Phonetic then fuzzy'][1:] <= hit_rates['Fuzzy only'][1:])
+
+if __name__ == "__main__":
+    success = main_benchmark()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,95 @@
+"""
+Benchmark script comparing rescoring every symptom list from scratch with
+incremental scoring sessions, for symptoms dictated one at a time (each
+added symptom is followed by a prediction), as the catalog and the number
+of symptoms per session grow
+"""
+
+import sys
+import os
+import time
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import main
+from main import (build_disease_incidence, build_disease_postings, create_scoring_session, delete_scoring_session,
+                  score_candidate_diseases, update_scoring_session)
+from benchmark_disease_scoring import build_catalog, build_requests
+from benchmark_disease_candidates import best_row, build_symptom_to_diseases
+
+CATALOG_SIZES = [41, 1000, 10000, 100000]
+SESSION_LENGTHS = [5, 20, 50]
+
+def build_dictations(catalog, count, length):
+    """Build distinct symptom lists of the given length from consecutive generated requests"""
+    requests = iter(build_requests(catalog, count * length))
+    dictations = []
+    for _ in range(count):
+        symptoms = {}
+        while len(symptoms) < length:
+            symptoms.update(dict.fromkeys(next(requests)))
+        dictations.append(list(symptoms)[:length])
+    return dictations
+
+def rescore_dictation(symptoms, incidence, postings):
+    """Score the whole symptom list again after every added symptom"""
+    return [best_row(*score_candidate_diseases(symptoms[:count], incidence, postings))
+            for count in range(1, len(symptoms) + 1)]
+
+def session_dictation(symptoms, incidence):
+    """Add each symptom to a scoring session, which updates its running match counts"""
+    session_id = create_scoring_session()
+    results = []
+    for symptom in symptoms:
+        disease = update_scoring_session(session_id, add=[symptom])['disease']
+        results.append(incidence['disease_rows'][disease] if disease else None)
+    delete_scoring_session(session_id)
+    return results
+
+def main_benchmark():
+    """Run the benchmark for every catalog size"""
+    print("INCREMENTAL SCORING SESSION BENCHMARK")
+    print("=" * 60)
+
+    sizes = [int(arg) for arg in sys.argv[1:]] or CATALOG_SIZES
+    all_identical = True
+    saved = main.DISEASE_INCIDENCE, main.DISEASE_POSTINGS, main.SYMPTOM_RULES
+
+    try:
+        # Special-case rules would decide some lists before any scoring
+        main.SYMPTOM_RULES = main.compile_symptom_rules({'single_symptom': {}, 'clusters': [], 'bonuses': []})
+        for size in sizes:
+            catalog = build_catalog(size)
+            incidence = build_disease_incidence(catalog)
+            postings = build_disease_postings(build_symptom_to_diseases(catalog), incidence)
+            main.DISEASE_INCIDENCE, main.DISEASE_POSTINGS = incidence, postings
+            print(f"Catalog size: {size} diseases")
+
+            for length in SESSION_LENGTHS:
+                dictations = build_dictations(catalog, max(5, min(200, 100000 // size)), length)
+                updates = len(dictations) * length
+
+                start = time.perf_counter()
+                expected = [rescore_dictation(symptoms, incidence, postings) for symptoms in dictations]
+                rescore_time = time.perf_counter() - start
+
+                start = time.perf_counter()
+                results = [session_dictation(symptoms, incidence) for symptoms in dictations]
+                session_time = time.perf_counter() - start
+
+                identical = results == expected
+                all_identical = all_identical and identical
+                print(f"  {length:3d} symptoms/session ({len(dictations):3d} sessions)   "
+                      f"rescoring {rescore_time / updates * 1000:7.3f} ms/update   "
+                      f"session {session_time / updates * 1000:7.3f} ms/update   "
+                      f"{rescore_time / session_time:5.1f}x   identical: {'YES' if identical else 'NO'}")
+            print()
+    finally:
+        main.DISEASE_INCIDENCE, main.DISEASE_POSTINGS, main.SYMPTOM_RULES = saved
+
+    return all_identical
+
+if __name__ == "__main__":
+    success = main_benchmark()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,69 @@
+"""
+Benchmark script comparing the unweighted incidence-matrix scorer with the
+severity-weighted scorer, on disease catalogs of increasing size, and how
+often severity weighting changes the predicted disease
+"""
+
+import random
+import sys
+import os
+import time
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+
+from main import (SYMPTOM_SEVERITY, build_disease_incidence, build_disease_severity, score_diseases,
+                  score_diseases_severity)
+from benchmark_disease_scoring import build_catalog, build_requests
+
+CATALOG_SIZES = [41, 1000, 10000, 100000]
+
+def build_severity(catalog, seed=19):
+    """Dataset severity weights plus a random 1-7 weight for each synthetic symptom"""
+    rng = random.Random(seed)
+    severity = dict(SYMPTOM_SEVERITY)
+    for symptom in sorted({symptom for symptoms in catalog.values() for symptom in symptoms}):
+        if symptom not in severity:
+            severity[symptom] = rng.randint(1, 7)
+    return severity
+
+def main():
+    """Run the benchmark for every catalog size"""
+    print("SEVERITY-WEIGHTED SCORING BENCHMARK")
+    print("=" * 60)
+
+    sizes = [int(arg) for arg in sys.argv[1:]] or CATALOG_SIZES
+
+    for size in sizes:
+        catalog = build_catalog(size)
+        requests = build_requests(catalog, max(20, min(1000, 2000000 // size)))
+
+        start = time.perf_counter()
+        incidence = build_disease_incidence(catalog)
+        incidence_time = time.perf_counter() - start
+        start = time.perf_counter()
+        severity = build_disease_severity(incidence, build_severity(catalog))
+        severity_time = time.perf_counter() - start
+
+        print(f"Catalog size: {size} diseases ({len(requests)} requests, incidence build {incidence_time * 1000:.1f} ms, "
+              f"severity build {severity_time * 1000:.1f} ms)")
+
+        predictions = {}
+        for name, score in [('Unweighted', lambda matched: score_diseases(matched, incidence)),
+                            ('Severity-weighted', lambda matched: score_diseases_severity(matched, incidence, severity))]:
+            start = time.perf_counter()
+            predictions[name] = [int(np.argmax(score(matched))) for matched in requests]
+            elapsed = time.perf_counter() - start
+            print(f"  {name:<18} {len(requests) / elapsed:10.0f} requests/s   {elapsed / len(requests) * 1000:8.3f} ms/request")
+
+        changed = sum(a != b for a, b in zip(predictions['Unweighted'], predictions['Severity-weighted']))
+        print(f"  Severity weighting changed the top disease for {changed / len(requests):.1%} of requests")
+        print()
+
+    return True
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,90 @@
+"""
+Benchmark script comparing clean_speech_input (one compiled correction regex)
+with the previous approach of one re.sub per correction, on transcripts of
+10 to 10,000 words
+"""
+
+import random
+import re
+import sys
+import os
+import time
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from main import SPEECH_FUZZY_CORRECTIONS, clean_speech_input
+
+TRANSCRIPT_LENGTHS = [10, 100, 1000, 10000]
+FILLER_WORDS = ['i', 'have', 'a', 'and', 'my', 'is', 'really', 'bad', 'since', 'yesterday', 'also', 'some']
+SYMPTOM_WORDS = ['fever', 'cough', 'headache', 'chills', 'vomiting', 'nausea', 'fatigue', 'runny nose']
+
+def clean_speech_input_per_pattern(text):
+    """Previous implementation: build and apply one regex per correction"""
+    if not text:
+        return ""
+
+    text = text.lower()
+    text = re.sub(r'[^\w\s,]', '', text)
+    text = re.sub(r'\s+', ' ', text).strip()
+
+    for mispronounced, correct in SPEECH_FUZZY_CORRECTIONS.items():
+        text = re.sub(r'\b' + re.escape(mispronounced) + r'\b', correct, text)
+
+    return text
+
+def build_transcript(word_count, seed=11):
+    """Build a noisy speech transcript mixing fillers, symptoms and mispronunciations"""
+    rng = random.Random(seed)
+    vocabulary = FILLER_WORDS + SYMPTOM_WORDS + list(SPEECH_FUZZY_CORRECTIONS)
+    words = []
+
+    while len(words) < word_count:
+        word = rng.choice(vocabulary)
+        if rng.random() < 0.1:
+            word = word.capitalize() + rng.choice([',', '.', '!', '?'])
+        words.extend(word.split())
+
+    return ' '.join(words[:word_count])
+
+def time_function(function, text, repeats):
+    """Return the best time (seconds) over repeats runs"""
+    best = None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        function(text)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+def main():
+    """Run the benchmark for every transcript length"""
+    print("SPEECH INPUT CLEANING BENCHMARK")
+    print("=" * 60)
+    print(f"{len(SPEECH_FUZZY_CORRECTIONS)} corrections")
+    print()
+
+    all_identical = True
+
+    for word_count in TRANSCRIPT_LENGTHS:
+        transcript = build_transcript(word_count)
+        repeats = max(5, 20000 // word_count)
+
+        identical = clean_speech_input(transcript) == clean_speech_input_per_pattern(transcript)
+        all_identical = all_identical and identical
+
+        per_pattern_time = time_function(clean_speech_input_per_pattern, transcript, repeats)
+        compiled_time = time_function(clean_speech_input, transcript, repeats)
+
+        print(f"Transcript length: {word_count} words")
+        print(f"  One re.sub per correction: {per_pattern_time * 1000:9.3f} ms")
+        print(f"  Single compiled regex:     {compiled_time * 1000:9.3f} ms")
+        print(f"  Speedup:                   {per_pattern_time / compiled_time:9.1f}x")
+        print(f"  Identical output: {'YES' if identical else 'NO'}")
+        print()
+
+    return all_identical
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
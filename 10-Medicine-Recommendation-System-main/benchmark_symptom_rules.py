@@ -0,0 +1,74 @@
+"""
+Benchmark script comparing the hard-coded special-case rules previously at the
+top of predict_disease_from_symptoms with the compiled rule table
+"""
+
+import random
+import sys
+import os
+import time
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from main import DATASET_SYMPTOMS, apply_symptom_rules
+
+REQUEST_COUNT = 200000
+RULE_SYMPTOMS = ['fever', 'high_fever', 'cold', 'chills', 'cough', 'headache', 'fatigue']
+
+def apply_rules_legacy(matched_symptoms):
+    """Previous implementation: the if chains and sets rebuilt on every call (None when no rule applies)"""
+    fever_symptoms = {'fever', 'high_fever'}
+    cold_symptoms = {'cold', 'chills'}
+    cough_symptoms = {'cough'}
+    headache_symptoms = {'headache'}
+
+    if len(matched_symptoms) == 1:
+        symptom = matched_symptoms[0]
+        if symptom in fever_symptoms:
+            return 'Viral Infection'
+        elif symptom in cold_symptoms:
+            return 'Common Cold'
+        elif symptom in cough_symptoms:
+            return 'Viral Respiratory Infection'
+        elif symptom in headache_symptoms:
+            return 'Sinusitis'
+
+    fever_present = any(symptom in fever_symptoms for symptom in matched_symptoms)
+    cold_present = any(symptom in cold_symptoms for symptom in matched_symptoms)
+    cough_present = any(symptom in cough_symptoms for symptom in matched_symptoms)
+    headache_present = any(symptom in headache_symptoms for symptom in matched_symptoms)
+
+    if sum([fever_present, cold_present, cough_present, headache_present]) >= 2:
+        return 'Viral Infection'
+    return None
+
+def build_requests(count, seed=13):
+    """Build matched-symptom lists mixing rule symptoms with dataset symptoms"""
+    rng = random.Random(seed)
+    vocabulary = sorted(DATASET_SYMPTOMS) + RULE_SYMPTOMS * 10
+    return [rng.sample(vocabulary, rng.randint(1, 5)) for _ in range(count)]
+
+def main():
+    """Run the benchmark"""
+    print("SYMPTOM RULE TABLE BENCHMARK")
+    print("=" * 60)
+
+    requests = build_requests(REQUEST_COUNT)
+    results = {}
+    for name, apply_rules in [('Hard-coded if chains', apply_rules_legacy), ('Compiled rule table', apply_symptom_rules)]:
+        start = time.perf_counter()
+        results[name] = [apply_rules(matched) for matched in requests]
+        elapsed = time.perf_counter() - start
+        print(f"  {name:<21} {elapsed / len(requests) * 1e6:7.3f} us/request")
+
+    identical = results['Hard-coded if chains'] == results['Compiled rule table']
+    fired = sum(result is not None for result in results['Compiled rule table'])
+    print(f"  {len(requests)} requests, {fired} matched a rule, identical: {'YES' if identical else 'NO'}")
+    print()
+
+    return identical
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
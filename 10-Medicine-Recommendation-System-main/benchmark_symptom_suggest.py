@@ -0,0 +1,63 @@
+"""
+Benchmark script for symptom autocomplete: latency per keystroke of
+suggest_symptoms and of the /api/symptoms/suggest endpoint
+"""
+
+import sys
+import os
+import time
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from main import app, suggest_symptoms, get_suggestion_entries
+
+P99_BUDGET = 0.001  # seconds per keystroke
+
+def build_keystrokes():
+    """Every prefix a user types on the way to each symptom name or alias"""
+    return [text[:i] for text in sorted(get_suggestion_entries()) for i in range(1, len(text) + 1)]
+
+def percentile(times, fraction):
+    """Return the given percentile of a list of times"""
+    times = sorted(times)
+    return times[min(len(times) - 1, int(len(times) * fraction))]
+
+def time_keystrokes(function, keystrokes):
+    """Return the time of each call (seconds)"""
+    times = []
+    for query in keystrokes:
+        start = time.perf_counter()
+        function(query)
+        times.append(time.perf_counter() - start)
+    return times
+
+def main():
+    """Run the benchmark"""
+    print("SYMPTOM AUTOCOMPLETE BENCHMARK")
+    print("=" * 60)
+
+    keystrokes = build_keystrokes()
+    print(f"{len(keystrokes)} keystrokes")
+    print()
+
+    client = app.test_client()
+    within_budget = True
+
+    for label, function in [('suggest_symptoms', lambda query: suggest_symptoms(query)),
+                            ('GET /api/symptoms/suggest', lambda query: client.get('/api/symptoms/suggest',
+                                                                                  query_string={'q': query}))]:
+        times = time_keystrokes(function, keystrokes)
+        p50, p99 = percentile(times, 0.5), percentile(times, 0.99)
+        print(f"{label}")
+        print(f"  p50: {p50 * 1000:7.3f} ms   p99: {p99 * 1000:7.3f} ms   max: {max(times) * 1000:7.3f} ms")
+        if label == 'suggest_symptoms':
+            within_budget = p99 < P99_BUDGET
+    print()
+    print(f"p99 lookup under {P99_BUDGET * 1000:.0f} ms: {'YES' if within_budget else 'NO'}")
+
+    return within_budget
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
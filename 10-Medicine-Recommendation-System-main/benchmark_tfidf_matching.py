@@ -0,0 +1,67 @@
+"""
+Benchmark script comparing the sparse TF-IDF character n-gram engine with the
+Levenshtein path (linear scan) for accuracy and latency on vocabularies of
+increasing size
+"""
+
+import sys
+import os
+import time
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from main import NGRAM_SIZE, linear_best_match, build_tfidf_index, tfidf_best_match
+from benchmark_fuzzy_matching import build_vocabulary, build_queries
+
+VOCABULARY_SIZES = [130, 10000, 100000]
+THRESHOLDS = [0.6, 0.7]
+
+def time_queries(match, queries):
+    """Return the time per query (seconds) and the results"""
+    start = time.perf_counter()
+    results = [match(query) for query in queries]
+    return (time.perf_counter() - start) / len(queries), results
+
+def benchmark_vocabulary(size, queries):
+    """Compare the TF-IDF engine with the linear Levenshtein scan for one vocabulary size"""
+    vocabulary = build_vocabulary(size)
+    order = {term: position for position, term in enumerate(vocabulary)}
+
+    start = time.perf_counter()
+    index = build_tfidf_index(vocabulary, NGRAM_SIZE)
+    build_time = time.perf_counter() - start
+
+    print(f"Vocabulary size: {size} ({len(queries)} queries, {index['matrix'].shape[1]} n-grams, "
+          f"{index['matrix'].nnz} non-zeros, build {build_time:.2f}s)")
+
+    accuracy = {}
+    for threshold in THRESHOLDS:
+        linear_time, expected = time_queries(lambda word: linear_best_match(word, threshold, vocabulary), queries)
+        tfidf_time, results = time_queries(lambda word: tfidf_best_match(word, threshold, index, order), queries)
+        accuracy[threshold] = sum(result == match for result, match in zip(results, expected)) / len(queries)
+
+        print(f"  threshold {threshold}: Levenshtein {linear_time * 1000:9.3f} ms/query   "
+              f"TF-IDF {tfidf_time * 1000:7.3f} ms/query   {linear_time / tfidf_time:7.1f}x   "
+              f"same match: {accuracy[threshold]:6.1%}")
+
+    print()
+    return accuracy
+
+def main():
+    """Run the benchmark for every vocabulary size"""
+    print("TF-IDF FUZZY MATCHING BENCHMARK")
+    print("=" * 60)
+
+    sizes = [int(arg) for arg in sys.argv[1:]] or VOCABULARY_SIZES
+
+    for size in sizes:
+        # Keep the total linear-scan work bounded for the large vocabularies
+        queries = build_queries(max(5, min(100, 200000 // size)))
+        benchmark_vocabulary(size, queries)
+
+    return True
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,46 @@
+"""
+Build the prebuilt symptom index (models/symptom_index.bin) that main.py
+memory-maps at startup instead of parsing the dataset CSV files
+
+Run after changing any file in dataset/ used by the symptom index, or the
+settings and functions it is built with (a stale index is ignored at startup):
+    python build_symptom_index.py [output path]
+"""
+
+import sys
+import os
+import time
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from main import (DATASET_SYMPTOMS, DISEASE_SYMPTOMS, SYMPTOM_INDEX_PATH, SYMPTOM_INDEX_VERSION,
+                  initialize_dataset_mappings, save_symptom_index, load_symptom_index)
+
+def main():
+    """Build the symptom structures from the CSV files and write the index"""
+    path = sys.argv[1] if len(sys.argv) > 1 else SYMPTOM_INDEX_PATH
+
+    print("BUILDING SYMPTOM INDEX")
+    print("=" * 60)
+
+    # Always start from the CSV files, not from a previous index
+    start = time.perf_counter()
+    initialize_dataset_mappings()
+    build_time = time.perf_counter() - start
+
+    save_symptom_index(path)
+
+    start = time.perf_counter()
+    loaded = load_symptom_index(path)
+    load_time = time.perf_counter() - start
+
+    print(f"Symptoms: {len(DATASET_SYMPTOMS)}, diseases: {len(DISEASE_SYMPTOMS)}")
+    print(f"Index version {SYMPTOM_INDEX_VERSION} written to {path} ({os.path.getsize(path) / 1024:.0f} KiB)")
+    print(f"Build from CSV: {build_time * 1000:.1f} ms, load from index: {load_time * 1000:.1f} ms")
+
+    return loaded
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,122 @@
+"""
+Report on the share of /predict requests that reach fuzzy matching, before
+and after the canonical symptom index (spacing, underscore and punctuation
+variants of every dataset symptom resolved by exact lookup)
+"""
+
+import sys
+import os
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import main
+from main import (DISEASE_SYMPTOMS, COMMON_SYMPTOM_MAPPINGS, build_phrase_automaton, normalize_input,
+                  clean_speech_input, canonical_symptom_key, configure_symptom_cache, get_symptom_cache_stats)
+
+def spell_symptom(symptom, style):
+    """Write a dataset symptom the way a user might type it"""
+    words = canonical_symptom_key(symptom).split()
+    if style == 'spaced':
+        return ' '.join(words)
+    if style == 'underscored':
+        return '_'.join(words)
+    if style == 'hyphenated':
+        return '-'.join(words)
+    if style == 'capitalized':
+        return ' '.join(words).capitalize()
+    return ''.join(words)
+
+def build_requests():
+    """Build requests from every disease's symptom list in each writing style, one symptom and all symptoms"""
+    requests = []
+    for style in ['spaced', 'underscored', 'hyphenated', 'capitalized', 'joined']:
+        for disease in sorted(DISEASE_SYMPTOMS):
+            symptoms = sorted(DISEASE_SYMPTOMS[disease])
+            requests.append(spell_symptom(symptoms[0], style))
+            requests.append(', '.join(spell_symptom(symptom, style) for symptom in symptoms))
+    
+    # Free-text sentences keep filler words that still need fuzzy matching
+    for disease in sorted(DISEASE_SYMPTOMS):
+        symptoms = sorted(DISEASE_SYMPTOMS[disease])[:2]
+        requests.append('i have ' + ' and '.join(spell_symptom(symptom, 'spaced') for symptom in symptoms))
+    return requests
+
+def legacy_symptom_phrases():
+    """Phrases recognised before the canonical index: aliases plus dataset symptoms split on spaces"""
+    phrases = {}
+    for alias, symptom in COMMON_SYMPTOM_MAPPINGS.items():
+        tokens = tuple(normalize_input(alias).split())
+        if len(tokens) > 1 and symptom in main.DATASET_SYMPTOMS:
+            phrases[tokens] = symptom
+    for symptom in main.DATASET_SYMPTOMS:
+        tokens = tuple(symptom.split())
+        if len(tokens) > 1:
+            phrases[tokens] = symptom
+    return phrases
+
+def measure_fuzzy_share(requests):
+    """Return the number of requests that called the fuzzy matcher and the total fuzzy lookups"""
+    lookups = []
+    original = main.find_best_fuzzy_match
+
+    def counting_match(word, threshold, engine=None):
+        lookups.append(word)
+        return original(word, threshold, engine)
+
+    reached = 0
+    main.find_best_fuzzy_match = counting_match
+    try:
+        for text in requests:
+            before = len(lookups)
+            main.find_matching_symptoms_cascade(clean_speech_input(text))
+            if len(lookups) > before:
+                reached += 1
+    finally:
+        main.find_best_fuzzy_match = original
+
+    return reached, len(lookups)
+
+def generate_report():
+    """Print the share of requests reaching fuzzy matching with and without the canonical index"""
+    print("FUZZY MATCHING SHARE REPORT")
+    print("=" * 60)
+
+    requests = build_requests()
+    print(f"{len(requests)} requests built from {len(DISEASE_SYMPTOMS)} disease symptom lists")
+    print()
+
+    # Count every request, not just the first time it is seen
+    original_size = get_symptom_cache_stats()['capacity']
+    configure_symptom_cache(size=0)
+
+    canonical_index = main.SYMPTOM_CANONICAL_INDEX
+    phrase_automaton = main.SYMPTOM_PHRASE_AUTOMATON
+    phonetic_index = main.SYMPTOM_PHONETIC_INDEX
+
+    # Before: no canonical or phonetic index, only phrases written exactly as in the dataset
+    main.SYMPTOM_CANONICAL_INDEX = {}
+    main.SYMPTOM_PHONETIC_INDEX = {}
+    main.SYMPTOM_PHRASE_AUTOMATON = build_phrase_automaton(legacy_symptom_phrases())
+    try:
+        before_reached, before_lookups = measure_fuzzy_share(requests)
+    finally:
+        main.SYMPTOM_CANONICAL_INDEX = canonical_index
+        main.SYMPTOM_PHRASE_AUTOMATON = phrase_automaton
+        main.SYMPTOM_PHONETIC_INDEX = phonetic_index
+
+    after_reached, after_lookups = measure_fuzzy_share(requests)
+
+    configure_symptom_cache(size=original_size)
+
+    print(f"{'':<28}{'Before':>12}{'After':>12}")
+    print(f"{'Requests reaching fuzzy':<28}{before_reached:>12}{after_reached:>12}")
+    print(f"{'Share of requests':<28}{before_reached / len(requests):>12.1%}{after_reached / len(requests):>12.1%}")
+    print(f"{'Fuzzy lookups':<28}{before_lookups:>12}{after_lookups:>12}")
+    print()
+
+    return after_reached <= before_reached
+
+if __name__ == "__main__":
+    success = generate_report()
+    sys.exit(0 if success else 1)
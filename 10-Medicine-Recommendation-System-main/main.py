@@ -2,8 +2,19 @@ import numpy as np
 import pandas as pd
 import pickle
 import ast
+import hashlib
+import inspect
+import json
+import mmap
 import os
 import re
+import secrets
+import time
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice, repeat
+from scipy.sparse import csc_matrix, csr_matrix
 from flask import Flask, request, render_template, jsonify
 from sklearn.ensemble import RandomForestClassifier
 
@@ -14,12 +25,32 @@ app = Flask(__name__)
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 
 # load dataset===================================
-sym_des = pd.read_csv(os.path.join(BASE_DIR, "dataset/symtoms_df.csv"))
-precautions = pd.read_csv(os.path.join(BASE_DIR, "dataset/precautions_df.csv"))
-workout = pd.read_csv(os.path.join(BASE_DIR, "dataset/workout_df.csv"))
-description = pd.read_csv(os.path.join(BASE_DIR, "dataset/description.csv"))
-medications = pd.read_csv(os.path.join(BASE_DIR, 'dataset/medications.csv'))
-diets = pd.read_csv(os.path.join(BASE_DIR, "dataset/diets.csv"))
+# Read on first use: with a current prebuilt symptom index, startup needs none of them
+DATASET_FILES = {
+    'sym_des': "dataset/symtoms_df.csv",
+    'precautions': "dataset/precautions_df.csv",
+    'workout': "dataset/workout_df.csv",
+    'description': "dataset/description.csv",
+    'medications': 'dataset/medications.csv',
+    'diets': "dataset/diets.csv",
+    'symptom_severity': "dataset/Symptom-severity.csv",
+    'training_data': "dataset/Training.csv",
+}
+DATASET_FRAMES = {}
+
+# Function to read a dataset file on first use
+def load_dataset(name):
+    """Return the DataFrame of a DATASET_FILES entry, reading the CSV file the first time"""
+    if name not in DATASET_FRAMES:
+        DATASET_FRAMES[name] = pd.read_csv(os.path.join(BASE_DIR, DATASET_FILES[name]))
+    return DATASET_FRAMES[name]
+
+# Module attribute hook so main.training_data etc. keep working for importers
+def __getattr__(name):
+    """Resolve the dataset DataFrames (sym_des, training_data, ...) lazily"""
+    if name in DATASET_FILES:
+        return load_dataset(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # Load the trained model
 try:
@@ -34,6 +65,9 @@ except FileNotFoundError:
     model = pickle.load(open(os.path.join(BASE_DIR, 'models/svc.pkl'), 'rb'))
     symptom_to_index = None
 
+# Class pair (first, second) behind each pairwise decision value, in libsvm order
+SVC_PAIR_CLASSES = np.triu_indices(len(getattr(model, 'classes_', [])), 1)
+
 #============================================================
 # custom and helping functions
 #==========================helper functions================
@@ -42,19 +76,47 @@ except FileNotFoundError:
 DATASET_SYMPTOMS = set()  # For fast symptom lookup
 SYMPTOM_TO_DISEASES = {}  # Map symptoms to diseases
 DISEASE_SYMPTOMS = {}     # Map diseases to their symptoms
+SYMPTOM_ORDER = {}        # Iteration position of each symptom (tie-breaking for fuzzy matches)
+SYMPTOM_BK_TREE = None    # BK-tree over DATASET_SYMPTOMS for fuzzy lookup
+SYMSPELL_INDEX = {}       # Symmetric-delete dictionary: deletion variant -> vocabulary terms
+SYMSPELL_MAX_DISTANCE = 2 # Largest edit distance corrected by the deletion dictionary
+SYMPTOM_NGRAM_INDEX = {}  # Character trigram inverted index over DATASET_SYMPTOMS
+NGRAM_SIZE = 3            # Length of the character n-grams in SYMPTOM_NGRAM_INDEX
+SYMPTOM_CHAR_MATRIX = {}  # DATASET_SYMPTOMS encoded as a padded integer array for NumPy matching
+SYMPTOM_TFIDF_INDEX = {}  # Sparse TF-IDF matrix of character n-grams over DATASET_SYMPTOMS
+SYMPTOM_PHRASE_AUTOMATON = None  # Aho-Corasick automaton over multi-word symptom phrases and aliases
+SYMPTOM_CANONICAL_INDEX = {}     # Every spacing/underscore/punctuation variant -> dataset symptom
+SYMPTOM_PHONETIC_INDEX = {}      # Phonetic key of each one-word symptom spelling -> dataset symptom
+SYMPTOM_FREQUENCY = {}           # Number of symtoms_df rows listing each symptom
+SYMPTOM_SEVERITY = {}            # Symptom-severity.csv weight of each dataset symptom
+SYMPTOM_SUGGESTION_TRIE = None   # Compressed prefix trie over symptom names and aliases for autocomplete
+DISEASE_INCIDENCE = {}           # Sparse disease x symptom incidence matrix used to score every disease at once
+DISEASE_BITSETS = {}             # Each disease's symptoms as an int bitmask and as packed uint64 words
+DISEASE_POSTINGS = {}            # SYMPTOM_TO_DISEASES as sorted incidence row arrays, for candidate generation
+DISEASE_SEVERITY = {}            # Incidence matrix weighted by SYMPTOM_SEVERITY, with each disease's weight total
+NAIVE_BAYES = {}                 # Bernoulli Naive Bayes log-likelihoods from Training.csv, in incidence row order
+
+# Fuzzy matching engine used by find_matching_symptoms
+# ('linear', 'bitparallel', 'bktree', 'symspell', 'ngram', 'numpy' or 'tfidf')
+FUZZY_MATCH_ENGINE = 'ngram'
 
 # Function to initialize dataset symptoms and mappings
 def initialize_dataset_mappings():
     """Load symptoms directly from dataset and create mappings for fast lookup"""
-    global DATASET_SYMPTOMS, SYMPTOM_TO_DISEASES, DISEASE_SYMPTOMS
+    global DATASET_SYMPTOMS, SYMPTOM_TO_DISEASES, DISEASE_SYMPTOMS, SYMPTOM_BK_TREE, SYMSPELL_INDEX
+    global SYMPTOM_NGRAM_INDEX, SYMPTOM_CHAR_MATRIX, SYMPTOM_PHRASE_AUTOMATON, SYMPTOM_CANONICAL_INDEX
+    global SYMPTOM_PHONETIC_INDEX, SYMPTOM_SUGGESTION_TRIE, SYMPTOM_TFIDF_INDEX
     
     # Clear existing data
     DATASET_SYMPTOMS.clear()
     SYMPTOM_TO_DISEASES.clear()
     DISEASE_SYMPTOMS.clear()
+    SYMPTOM_ORDER.clear()
+    SYMPTOM_FREQUENCY.clear()
+    SYMPTOM_SEVERITY.clear()
     
     # Process the symptoms dataset
-    for index, row in sym_des.iterrows():
+    for index, row in load_dataset('sym_des').iterrows():
         disease = row['Disease']
         
         # Collect all symptoms for this disease
@@ -98,6 +160,48 @@ def initialize_dataset_mappings():
         if disease not in DISEASE_SYMPTOMS:
             DISEASE_SYMPTOMS[disease] = set()
         DISEASE_SYMPTOMS[disease].update(disease_symptoms)
+        
+        # Count the rows listing each symptom
+        for symptom in set(disease_symptoms):
+            SYMPTOM_FREQUENCY[symptom] = SYMPTOM_FREQUENCY.get(symptom, 0) + 1
+    
+    # Record the set iteration order so indexed lookups break ties like a linear scan
+    for position, symptom in enumerate(DATASET_SYMPTOMS):
+        SYMPTOM_ORDER[symptom] = position
+    
+    # Build the BK-tree once so fuzzy lookups only compare a fraction of the symptoms
+    SYMPTOM_BK_TREE = build_bk_tree(DATASET_SYMPTOMS)
+    
+    # Build the deletion dictionary over the symptoms and the speech correction words
+    SYMSPELL_INDEX = build_symspell_index(get_correction_vocabulary(), SYMSPELL_MAX_DISTANCE)
+    
+    # Build the trigram inverted index used to shortlist fuzzy match candidates
+    SYMPTOM_NGRAM_INDEX = build_ngram_index(DATASET_SYMPTOMS, NGRAM_SIZE)
+    
+    # Encode the symptoms once so one word can be compared to all of them in a NumPy pass
+    SYMPTOM_CHAR_MATRIX = build_char_matrix(DATASET_SYMPTOMS)
+    
+    # Weight the symptoms' character n-grams so a word is compared to all of them in one sparse product
+    SYMPTOM_TFIDF_INDEX = build_tfidf_index(DATASET_SYMPTOMS, NGRAM_SIZE)
+    
+    # Map every way of writing a symptom ('skin rash', 'skinrash', ...) to its dataset name
+    SYMPTOM_CANONICAL_INDEX = build_canonical_index(DATASET_SYMPTOMS)
+    
+    # Sound-alike spellings from speech recognition resolve by phonetic key
+    SYMPTOM_PHONETIC_INDEX = build_phonetic_index(get_phonetic_vocabulary())
+    
+    # Compile the multi-word phrases so they are found in one pass over the input tokens
+    SYMPTOM_PHRASE_AUTOMATON = build_phrase_automaton(get_symptom_phrases())
+    
+    # Severity weights and the autocomplete trie ranked by them
+    SYMPTOM_SEVERITY.update(load_symptom_severity(load_dataset('symptom_severity')))
+    SYMPTOM_SUGGESTION_TRIE = build_suggestion_trie(get_suggestion_entries())
+    
+    build_disease_scoring_indexes()
+    
+    # Cached matches were computed against the old symptoms (only once the rebuild is
+    # complete, so matches stored while it ran are not served either)
+    clear_symptom_cache()
 
 # Function to normalize input text
 def normalize_input(text):
@@ -185,6 +289,7 @@ def helper(dis):
     dis_normalized = normalize_disease_name(dis)
     
     # Get description
+    description = load_dataset('description')
     desc_rows = description[description['Disease'] == dis_normalized]['Description']
     if len(desc_rows) > 0:
         # Convert to list and get first element
@@ -194,6 +299,7 @@ def helper(dis):
         desc = "Description not available"
 
     # Get precautions - return as a flat list
+    precautions = load_dataset('precautions')
     pre_rows = precautions[precautions['Disease'] == dis_normalized]
     my_precautions = []
     if len(pre_rows) > 0:
@@ -206,6 +312,7 @@ def helper(dis):
                 my_precautions.append(pre_row[precaution_col])
 
     # Get medications - parse string representation of list
+    medications = load_dataset('medications')
     med_rows = medications[medications['Disease'] == dis_normalized]['Medication']
     med_list = []
     if len(med_rows) > 0:
@@ -220,6 +327,7 @@ def helper(dis):
                 med_list = [med_str] if med_str else []
 
     # Get diets - parse string representation of list
+    diets = load_dataset('diets')
     die_rows = diets[diets['Disease'] == dis_normalized]['Diet']
     die_list = []
     if len(die_rows) > 0:
@@ -234,6 +342,7 @@ def helper(dis):
                 die_list = [die_str] if die_str else []
 
     # Get workout - get all workout values as a list
+    workout = load_dataset('workout')
     wrkout_rows = workout[workout['disease'] == dis_normalized]['workout']
     wrkout_list = []
     if len(wrkout_rows) > 0:
@@ -244,9 +353,6 @@ def helper(dis):
 
     return desc, my_precautions, med_list, die_list, wrkout_list
 
-# Initialize dataset mappings when the application starts
-initialize_dataset_mappings()
-
 # Keep the original symptoms_dict for backward compatibility with existing model
 symptoms_dict = {'itching': 0, 'skin_rash': 1, 'nodal_skin_eruptions': 2, 'continuous_sneezing': 3, 'shivering': 4, 'chills': 5, 'joint_pain': 6, 'stomach_pain': 7, 'acidity': 8, 'ulcers_on_tongue': 9, 'muscle_wasting': 10, 'vomiting': 11, 'burning_micturition': 12, 'spotting_ urination': 13, 'fatigue': 14, 'weight_gain': 15, 'anxiety': 16, 'cold_hands_and_feets': 17, 'mood_swings': 18, 'weight_loss': 19, 'restlessness': 20, 'lethargy': 21, 'patches_in_throat': 22, 'irregular_sugar_level': 23, 'cough': 24, 'high_fever': 25, 'sunken_eyes': 26, 'breathlessness': 27, 'sweating': 28, 'dehydration': 29, 'indigestion': 30, 'headache': 31, 'yellowish_skin': 32, 'dark_urine': 33, 'nausea': 34, 'loss_of_appetite': 35, 'pain_behind_the_eyes': 36, 'back_pain': 37, 'constipation': 38, 'abdominal_pain': 39, 'diarrhoea': 40, 'mild_fever': 41, 'yellow_urine': 42, 'yellowing_of_eyes': 43, 'acute_liver_failure': 44, 'fluid_overload': 45, 'swelling_of_stomach': 46, 'swelled_lymph_nodes': 47, 'malaise': 48, 'blurred_and_distorted_vision': 49, 'phlegm': 50, 'throat_irritation': 51, 'redness_of_eyes': 52, 'sinus_pressure': 53, 'runny_nose': 54, 'congestion': 55, 'chest_pain': 56, 'weakness_in_limbs': 57, 'fast_heart_rate': 58, 'pain_during_bowel_movements': 59, 'pain_in_anal_region': 60, 'bloody_stool': 61, 'irritation_in_anus': 62, 'neck_pain': 63, 'dizziness': 64, 'cramps': 65, 'bruising': 66, 'obesity': 67, 'swollen_legs': 68, 'swollen_blood_vessels': 69, 'puffy_face_and_eyes': 70, 'enlarged_thyroid': 71, 'brittle_nails': 72, 'swollen_extremeties': 73, 'excessive_hunger': 74, 'extra_marital_contacts': 75, 'drying_and_tingling_lips': 76, 'slurred_speech': 77, 'knee_pain': 78, 'hip_joint_pain': 79, 'muscle_weakness': 80, 'stiff_neck': 81, 'swelling_joints': 82, 'movement_stiffness': 83, 'spinning_movements': 84, 'loss_of_balance': 85, 'unsteadiness': 86, 'weakness_of_one_body_side': 87, 'loss_of_smell': 88, 'bladder_discomfort': 89, 'foul_smell_of urine': 90, 'continuous_feel_of_urine': 91, 'passage_of_gases': 92, 'internal_itching': 93, 'toxic_look_(typhos)': 94, 'depression': 95, 'irritability': 96, 'muscle_pain': 97, 'altered_sensorium': 98, 'red_spots_over_body': 99, 'belly_pain': 100, 'abnormal_menstruation': 101, 'dischromic _patches': 102, 'watering_from_eyes': 103, 'increased_appetite': 104, 'polyuria': 105, 'family_history': 106, 'mucoid_sputum': 107, 'rusty_sputum': 108, 'lack_of_concentration': 109, 'visual_disturbances': 110, 'receiving_blood_transfusion': 111, 'receiving_unsterile_injections': 112, 'coma': 113, 'stomach_bleeding': 114, 'distention_of_abdomen': 115, 'history_of_alcohol_consumption': 116, 'fluid_overload.1': 117, 'blood_in_sputum': 118, 'prominent_veins_on_calf': 119, 'palpitations': 120, 'painful_walking': 121, 'pus_filled_pimples': 122, 'blackheads': 123, 'scurring': 124, 'skin_peeling': 125, 'silver_like_dusting': 126, 'small_dents_in_nails': 127, 'inflammatory_nails': 128, 'blister': 129, 'red_sore_around_nose': 130, 'yellow_crust_ooze': 131}
 diseases_list = {15: 'Fungal infection', 4: 'Allergy', 16: 'GERD', 9: 'Chronic cholestasis', 14: 'Drug Reaction', 33: 'Peptic ulcer diseae', 1: 'AIDS', 12: 'Diabetes ', 17: 'Gastroenteritis', 6: 'Bronchial Asthma', 23: 'Hypertension ', 30: 'Migraine', 7: 'Cervical spondylosis', 32: 'Paralysis (brain hemorrhage)', 28: 'Jaundice', 29: 'Malaria', 8: 'Chicken pox', 11: 'Dengue', 37: 'Typhoid', 40: 'hepatitis A', 19: 'Hepatitis B', 20: 'Hepatitis C', 21: 'Hepatitis D', 22: 'Hepatitis E', 3: 'Alcoholic hepatitis', 36: 'Tuberculosis', 10: 'Common Cold', 34: 'Pneumonia', 13: 'Dimorphic hemmorhoids(piles)', 18: 'Heart attack', 39: 'Varicose veins', 26: 'Hypothyroidism', 24: 'Hyperthyroidism', 25: 'Hypoglycemia', 31: 'Osteoarthristis', 5: 'Arthritis', 0: '(vertigo) Paroymsal  Positional Vertigo', 2: 'Acne', 38: 'Urinary tract infection', 35: 'Psoriasis', 27: 'Impetigo'}
@@ -269,27 +375,117 @@ def symptoms_to_vector(symptoms):
             input_vector[symptom_to_index[symptom]] = 1
     return input_vector
 
-# Enhanced model prediction function
-def get_predicted_value(patient_symptoms):
-    """Predict disease based on symptoms using the trained model"""
-    # Convert symptoms to feature vector
-    input_vector = symptoms_to_vector(patient_symptoms)
+# Number of diseases in a differential diagnosis
+DIFFERENTIAL_DEFAULT_RESULTS = 5
+DIFFERENTIAL_MAX_RESULTS = 20
+# Below this many scores a full sort is faster than argpartition
+TOP_K_PARTITION_SIZE = 512
+
+# Function to select the k highest scores without sorting every score
+def top_k_indices(scores, k):
+    """Return the indices of the k highest scores, best first (equal scores keep index order, as argmax does)"""
+    if k <= 0 or not len(scores):
+        return np.empty(0, dtype=np.intp)
+    if k >= len(scores) or len(scores) < TOP_K_PARTITION_SIZE:
+        candidates = np.arange(len(scores))
+    else:
+        # argpartition finds the k-th highest score in linear time; ties at it keep the lowest indices
+        kth = scores[np.argpartition(scores, len(scores) - k)[len(scores) - k]]
+        above = np.flatnonzero(scores > kth)
+        candidates = np.concatenate([above, np.flatnonzero(scores == kth)[:k - len(above)]])
+    return candidates[np.lexsort((candidates, -scores[candidates]))][:k]
+
+# Function to normalize log scores into probabilities that sum to 1
+def softmax(scores):
+    """Return the softmax of a NumPy array"""
+    exp_scores = np.exp(scores - np.max(scores))
+    return exp_scores / exp_scores.sum()
+
+# Function to count the votes of pairwise SVC decision values
+def count_svc_votes(decision, n_classes):
+    """Return each class's one-vs-one votes, counted like libsvm (a positive value votes for the first class)"""
+    first, second = SVC_PAIR_CLASSES if len(SVC_PAIR_CLASSES[0]) == len(decision) else np.triu_indices(n_classes, 1)
+    votes = np.bincount(first[decision > 0], minlength=n_classes) + np.bincount(second[decision <= 0], minlength=n_classes)
+    return votes.astype(np.float64)
+
+# Function to compute an SVC's pairwise decision values
+def svc_pairwise_decisions(svc, input_matrix):
+    """Return the one-vs-one decision values of each input row, as decision_function gives them with
+    decision_function_shape='ovo', without changing the shared model's attributes"""
+    # The libsvm evaluation decision_function reshapes to 'ovr' (a multi-class model's values are not flipped)
+    return svc._dense_decision_function(input_matrix)
+
+# Disease name of each model class, in model.classes_ order
+MODEL_LABELS = list(model.classes_) if symptom_to_index is not None else [diseases_list[label] for label in model.classes_]
+
+# Function to build the model input for one prediction
+def symptoms_to_model_input(patient_symptoms):
+    """Return the symptoms as a 1 x features float32 array, which the forest's trees evaluate without conversion"""
+    index = symptoms_dict if symptom_to_index is None else symptom_to_index
+    input_matrix = np.zeros((1, len(index)), dtype=np.float32)
+    for symptom in patient_symptoms:
+        if symptom in index:
+            input_matrix[0, index[symptom]] = 1
+    return input_matrix
+
+# Function to compute a random forest's class probabilities
+def forest_probabilities(forest, input_matrix):
+    """Average the trees' class probabilities like predict_proba, skipping the per-call input validation"""
+    probabilities = forest.estimators_[0].predict_proba(input_matrix, check_input=False)
+    for tree in forest.estimators_[1:]:
+        probabilities += tree.predict_proba(input_matrix, check_input=False)
+    return probabilities[0] / len(forest.estimators_)
+
+# Function to count the SVC's pairwise votes
+def svc_votes(input_matrix):
+    """Return each class's one-vs-one votes from one evaluation of the pairwise decision values, and whether
+    their first maximum is certainly the class predict returns (not when the top vote is tied)"""
+    votes = count_svc_votes(svc_pairwise_decisions(model, input_matrix)[0], len(model.classes_))
+    return votes, np.count_nonzero(votes == votes.max()) == 1
+
+# Function to evaluate the trained model once
+def get_model_scores(patient_symptoms):
+    """Return the predicted class (None when the SVC's top vote is tied and model.predict decides) and each
+    class's raw score in MODEL_LABELS order, from a single model evaluation (the forest's
+    predict_proba estimates, or the SVC's pairwise votes)"""
+    input_matrix = symptoms_to_model_input(patient_symptoms)
     
-    # Predict using the model
     if symptom_to_index is not None and isinstance(model, RandomForestClassifier):
-        # Use new model
-        prediction = model.predict([input_vector])[0]
-        probabilities = model.predict_proba([input_vector])[0]
-        # Get the maximum probability
-        max_prob = np.max(probabilities)
-        # If confidence is too low, return None
-        if max_prob < 0.1:  # 10% threshold
-            return None
-        return prediction
+        probabilities = forest_probabilities(model, input_matrix)
+        return int(np.argmax(probabilities)), probabilities
+    
+    # The original SVC has no probability estimates; score by its pairwise votes
+    # (equal votes keep class order, as predict does). Votes are not probabilities.
+    votes, certain = svc_votes(input_matrix)
+    return int(np.argmax(votes)) if certain else None, votes
+
+# Function to predict a disease and its differential from one model evaluation
+def get_model_prediction(patient_symptoms, k=DIFFERENTIAL_DEFAULT_RESULTS):
+    """Return the predicted disease (None when the new model's confidence is too low) and the k most likely diseases"""
+    best, scores = get_model_scores(patient_symptoms)
+    
+    if best is None:
+        # predict decides between classes with equal votes
+        disease = diseases_list[model.predict(symptoms_to_model_input(patient_symptoms))[0]]
+    elif symptom_to_index is not None and isinstance(model, RandomForestClassifier) and scores[best] < 0.1:
+        disease = None  # 10% threshold
     else:
-        # Fallback to original method
-        prediction = model.predict([input_vector])[0]
-        return diseases_list[prediction]
+        disease = MODEL_LABELS[best]
+    
+    ranked = top_k_indices(scores, k)
+    return disease, [{'disease': MODEL_LABELS[i], 'score': score} for i, score in zip(ranked.tolist(), scores[ranked].tolist())]
+
+# Enhanced model prediction function
+def get_predicted_value(patient_symptoms):
+    """Predict disease based on symptoms using the trained model"""
+    return get_model_prediction(patient_symptoms, 0)[0]
+
+# Function to rank diseases with the trained model
+def rank_model_diseases(patient_symptoms, k=DIFFERENTIAL_DEFAULT_RESULTS):
+    """Return the model's k most likely diseases, best first, with their uncalibrated scores (see get_model_scores)"""
+    _, scores = get_model_scores(patient_symptoms)
+    best = top_k_indices(scores, k)
+    return [{'disease': MODEL_LABELS[i], 'score': score} for i, score in zip(best.tolist(), scores[best].tolist())]
 
 # Doctor recommendation based on disease category
 def get_doctor_recommendation(disease):
@@ -371,6 +567,27 @@ def get_doctor_recommendation(disease):
     # Return specific doctor or default to General Physician
     return doctor_mapping.get(disease, doctor_mapping['default'])
 
+# Function to load the speech corrections from the dataset
+def load_speech_corrections(path):
+    """Load the mispronunciation -> correction table from a CSV file"""
+    corrections_df = pd.read_csv(path)
+    return {str(row['Mispronunciation']).strip().lower(): str(row['Correction']).strip().lower()
+            for _, row in corrections_df.iterrows()}
+
+# Function to compile the speech corrections into a single regular expression
+def compile_speech_corrections(corrections):
+    """Compile all corrections into one word-bounded alternation, longest phrases first"""
+    if not corrections:
+        return None
+    alternatives = sorted(corrections, key=len, reverse=True)
+    return re.compile(r'\b(?:' + '|'.join(re.escape(item) for item in alternatives) + r')\b')
+
+# Fuzzy corrections for common mispronunciations (same as JavaScript)
+SPEECH_FUZZY_CORRECTIONS = load_speech_corrections(os.path.join(BASE_DIR, "dataset/speech_corrections.csv"))
+SPEECH_CORRECTION_PATTERN = compile_speech_corrections(SPEECH_FUZZY_CORRECTIONS)
+SPEECH_PUNCTUATION_PATTERN = re.compile(r'[^\w\s,]')
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
 # Function to clean speech input (same as JavaScript implementation)
 def clean_speech_input(text):
     """Clean speech input to match JavaScript processing"""
@@ -381,37 +598,14 @@ def clean_speech_input(text):
     text = text.lower()
     
     # Remove punctuation and special characters BUT KEEP COMMAS
-    text = re.sub(r'[^\w\s,]', '', text)
+    text = SPEECH_PUNCTUATION_PATTERN.sub('', text)
     
     # Replace multiple spaces with single space and trim
-    text = re.sub(r'\s+', ' ', text).strip()
+    text = WHITESPACE_PATTERN.sub(' ', text).strip()
     
-    # Apply fuzzy matching for common mispronunciations (same as JavaScript)
-    fuzzy_corrections = {
-        'feaver': 'fever',
-        'fevr': 'fever',
-        'couh': 'cough',
-        'cugh': 'cough',
-        'colt': 'cold',
-        'codl': 'cold',
-        'headack': 'headache',
-        'headace': 'headache',
-        'stomac': 'stomach',
-        'stomache': 'stomach',
-        'throte': 'throat',
-        'sorn': 'sore',
-        'soar': 'sore',
-        'paine': 'pain',
-        'aching': 'ache',
-        'runny nose': 'runny nose',
-        'sore throat': 'sore throat',
-        'body pain': 'body pain',
-        'chest pain': 'chest pain'
-    }
-    
-    # Apply corrections
-    for mispronounced, correct in fuzzy_corrections.items():
-        text = re.sub(r'\b' + re.escape(mispronounced) + r'\b', correct, text)
+    # Apply fuzzy matching for common mispronunciations (same as JavaScript) in one pass
+    if SPEECH_CORRECTION_PATTERN is not None:
+        text = SPEECH_CORRECTION_PATTERN.sub(lambda match: SPEECH_FUZZY_CORRECTIONS[match.group(0)], text)
     
     return text
 
@@ -428,7 +622,13 @@ def calculate_similarity(str1, str2):
     if str1 == str2:
         return 1.0
     
-    # Calculate Levenshtein distance
+    # Calculate Levenshtein distance and convert it to a similarity ratio
+    distance = levenshtein_distance(str1, str2)
+    return similarity_from_distance(distance, len(str1), len(str2))
+
+# Function to calculate the Levenshtein edit distance between two strings
+def levenshtein_distance(str1, str2):
+    """Calculate the Levenshtein edit distance using the full dynamic programming matrix"""
     len1, len2 = len(str1), len(str2)
     
     # Create matrix
@@ -453,8 +653,11 @@ def calculate_similarity(str1, str2):
                 matrix[i-1][j-1] + cost  # substitution
             )
     
-    # Calculate similarity ratio
-    distance = matrix[len1][len2]
+    return matrix[len1][len2]
+
+# Function to convert an edit distance into the similarity ratio used for matching
+def similarity_from_distance(distance, len1, len2):
+    """Convert an edit distance into a similarity ratio (1.0 means identical)"""
     max_len = max(len1, len2)
     
     if max_len == 0:
@@ -462,8 +665,1070 @@ def calculate_similarity(str1, str2):
     
     return 1.0 - (distance / max_len)
 
+# Function to calculate the Levenshtein distance with the bit-parallel algorithm (Myers/Hyyro)
+def myers_distance(str1, str2, max_distance=None):
+    """Calculate the Levenshtein distance bit-parallel; returns max_distance + 1 once it is exceeded"""
+    # The longer string becomes the bit-vector pattern, the shorter one is scanned
+    if len(str1) < len(str2):
+        str1, str2 = str2, str1
+    length = len(str1)
+    if length == 0:
+        return len(str2) if max_distance is None else min(len(str2), max_distance + 1)
+    
+    # Bit mask of the positions of each character in the pattern
+    peq = {}
+    for i, char in enumerate(str1):
+        peq[char] = peq.get(char, 0) | (1 << i)
+    
+    full = (1 << length) - 1
+    last = 1 << (length - 1)
+    pv, mv, distance = full, 0, length
+    remaining = len(str2)
+    # The length difference alone can exceed the cap (an empty text scans no column)
+    if max_distance is not None and distance - remaining > max_distance:
+        return max_distance + 1
+    
+    for char in str2:
+        eq = peq.get(char, 0)
+        xv = eq | mv
+        xh = ((((eq & pv) + pv) & full) ^ pv) | eq
+        ph = mv | (~(xh | pv) & full)
+        mh = pv & xh
+        
+        # Track the last row of the DP matrix
+        if ph & last:
+            distance += 1
+        elif mh & last:
+            distance -= 1
+        
+        ph = ((ph << 1) | 1) & full
+        mh = (mh << 1) & full
+        pv = mh | (~(xv | ph) & full)
+        mv = ph & xv
+        
+        # Each remaining column can lower the distance by at most one
+        remaining -= 1
+        if max_distance is not None and distance - remaining > max_distance:
+            return max_distance + 1
+    
+    return distance
+
+# Function to calculate similarity with the bit-parallel distance and a threshold cutoff
+def calculate_similarity_bitparallel(str1, str2, threshold=0.0):
+    """Calculate the same similarity as calculate_similarity; pairs that cannot reach threshold score 0.0"""
+    if not str1 or not str2:
+        return 0.0
+    
+    str1, str2 = str1.lower(), str2.lower()
+    if str1 == str2:
+        return 1.0
+    
+    len1, len2 = len(str1), len(str2)
+    if threshold <= 0:
+        return similarity_from_distance(myers_distance(str1, str2), len1, len2)
+    
+    # Largest distance that can still reach the threshold for this pair
+    max_distance = int((1.0 - threshold) * max(len1, len2) + 1e-9)
+    
+    # Length-difference pre-filter: the distance is at least the length difference
+    if abs(len1 - len2) > max_distance:
+        return 0.0
+    
+    distance = myers_distance(str1, str2, max_distance)
+    if distance > max_distance:
+        return 0.0
+    return similarity_from_distance(distance, len1, len2)
+
+# Function to find the largest edit distance that can still reach a similarity threshold
+def max_distance_for_threshold(word_length, threshold):
+    """Return the largest edit distance at which a word can still reach the threshold, or None if unbounded"""
+    if threshold <= 0:
+        return None
+    
+    # similarity = 1 - d / max(len1, len2) and d >= |len1 - len2|, so a word of
+    # length m can only reach the threshold when d <= (1 - t) * m / t
+    return int((1.0 - threshold) * word_length / threshold + 1e-9)
+
+# Function to build a BK-tree (metric tree over edit distance) from symptom names
+def build_bk_tree(terms):
+    """Build a BK-tree where each node is [term, {distance: child_node}]"""
+    root = None
+    
+    for term in terms:
+        if root is None:
+            root = [term, {}]
+            continue
+        
+        # Walk down the tree following the edge labelled with the edit distance
+        node = root
+        while True:
+            distance = myers_distance(term, node[0])
+            if distance == 0:
+                break  # Term is already in the tree
+            child = node[1].get(distance)
+            if child is None:
+                node[1][distance] = [term, {}]
+                break
+            node = child
+    
+    return root
+
+# Function to query a BK-tree for all terms within an edit distance radius
+def query_bk_tree(tree, word, max_distance, stats=None):
+    """Return (term, distance) pairs within max_distance of word, pruning with the triangle inequality"""
+    results = []
+    if tree is None:
+        return results
+    
+    stack = [tree]
+    while stack:
+        term, children = stack.pop()
+        distance = myers_distance(word, term)
+        if stats is not None:
+            stats['comparisons'] = stats.get('comparisons', 0) + 1
+        if distance <= max_distance:
+            results.append((term, distance))
+        
+        # Only subtrees whose edge label is within the radius can contain matches
+        for edge, child in children.items():
+            if distance - max_distance <= edge <= distance + max_distance:
+                stack.append(child)
+    
+    return results
+
+# Function to find the best fuzzy match with a linear scan over all symptoms
+def linear_best_match(word, threshold, symptoms):
+    """Return the best symptom at or above threshold by comparing the word against every symptom"""
+    best_match = None
+    best_score = 0
+    
+    for dataset_symptom in symptoms:
+        # Calculate similarity
+        score = calculate_similarity(word, dataset_symptom)
+        
+        # If score is above threshold and better than current best
+        if score >= threshold and score > best_score:
+            best_match = dataset_symptom
+            best_score = score
+    
+    return best_match
+
+# Function to find the best fuzzy match with a linear scan using the bit-parallel similarity
+def bitparallel_best_match(word, threshold, symptoms):
+    """Return the best symptom at or above threshold, skipping pairs that cannot reach it"""
+    best_match = None
+    best_score = 0
+    
+    for dataset_symptom in symptoms:
+        score = calculate_similarity_bitparallel(word, dataset_symptom, threshold)
+        if score >= threshold and score > best_score:
+            best_match = dataset_symptom
+            best_score = score
+    
+    return best_match
+
+# Function to find the best fuzzy match using a BK-tree
+def bk_tree_best_match(word, threshold, tree, order, stats=None):
+    """Return the best symptom at or above threshold, identical to a linear scan over the symptoms in order"""
+    word = word.lower()
+    max_distance = max_distance_for_threshold(len(word), threshold)
+    if max_distance is None:
+        return linear_best_match(word, threshold, order)
+    
+    best_match = None
+    best_key = None
+    for term, distance in query_bk_tree(tree, word, max_distance, stats):
+        score = 1.0 if term == word else similarity_from_distance(distance, len(word), len(term))
+        if score < threshold or score <= 0:
+            continue
+        # Highest score wins; ties go to the symptom a linear scan would reach first
+        key = (-score, order[term])
+        if best_key is None or key < best_key:
+            best_match = term
+            best_key = key
+    
+    return best_match
+
+# Function to flatten a string -> terms mapping into sorted arrays
+def build_flat_postings(postings, terms, counts=None):
+    """Store postings (key -> [term]) as sorted byte-string keys, CSR offsets and term ids; counts, when
+    given, maps the same keys to a count per posting"""
+    term_ids = {term: position for position, term in enumerate(terms)}
+    keys = sorted(postings, key=lambda key: key.encode('utf-8'))
+    
+    indptr = np.zeros(len(keys) + 1, dtype=np.int32)
+    np.cumsum([len(postings[key]) for key in keys], out=indptr[1:])
+    flat = {
+        'keys': np.array([key.encode('utf-8') for key in keys], dtype=np.bytes_),
+        'indptr': indptr,
+        'ids': np.array([term_ids[term] for key in keys for term in postings[key]], dtype=np.int32),
+        'terms': list(terms),
+    }
+    if counts is not None:
+        flat['counts'] = np.array([count for key in keys for count in counts[key]], dtype=np.int32)
+    return flat
+
+# Function to find the postings of several keys in flat postings
+def lookup_flat_postings(flat, keys):
+    """Return the positions of the postings of every key found, and the index in keys each belongs to"""
+    stored = flat['keys']
+    encoded = [key.encode('utf-8') for key in keys]
+    
+    # Keys wider than the stored ones cannot match (and would be truncated by the array dtype)
+    width = stored.dtype.itemsize
+    owners = np.array([position for position, key in enumerate(encoded) if len(key) <= width], dtype=np.intp)
+    query = np.array([encoded[position] for position in owners.tolist()], dtype=stored.dtype)
+    
+    # One binary search for all keys; stored keys are sorted bytewise
+    found = np.searchsorted(stored, query)
+    present = found < len(stored)
+    present[present] = stored[found[present]] == query[present]
+    owners, found = owners[present], found[present]
+    
+    # Expand each key's [start, end) posting range
+    starts = flat['indptr'][found]
+    lengths = flat['indptr'][found + 1] - starts
+    ends = np.cumsum(lengths)
+    positions = np.arange(ends[-1] if len(ends) else 0) + np.repeat(starts - (ends - lengths), lengths)
+    return positions, np.repeat(owners, lengths)
+
+# Function to generate every deletion variant of a word up to a maximum edit distance
+def generate_deletes(word, max_distance):
+    """Return the word plus every string obtained by deleting up to max_distance characters"""
+    deletes = {word}
+    current = {word}
+    
+    for _ in range(max_distance):
+        next_level = set()
+        for term in current:
+            if len(term) <= 1:
+                continue
+            for i in range(len(term)):
+                next_level.add(term[:i] + term[i+1:])
+        next_level -= deletes
+        deletes.update(next_level)
+        current = next_level
+    
+    return deletes
+
+# Function to build a SymSpell-style symmetric-delete dictionary
+def build_symspell_index(terms, max_distance):
+    """Map every deletion variant of each term to the terms that produce it, as flat postings"""
+    terms = list(terms)
+    index = {}
+    
+    for term in terms:
+        for delete in generate_deletes(term, max_distance):
+            index.setdefault(delete, []).append(term)
+    
+    return build_flat_postings(index, terms)
+
+# Function to estimate the memory used by a deletion dictionary
+def get_symspell_index_size(index=None):
+    """Return the size in bytes of the deletion dictionary's arrays (keys, offsets and term ids)"""
+    if index is None:
+        index = SYMSPELL_INDEX
+    
+    # Vocabulary strings are shared with DATASET_SYMPTOMS, so only the arrays are counted
+    return sum(index[name].nbytes for name in ('keys', 'indptr', 'ids'))
+
+# Function to collect the vocabulary covered by the deletion dictionary
+def get_correction_vocabulary():
+    """Return the dataset symptoms plus every word produced by the speech corrections"""
+    vocabulary = set(DATASET_SYMPTOMS)
+    for correct in SPEECH_FUZZY_CORRECTIONS.values():
+        vocabulary.update(correct.split())
+    return vocabulary
+
+# Function to correct a misspelled word with the deletion dictionary
+def symspell_lookup(word, max_distance=None, index=None):
+    """Return (term, distance) pairs for vocabulary terms within max_distance edits of word"""
+    if max_distance is None:
+        max_distance = SYMSPELL_MAX_DISTANCE
+    if index is None:
+        index = SYMSPELL_INDEX
+    
+    word = word.lower()
+    positions, _ = lookup_flat_postings(index, list(generate_deletes(word, max_distance)))
+    candidates = {index['terms'][term_id] for term_id in index['ids'][positions].tolist()}
+    
+    # Shared deletion variants only bound the distance, so verify each candidate
+    results = []
+    for term in candidates:
+        distance = myers_distance(word, term, max_distance)
+        if distance <= max_distance:
+            results.append((term, distance))
+    return results
+
+# Function to find the best fuzzy match using the deletion dictionary
+def symspell_best_match(word, threshold):
+    """Return the best symptom reachable within SYMSPELL_MAX_DISTANCE edits, falling back to the BK-tree"""
+    word = word.lower()
+    best_match = None
+    best_key = None
+    
+    for term, distance in symspell_lookup(word):
+        # Speech vocabulary words (e.g. 'fever') resolve through the common mappings
+        symptom = term if term in DATASET_SYMPTOMS else COMMON_SYMPTOM_MAPPINGS.get(term)
+        if symptom not in SYMPTOM_ORDER:
+            continue
+        score = 1.0 if term == word else similarity_from_distance(distance, len(word), len(term))
+        if score < threshold or score <= 0:
+            continue
+        key = (-score, SYMPTOM_ORDER[symptom])
+        if best_key is None or key < best_key:
+            best_match = symptom
+            best_key = key
+    
+    # Words further than SYMSPELL_MAX_DISTANCE edits from the vocabulary use the BK-tree
+    if best_match is None:
+        return bk_tree_best_match(word, threshold, SYMPTOM_BK_TREE, SYMPTOM_ORDER)
+    return best_match
+
+# Function to split a string into padded character n-grams
+def get_ngrams(text, n):
+    """Return the multiset of character n-grams of text, padded so every character is covered n times"""
+    padding = '$' * (n - 1)
+    padded = padding + text + padding
+    counts = {}
+    for i in range(len(padded) - n + 1):
+        gram = padded[i:i+n]
+        counts[gram] = counts.get(gram, 0) + 1
+    return counts
+
+# Function to build a character n-gram inverted index
+def build_ngram_index(terms, n):
+    """Build flat postings (n-gram -> term ids with their n-gram counts) and group the terms by length"""
+    terms = list(terms)
+    postings = {}
+    counts = {}
+    
+    for term in terms:
+        for gram, count in get_ngrams(term, n).items():
+            postings.setdefault(gram, []).append(term)
+            counts.setdefault(gram, []).append(count)
+    
+    return {'n': n, 'postings': build_flat_postings(postings, terms, counts), 'by_length': group_terms_by_length(terms)}
+
+# Function to group terms by their length
+def group_terms_by_length(terms):
+    """Map each length to the terms of that length"""
+    by_length = {}
+    for term in terms:
+        by_length.setdefault(len(term), []).append(term)
+    return by_length
+
+# Function to shortlist the terms that could reach a similarity threshold
+def ngram_candidates(word, threshold, index):
+    """Return the terms sharing enough n-grams with word to possibly reach the threshold"""
+    n = index['n']
+    word_length = len(word)
+    
+    # Count shared n-grams (multiset intersection) through the postings
+    postings = index['postings']
+    grams = get_ngrams(word, n)
+    positions, owners = lookup_flat_postings(postings, list(grams))
+    overlap = np.minimum(np.array(list(grams.values()), dtype=np.int32)[owners], postings['counts'][positions])
+    shared = np.bincount(postings['ids'][positions], weights=overlap, minlength=len(postings['terms']))
+    
+    # d >= |m - l| limits the lengths that can reach the threshold
+    min_length = int(threshold * word_length - 1e-9)
+    max_length = int(word_length / threshold + 1e-9)
+    
+    # Each edit destroys at most n grams, so strings within k edits share
+    # at least max(m, l) + n - 1 - k * n padded n-grams
+    required = {}
+    candidates = []
+    for length in range(max(min_length, 0), max_length + 1):
+        longest = max(word_length, length)
+        max_distance = int((1.0 - threshold) * longest + 1e-9)
+        required[length] = longest + n - 1 - max_distance * n
+        # Lengths where the filter cannot prune anything keep all their terms
+        if required[length] <= 0:
+            candidates.extend(index['by_length'].get(length, ()))
+    
+    terms = postings['terms']
+    for term_id in np.flatnonzero(shared).tolist():
+        term = terms[term_id]
+        needed = required.get(len(term))
+        if needed is not None and needed > 0 and shared[term_id] >= needed:
+            candidates.append(term)
+    
+    return candidates
+
+# Function to find the best fuzzy match using the n-gram inverted index
+def ngram_best_match(word, threshold, index, order):
+    """Return the best symptom at or above threshold, scoring only the n-gram shortlist"""
+    word = word.lower()
+    if threshold <= 0:
+        return linear_best_match(word, threshold, order)
+    
+    best_match = None
+    best_key = None
+    for term in ngram_candidates(word, threshold, index):
+        score = calculate_similarity_bitparallel(word, term, threshold)
+        if score < threshold or score <= 0:
+            continue
+        key = (-score, order[term])
+        if best_key is None or key < best_key:
+            best_match = term
+            best_key = key
+    
+    return best_match
+
+# Function to encode terms into a padded integer array of character codes
+def build_char_matrix(terms):
+    """Encode terms (in iteration order) as a zero-padded array of character codes plus their lengths"""
+    terms = list(terms)
+    lengths = np.array([len(term) for term in terms], dtype=np.int32)
+    codes = np.zeros((len(terms), int(lengths.max()) if len(terms) else 0), dtype=np.int32)
+    
+    for row, term in enumerate(terms):
+        codes[row, :len(term)] = [ord(char) for char in term]
+    
+    return {'terms': terms, 'codes': codes, 'lengths': lengths}
+
+# Function to compute the edit distance from one word to every encoded term at once
+def numpy_edit_distances(word, matrix):
+    """Return the Levenshtein distance from word to every term using row-wise DP over the array"""
+    codes, lengths = matrix['codes'], matrix['lengths']
+    columns = np.arange(codes.shape[1] + 1, dtype=np.int32)
+    
+    # Row 0 of the DP matrix for every term at once
+    previous = np.broadcast_to(columns, (codes.shape[0], columns.size))
+    
+    for i, char in enumerate(word, start=1):
+        cost = (codes != ord(char)).astype(np.int32)
+        current = np.empty_like(previous)
+        current[:, 0] = i
+        current[:, 1:] = np.minimum(previous[:, 1:] + 1,       # deletion
+                                    previous[:, :-1] + cost)   # substitution
+        # Insertions chain along the row: D[j] = min(D[j], D[j-1] + 1) = j + cummin(D[k] - k)
+        previous = np.minimum.accumulate(current - columns, axis=1) + columns
+    
+    # Padding never affects columns up to a term's own length
+    return previous[np.arange(codes.shape[0]), lengths]
+
+# Function to compute the similarity ratio from one word to every encoded term at once
+def numpy_similarities(word, matrix):
+    """Return calculate_similarity(word, term) for every term in the matrix as a NumPy array"""
+    word = word.lower()
+    if not word:
+        return np.zeros(len(matrix['terms']))
+    
+    distances = numpy_edit_distances(word, matrix)
+    max_lengths = np.maximum(matrix['lengths'], len(word))
+    return 1.0 - (distances / max_lengths)
+
+# Function to find the best fuzzy match with the vectorized NumPy engine
+def numpy_best_match(word, threshold, matrix, order=None):
+    """Return the best symptom at or above threshold using one NumPy pass over all symptoms"""
+    if not matrix.get('terms'):
+        return None
+    
+    scores = numpy_similarities(word, matrix)
+    scores[(scores < threshold) | (scores <= 0)] = -1.0
+    
+    # argmax returns the first maximum, matching the linear scan's tie-breaking
+    # when the rows are in iteration order
+    best = int(np.argmax(scores))
+    if scores[best] < 0:
+        return None
+    
+    # Rows loaded from a prebuilt index keep the order they were saved in
+    if order is not None:
+        tied = np.flatnonzero(scores == scores[best])
+        best = min(tied, key=lambda row: order[matrix['terms'][row]])
+    return matrix['terms'][best]
+
+# Number of closest terms by TF-IDF cosine that are re-scored by edit distance
+TFIDF_CANDIDATES = 10
+
+# Function to build a sparse TF-IDF matrix of character n-grams
+def build_tfidf_index(terms, n):
+    """Build an L2-normalized term x n-gram TF-IDF matrix (stored column-wise for query lookups)"""
+    terms = list(terms)
+    vocabulary = {}
+    rows, columns, counts = [], [], []
+    
+    for row, term in enumerate(terms):
+        for gram, count in get_ngrams(term, n).items():
+            rows.append(row)
+            columns.append(vocabulary.setdefault(gram, len(vocabulary)))
+            counts.append(count)
+    
+    if not terms:
+        return {'n': n, 'terms': [], 'vocabulary': {}, 'idf': np.zeros(0), 'matrix': None}
+    
+    columns = np.array(columns, dtype=np.int64)
+    document_frequency = np.bincount(columns, minlength=len(vocabulary))
+    idf = np.log((1.0 + len(terms)) / (1.0 + document_frequency)) + 1.0
+    
+    matrix = csr_matrix((np.array(counts, dtype=np.float64) * idf[columns], (rows, columns)),
+                        shape=(len(terms), len(vocabulary)))
+    norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+    matrix = csr_matrix(matrix.multiply(1.0 / norms[:, None]))
+    
+    return {'n': n, 'terms': terms, 'vocabulary': vocabulary, 'idf': idf, 'matrix': matrix.tocsc()}
+
+# Function to find the closest terms by TF-IDF cosine similarity
+def tfidf_candidates(word, index, k=TFIDF_CANDIDATES):
+    """Return up to k terms with the highest cosine similarity to word (unordered)"""
+    if index.get('matrix') is None:
+        return []
+    
+    # n-grams that no term contains cannot change the ranking
+    columns, weights = [], []
+    for gram, count in get_ngrams(word, index['n']).items():
+        column = index['vocabulary'].get(gram)
+        if column is not None:
+            columns.append(column)
+            weights.append(count * index['idf'][column])
+    if not columns:
+        return []
+    
+    # One sparse product scores every term
+    scores = index['matrix'][:, columns] @ np.array(weights)
+    k = min(k, len(scores))
+    top = np.argpartition(-scores, k - 1)[:k]
+    return [index['terms'][i] for i in top if scores[i] > 0]
+
+# Function to find the best fuzzy match with the TF-IDF engine
+def tfidf_best_match(word, threshold, index, order):
+    """Re-score the closest TF-IDF candidates by edit distance and return the best at or above threshold"""
+    best_match = None
+    best_key = None
+    
+    for term in tfidf_candidates(word, index):
+        score = calculate_similarity_bitparallel(word, term, threshold)
+        if score >= threshold and score > 0:
+            key = (-score, order[term])
+            if best_key is None or key < best_key:
+                best_match, best_key = term, key
+    
+    return best_match
+
+# Fuzzy matching engines selectable through FUZZY_MATCH_ENGINE
+FUZZY_MATCH_ENGINES = {
+    'linear': lambda word, threshold: linear_best_match(word, threshold, DATASET_SYMPTOMS),
+    'bitparallel': lambda word, threshold: bitparallel_best_match(word, threshold, DATASET_SYMPTOMS),
+    'bktree': lambda word, threshold: bk_tree_best_match(word, threshold, SYMPTOM_BK_TREE, SYMPTOM_ORDER),
+    'symspell': symspell_best_match,
+    'ngram': lambda word, threshold: ngram_best_match(word, threshold, SYMPTOM_NGRAM_INDEX, SYMPTOM_ORDER),
+    'numpy': lambda word, threshold: numpy_best_match(word, threshold, SYMPTOM_CHAR_MATRIX, SYMPTOM_ORDER),
+    'tfidf': lambda word, threshold: tfidf_best_match(word, threshold, SYMPTOM_TFIDF_INDEX, SYMPTOM_ORDER),
+}
+
+# Engines guaranteed to return exactly the same matches as the linear scan
+EXACT_FUZZY_MATCH_ENGINES = {'linear', 'bitparallel', 'bktree', 'ngram', 'numpy'}
+
+# Function to find the best fuzzy match for a single word
+def find_best_fuzzy_match(word, threshold, engine=None):
+    """Find the best dataset symptom for a word using the selected fuzzy matching engine"""
+    engine = engine or FUZZY_MATCH_ENGINE
+    if engine not in FUZZY_MATCH_ENGINES:
+        raise ValueError(f"Unknown fuzzy matching engine: {engine}")
+    return FUZZY_MATCH_ENGINES[engine](word, threshold)
+
+# Direct mapping for common symptoms that might not match exactly
+COMMON_SYMPTOM_MAPPINGS = {
+    'fever': 'high_fever',
+    'cold': 'chills',
+    'head ache': 'headache',
+    'head-ache': 'headache',
+    'coughing': 'cough',
+    'sneezing': 'continuous_sneezing'
+}
+
+# Function to reduce a symptom name to lowercase words separated by single spaces
+def canonical_symptom_key(text):
+    """Replace underscores and punctuation with spaces, e.g. 'foul_smell_of urine' -> 'foul smell of urine'"""
+    return re.sub(r'[^a-z0-9]+', ' ', str(text).lower()).strip()
+
+# Function to generate every spacing variant of a symptom
+def get_spacing_variants(canonical_key):
+    """Return every way of joining adjacent words with or without a space ('skin rash' -> 'skin rash', 'skinrash')"""
+    words = canonical_key.split()
+    if not words:
+        return []
+    
+    variants = [words[0]]
+    for word in words[1:]:
+        variants = [variant + separator + word for variant in variants for separator in (' ', '')]
+    return variants
+
+# Function to build the canonical symptom index
+def build_canonical_index(symptoms):
+    """Map every spacing, underscore and punctuation variant of each symptom to its dataset name"""
+    index = {}
+    
+    # Normalized input has no punctuation, so only spacing differences remain to cover
+    for symptom in symptoms:
+        for variant in get_spacing_variants(canonical_symptom_key(symptom)):
+            index.setdefault(variant, symptom)
+    
+    return index
+
+# Shortest word looked up by sound; shorter words collide with too many common words
+PHONETIC_MIN_WORD_LENGTH = 4
+# Sound-alikes must be about as long as the spelling they match ('nose' is not 'nausea')
+PHONETIC_LENGTH_RATIO = 0.75
+# Common words that sound like a symptom ('could' and 'cold') but are never meant as one
+PHONETIC_IGNORED_WORDS = {
+    'about', 'after', 'again', 'before', 'being', 'called', 'could', 'every', 'feel', 'feeling',
+    'have', 'having', 'maybe', 'really', 'should', 'since', 'something', 'there', 'their',
+    'these', 'those', 'very', 'what', 'when', 'where', 'which', 'while', 'with', 'would'
+}
+
+# Function to compute a Metaphone-style phonetic key
+def phonetic_key(word):
+    """Encode how a word sounds, so 'feaver', 'fevr' and 'fever' share the key 'FFR'"""
+    word = re.sub(r'[^a-z]', '', str(word).lower())
+    if not word:
+        return ''
+    
+    # Silent first letters and initial sounds
+    for prefix in ('kn', 'gn', 'pn', 'wr', 'ps'):
+        if word.startswith(prefix):
+            word = word[1:]
+            break
+    if word.startswith('x'):
+        word = 's' + word[1:]
+    elif word.startswith('wh'):
+        word = 'w' + word[2:]
+    
+    vowels = 'aeiou'
+    key = []
+    prev_code = ''
+    i = 0
+    while i < len(word):
+        char = word[i]
+        prev = word[i - 1] if i > 0 else ''
+        following = word[i + 1] if i + 1 < len(word) else ''
+        
+        # Doubled letters sound like one
+        if char == prev and char != 'c':
+            i += 1
+            continue
+        
+        # Vowels only count at the start of the word
+        if char in vowels:
+            code = 'A' if i == 0 else ''
+        elif char == 'b':
+            code = '' if prev == 'm' and i == len(word) - 1 else 'P'
+        elif char == 'c':
+            if word[i:i + 3] == 'sch':
+                code = 'K'
+            elif following == 'h':
+                # 'chills' but 'ache', 'stomach'
+                code = 'X' if i == 0 or prev == 't' else 'K'
+                i += 1
+            elif following in 'eiy' and following:
+                code = 'S'
+            else:
+                code = 'K'
+        elif char == 'd':
+            code = 'J' if following == 'g' and word[i + 2:i + 3] in ('e', 'i', 'y') else 'T'
+        elif char == 'g':
+            if following == 'h':
+                # 'cough' but 'high', 'weight'
+                if i + 2 == len(word) and prev in ('u', 'a'):
+                    code = 'F'
+                elif word[i + 2:i + 3] in vowels and word[i + 2:i + 3]:
+                    code = 'K'
+                else:
+                    code = ''
+                i += 1
+            elif prev == 'd' and following in ('e', 'i', 'y') and following:
+                code = ''
+            elif following in ('e', 'i', 'y') and following:
+                code = 'J'
+            else:
+                code = 'K'
+        elif char == 'h':
+            code = 'H' if following in vowels and following and prev not in ('c', 'g', 'p', 's', 't') else ''
+        elif char == 'k':
+            code = '' if prev == 'c' else 'K'
+        elif char == 'p':
+            code = 'F' if following == 'h' else 'P'
+            if following == 'h':
+                i += 1
+        elif char == 'q':
+            code = 'K'
+        elif char == 's':
+            if following == 'h':
+                code = 'X'
+                i += 1
+            else:
+                code = 'S'
+        elif char == 't':
+            if word[i:i + 3] in ('tio', 'tia'):
+                code = 'X'
+            elif following == 'h':
+                code = '0'
+                i += 1
+            elif word[i:i + 3] == 'tch':
+                code = ''
+            else:
+                code = 'T'
+        elif char == 'v':
+            code = 'F'
+        elif char in 'wy':
+            code = char.upper() if following in vowels and following else ''
+        elif char == 'x':
+            code = 'KS'
+        elif char == 'z':
+            code = 'S'
+        else:
+            code = char.upper()
+        
+        # Neighbouring letters with one sound collapse ('ck', 'sc' + 'c')
+        if code and code != prev_code:
+            key.append(code)
+        prev_code = code
+        i += 1
+    
+    return ''.join(key)
+
+# Function to collect the one-word spellings that are looked up by sound
+def get_phonetic_vocabulary():
+    """Map each one-word symptom spelling and one-word alias to its dataset symptom"""
+    vocabulary = {}
+    
+    for alias, symptom in COMMON_SYMPTOM_MAPPINGS.items():
+        if ' ' not in alias and symptom in DATASET_SYMPTOMS:
+            vocabulary[normalize_input(alias)] = symptom
+    
+    for variant, symptom in SYMPTOM_CANONICAL_INDEX.items():
+        if ' ' not in variant:
+            vocabulary.setdefault(variant, symptom)
+    
+    return vocabulary
+
+# Function to build the phonetic key index
+def build_phonetic_index(vocabulary):
+    """Map each phonetic key to (dataset symptom, spellings with that key); keys shared by different symptoms are left out"""
+    index = {}
+    ambiguous = set()
+    
+    for word, symptom in vocabulary.items():
+        key = phonetic_key(word)
+        if len(key) < 2 or key in ambiguous:
+            continue
+        if key in index:
+            if index[key][0] != symptom:
+                del index[key]
+                ambiguous.add(key)
+            else:
+                index[key] = (symptom, index[key][1] + (word,))
+            continue
+        index[key] = (symptom, (word,))
+    
+    return index
+
+# Function to resolve a sound-alike word with one hash lookup
+def find_phonetic_match(word, threshold=0.75, index=None):
+    """Return the dataset symptom that sounds like word and is spelled within threshold of it, or None"""
+    if len(word) < PHONETIC_MIN_WORD_LENGTH or word in PHONETIC_IGNORED_WORDS:
+        return None
+    if index is None:
+        index = SYMPTOM_PHONETIC_INDEX
+    
+    entry = index.get(phonetic_key(word))
+    if entry is None:
+        return None
+    
+    # Sounding alike only shortlists the symptom; ordinary words ('knees', 'coffee')
+    # share keys with symptoms, so the spelling must still be similar enough
+    symptom, spellings = entry
+    for spelling in spellings:
+        if min(len(word), len(spelling)) < PHONETIC_LENGTH_RATIO * max(len(word), len(spelling)):
+            continue
+        if calculate_similarity_bitparallel(word, spelling, threshold) >= threshold:
+            return symptom
+    return None
+
+# Function to collect the multi-word symptom phrases and aliases
+def get_symptom_phrases():
+    """Map each multi-word phrase (tuple of tokens) to the dataset symptom it stands for"""
+    phrases = {}
+    
+    # Aliases such as 'head ache' resolve to their mapped symptom
+    for alias, symptom in COMMON_SYMPTOM_MAPPINGS.items():
+        tokens = tuple(normalize_input(alias).split())
+        if len(tokens) > 1 and symptom in DATASET_SYMPTOMS:
+            phrases[tokens] = symptom
+    
+    # Spaced variants of dataset symptoms ('skin rash', 'nodal skin eruptions', ...)
+    for variant, symptom in SYMPTOM_CANONICAL_INDEX.items():
+        tokens = tuple(variant.split())
+        if len(tokens) > 1:
+            phrases.setdefault(tokens, symptom)
+    
+    return phrases
+
+# Function to compile phrases into a token-level Aho-Corasick automaton
+def build_phrase_automaton(phrases):
+    """Build goto/fail/output tables where each output is (phrase length, symptom)"""
+    goto = [{}]
+    output = [[]]
+    
+    # Build the trie of phrases
+    for tokens, symptom in phrases.items():
+        state = 0
+        for token in tokens:
+            if token not in goto[state]:
+                goto.append({})
+                output.append([])
+                goto[state][token] = len(goto) - 1
+            state = goto[state][token]
+        output[state].append((len(tokens), symptom))
+    
+    # Breadth-first pass to compute failure links and merge outputs
+    fail = [0] * len(goto)
+    queue = list(goto[0].values())
+    head = 0
+    while head < len(queue):
+        state = queue[head]
+        head += 1
+        for token, child in goto[state].items():
+            queue.append(child)
+            fallback = fail[state]
+            while fallback and token not in goto[fallback]:
+                fallback = fail[fallback]
+            fail[child] = goto[fallback].get(token, 0)
+            output[child] = output[child] + output[fail[child]]
+    
+    return {'goto': goto, 'fail': fail, 'output': output}
+
+# Function to find the longest phrase starting at each token position
+def find_phrase_matches(automaton, tokens):
+    """Scan the tokens once and return {start position: (phrase length, symptom)} for the longest phrases"""
+    matches = {}
+    if automaton is None:
+        return matches
+    
+    goto, fail, output = automaton['goto'], automaton['fail'], automaton['output']
+    state = 0
+    for position, token in enumerate(tokens):
+        while state and token not in goto[state]:
+            state = fail[state]
+        state = goto[state].get(token, 0)
+        
+        for length, symptom in output[state]:
+            start = position - length + 1
+            if start not in matches or length > matches[start][0]:
+                matches[start] = (length, symptom)
+    
+    return matches
+
+# Function to align Symptom-severity.csv weights with the dataset symptoms
+def load_symptom_severity(severity_df):
+    """Map each dataset symptom to its severity weight (0 when the file does not list it)"""
+    # Spelling differs between the files ('foul_smell_of urine' vs 'foul_smell_ofurine')
+    weights = {}
+    for symptom, weight in zip(severity_df['Symptom'], severity_df['weight']):
+        weights.setdefault(canonical_symptom_key(symptom).replace(' ', ''), int(weight))
+    
+    return {symptom: weights.get(canonical_symptom_key(symptom).replace(' ', ''), 0)
+            for symptom in DATASET_SYMPTOMS}
+
+# Autocomplete settings: how many suggestions are kept per trie node and returned by default
+SUGGEST_MAX_RESULTS = 10
+SUGGEST_DEFAULT_RESULTS = 5
+SUGGESTION_RANKINGS = ('weight', 'frequency')
+
+# Function to collect the texts that autocomplete to each symptom
+def get_suggestion_entries():
+    """Map each searchable text to its dataset symptom: names and aliases, from every word onwards"""
+    entries = {}
+    
+    names = [(alias, symptom) for alias, symptom in COMMON_SYMPTOM_MAPPINGS.items() if symptom in DATASET_SYMPTOMS]
+    names += [(symptom, symptom) for symptom in DATASET_SYMPTOMS]
+    
+    # 'rash' completes to 'skin rash' as well as 'skin'
+    for name, symptom in names:
+        words = canonical_symptom_key(name).split()
+        for start in range(len(words)):
+            entries.setdefault(' '.join(words[start:]), set()).add(symptom)
+    
+    return entries
+
+# Function to order symptoms for one autocomplete ranking
+def suggestion_rank(symptom, ranking):
+    """Sort key: highest severity weight or dataset frequency first, then the other, then by name"""
+    weight = SYMPTOM_SEVERITY.get(symptom, 0)
+    frequency = SYMPTOM_FREQUENCY.get(symptom, 0)
+    if ranking == 'frequency':
+        return (-frequency, -weight, symptom)
+    return (-weight, -frequency, symptom)
+
+# Function to build the compressed prefix trie for autocomplete
+def build_suggestion_trie(entries):
+    """Build a radix trie whose nodes store their best SUGGEST_MAX_RESULTS symptoms for each ranking"""
+    # Node: {'edges': {first character: [edge label, child node]}, 'symptoms': set, 'top': {ranking: list}}
+    root = {'edges': {}, 'symptoms': set(), 'top': {}}
+    
+    for text, symptoms in entries.items():
+        node = root
+        rest = text
+        while rest:
+            edge = node['edges'].get(rest[0])
+            if edge is None:
+                child = {'edges': {}, 'symptoms': set(), 'top': {}}
+                node['edges'][rest[0]] = [rest, child]
+                node, rest = child, ''
+                break
+            
+            label, child = edge
+            common = 0
+            while common < len(label) and common < len(rest) and label[common] == rest[common]:
+                common += 1
+            
+            # Split the edge where the new text leaves it
+            if common < len(label):
+                middle = {'edges': {label[common]: [label[common:], child]}, 'symptoms': set(), 'top': {}}
+                edge[0], edge[1] = label[:common], middle
+                child = middle
+            node, rest = child, rest[common:]
+        node['symptoms'].update(symptoms)
+    
+    # Every node keeps the best symptoms of its subtree, so a lookup never visits the subtree
+    # (the best of a subtree are among the node's own symptoms and its children's best)
+    def collect(node):
+        for label, child in node['edges'].values():
+            collect(child)
+        for ranking in SUGGESTION_RANKINGS:
+            candidates = set(node['symptoms'])
+            for label, child in node['edges'].values():
+                candidates.update(child['top'][ranking])
+            ranked = sorted(candidates, key=lambda symptom: suggestion_rank(symptom, ranking))
+            node['top'][ranking] = ranked[:SUGGEST_MAX_RESULTS]
+    
+    collect(root)
+    return root
+
+# Function to find the best completions of a prefix
+def search_suggestion_trie(trie, prefix, ranking='weight'):
+    """Return the ranked symptoms completing prefix (up to SUGGEST_MAX_RESULTS)"""
+    node = trie
+    rest = prefix
+    while rest:
+        edge = node['edges'].get(rest[0])
+        if edge is None:
+            return []
+        label, child = edge
+        if rest.startswith(label):
+            node, rest = child, rest[len(label):]
+        elif label.startswith(rest):
+            return child['top'][ranking]
+        else:
+            return []
+    return node['top'][ranking]
+
+# Function to suggest symptoms for what the user has typed so far
+def suggest_symptoms(query, limit=SUGGEST_DEFAULT_RESULTS, ranking='weight'):
+    """Return the top completions of the last comma-separated symptom in query"""
+    if ranking not in SUGGESTION_RANKINGS:
+        raise ValueError(f"Unknown suggestion ranking: {ranking}")
+    
+    prefix = canonical_symptom_key(str(query).split(',')[-1])
+    if not prefix or SYMPTOM_SUGGESTION_TRIE is None:
+        return []
+    
+    # Keep a trailing space so 'skin ' does not complete to 'skinny'
+    if str(query).endswith(' '):
+        prefix += ' '
+    
+    suggestions = []
+    for symptom in search_suggestion_trie(SYMPTOM_SUGGESTION_TRIE, prefix, ranking)[:max(0, limit)]:
+        suggestions.append({
+            'symptom': symptom,
+            'label': canonical_symptom_key(symptom),
+            'weight': SYMPTOM_SEVERITY.get(symptom, 0),
+            'frequency': SYMPTOM_FREQUENCY.get(symptom, 0)
+        })
+    return suggestions
+
+# Bounded LRU cache for find_matching_symptoms (size 0 disables it, TTL 0 never expires)
+SYMPTOM_CACHE_SIZE = int(os.environ.get('SYMPTOM_CACHE_SIZE', 4096))
+SYMPTOM_CACHE_TTL = float(os.environ.get('SYMPTOM_CACHE_TTL', 3600))
+SYMPTOM_CACHE = OrderedDict()  # (generation, normalized input, threshold, engine) -> (expiry time, matches)
+SYMPTOM_CACHE_LOCK = threading.Lock()
+# Bumped by clear_symptom_cache; lookups that started before a rebuild store under the old generation
+SYMPTOM_CACHE_GENERATION = 0
+SYMPTOM_CACHE_STATS = {'hits': 0, 'misses': 0, 'evictions': 0, 'expirations': 0, 'invalidations': 0}
+
+# Function to change the symptom cache size and TTL
+def configure_symptom_cache(size=None, ttl=None):
+    """Set the maximum number of cached inputs and their time-to-live in seconds"""
+    global SYMPTOM_CACHE_SIZE, SYMPTOM_CACHE_TTL
+    
+    with SYMPTOM_CACHE_LOCK:
+        if size is not None:
+            SYMPTOM_CACHE_SIZE = size
+        if ttl is not None:
+            SYMPTOM_CACHE_TTL = ttl
+        # Shrink the cache if the new size is smaller
+        while len(SYMPTOM_CACHE) > max(SYMPTOM_CACHE_SIZE, 0):
+            SYMPTOM_CACHE.popitem(last=False)
+            SYMPTOM_CACHE_STATS['evictions'] += 1
+
+# Function to drop every cached symptom match
+def clear_symptom_cache():
+    """Invalidate the symptom cache (called once the dataset mappings have been rebuilt)"""
+    global SYMPTOM_CACHE_GENERATION
+    
+    with SYMPTOM_CACHE_LOCK:
+        SYMPTOM_CACHE_GENERATION += 1
+        SYMPTOM_CACHE.clear()
+        SYMPTOM_CACHE_STATS['invalidations'] += 1
+
+# Function to report the symptom cache counters
+def get_symptom_cache_stats():
+    """Return the cache counters, current size and hit rate"""
+    with SYMPTOM_CACHE_LOCK:
+        stats = dict(SYMPTOM_CACHE_STATS)
+        stats['size'] = len(SYMPTOM_CACHE)
+    
+    stats['capacity'] = SYMPTOM_CACHE_SIZE
+    stats['ttl'] = SYMPTOM_CACHE_TTL
+    lookups = stats['hits'] + stats['misses']
+    stats['hit_rate'] = stats['hits'] / lookups if lookups else 0.0
+    return stats
+
+# Function to look up cached symptom matches
+def get_cached_symptoms(key):
+    """Return the cached matches for key, or None on a miss or expired entry"""
+    with SYMPTOM_CACHE_LOCK:
+        entry = SYMPTOM_CACHE.get(key)
+        if entry is not None:
+            expires_at, matches = entry
+            if expires_at is None or expires_at > time.monotonic():
+                SYMPTOM_CACHE.move_to_end(key)
+                SYMPTOM_CACHE_STATS['hits'] += 1
+                return matches
+            del SYMPTOM_CACHE[key]
+            SYMPTOM_CACHE_STATS['expirations'] += 1
+        SYMPTOM_CACHE_STATS['misses'] += 1
+        return None
+
+# Function to store symptom matches in the cache
+def store_cached_symptoms(key, matches):
+    """Store matches for key, evicting the least recently used entries beyond the cache size"""
+    if SYMPTOM_CACHE_SIZE <= 0:
+        return
+    
+    expires_at = time.monotonic() + SYMPTOM_CACHE_TTL if SYMPTOM_CACHE_TTL > 0 else None
+    with SYMPTOM_CACHE_LOCK:
+        SYMPTOM_CACHE[key] = (expires_at, tuple(matches))
+        SYMPTOM_CACHE.move_to_end(key)
+        while len(SYMPTOM_CACHE) > SYMPTOM_CACHE_SIZE:
+            SYMPTOM_CACHE.popitem(last=False)
+            SYMPTOM_CACHE_STATS['evictions'] += 1
+
 # Function to find best matching symptoms using enhanced fuzzy matching
-def find_matching_symptoms(user_input, threshold=0.75):
+def find_matching_symptoms(user_input, threshold=0.75, engine=None):
     """Find matching symptoms using enhanced fuzzy matching with threshold (0.0-1.0)"""
     if not user_input or not DATASET_SYMPTOMS:
         return []
@@ -471,25 +1736,28 @@ def find_matching_symptoms(user_input, threshold=0.75):
     # Normalize user input
     normalized_input = normalize_input(user_input)
     
-    # Direct mapping for common symptoms that might not match exactly
-    common_symptom_mappings = {
-        'fever': 'high_fever',
-        'cold': 'chills',
-        'head ache': 'headache',
-        'head-ache': 'headache',
-        'coughing': 'cough',
-        'sneezing': 'continuous_sneezing'
-    }
+    # Repeated inputs are served from the LRU cache
+    key = (SYMPTOM_CACHE_GENERATION, normalized_input, threshold, engine or FUZZY_MATCH_ENGINE)
+    cached = get_cached_symptoms(key)
+    if cached is not None:
+        return list(cached)
     
+    matched_symptoms = match_normalized_symptoms(normalized_input, threshold, engine)
+    store_cached_symptoms(key, matched_symptoms)
+    return matched_symptoms
+
+# Function to match symptoms in already normalized input
+def match_normalized_symptoms(normalized_input, threshold, engine=None, fuzzy_match=None):
+    """Match normalized input against the dataset symptoms without using the cache"""
     # Check for direct mappings first
-    if normalized_input in common_symptom_mappings:
-        mapped_symptom = common_symptom_mappings[normalized_input]
+    if normalized_input in COMMON_SYMPTOM_MAPPINGS:
+        mapped_symptom = COMMON_SYMPTOM_MAPPINGS[normalized_input]
         if mapped_symptom in DATASET_SYMPTOMS:
             return [mapped_symptom]
     
-    # First try to match the entire input as a multi-word symptom
-    if normalized_input in DATASET_SYMPTOMS:
-        return [normalized_input]
+    # First try to match the entire input as a symptom, however it is spaced
+    if normalized_input in SYMPTOM_CANONICAL_INDEX:
+        return [SYMPTOM_CANONICAL_INDEX[normalized_input]]
     
     # Try to find exact matches for multi-word phrases
     matched_symptoms = []
@@ -497,172 +1765,1112 @@ def find_matching_symptoms(user_input, threshold=0.75):
     # Split input into potential symptoms
     input_symptoms = [s.strip() for s in normalized_input.split() if s.strip()]
     
-    # Try to match multi-word phrases first (3-word, 2-word, then 1-word)
+    # Find every multi-word phrase in one pass, then take the longest one at each position
+    phrase_matches = find_phrase_matches(SYMPTOM_PHRASE_AUTOMATON, input_symptoms)
+    
     i = 0
     while i < len(input_symptoms):
-        matched = False
-        
-        # Try matching 4-word phrases
-        if i + 3 < len(input_symptoms):
-            four_word = ' '.join(input_symptoms[i:i+4])
-            if four_word in DATASET_SYMPTOMS:
-                matched_symptoms.append(four_word)
-                i += 4
-                matched = True
-                continue
+        # Try matching multi-word phrases first
+        if i in phrase_matches:
+            length, symptom = phrase_matches[i]
+            matched_symptoms.append(symptom)
+            i += length
+            continue
         
-        # Try matching 3-word phrases
-        if i + 2 < len(input_symptoms):
-            three_word = ' '.join(input_symptoms[i:i+3])
-            if three_word in DATASET_SYMPTOMS:
-                matched_symptoms.append(three_word)
-                i += 3
-                matched = True
+        # Try matching single words, checking for direct mapping first
+        word = input_symptoms[i]
+        if word in COMMON_SYMPTOM_MAPPINGS:
+            mapped_word = COMMON_SYMPTOM_MAPPINGS[word]
+            if mapped_word in DATASET_SYMPTOMS:
+                if mapped_word not in matched_symptoms:
+                    matched_symptoms.append(mapped_word)
+                i += 1
                 continue
         
-        # Try matching 2-word phrases
-        if i + 1 < len(input_symptoms):
-            two_word = ' '.join(input_symptoms[i:i+2])
-            if two_word in DATASET_SYMPTOMS:
-                matched_symptoms.append(two_word)
-                i += 2
-                matched = True
-                continue
+        # Exact spellings of a symptom (e.g. 'itching', 'skinrash') need no fuzzy matching
+        if word in SYMPTOM_CANONICAL_INDEX:
+            canonical_symptom = SYMPTOM_CANONICAL_INDEX[word]
+            if canonical_symptom not in matched_symptoms:
+                matched_symptoms.append(canonical_symptom)
+            i += 1
+            continue
+        
+        # Sound-alike spellings (e.g. 'feaver', 'nausia') resolve before a search of every symptom
+        phonetic_symptom = find_phonetic_match(word, threshold)
+        if phonetic_symptom is not None:
+            if phonetic_symptom not in matched_symptoms:
+                matched_symptoms.append(phonetic_symptom)
+            i += 1
+            continue
+        
+        # Check against dataset symptoms with the selected fuzzy engine
+        if fuzzy_match is not None:
+            best_match = fuzzy_match(word, threshold)
+        else:
+            best_match = find_best_fuzzy_match(word, threshold, engine)
+        
+        # Add best match if found
+        if best_match and best_match not in matched_symptoms:
+            matched_symptoms.append(best_match)
         
-        # Try matching single words with fuzzy matching
-        if not matched:
-            best_match = None
-            best_score = 0
+        i += 1
+    
+    return matched_symptoms
+
+# Inputs matched per round of the batch API; bounds memory for very large batches
+SYMPTOM_BATCH_CHUNK_SIZE = 10000
+# Distinct words sent to a worker process at a time
+SYMPTOM_BATCH_WORKER_CHUNK = 500
+
+# Function to fuzzy match a list of words (also run in worker processes by the batch API)
+def match_fuzzy_words(words, threshold, engine=None):
+    """Return the best fuzzy match (or None) of each word"""
+    return [find_best_fuzzy_match(word, threshold, engine) for word in words]
+
+# Function to match many inputs at once
+def find_matching_symptoms_batch(inputs, threshold=0.75, engine=None, processes=None):
+    """Yield find_matching_symptoms(input) for each input in order, fuzzy matching each distinct word once"""
+    engine = engine or FUZZY_MATCH_ENGINE
+    word_matches = {}
+    pending_words = {}
+    
+    # Each distinct word of the batch is fuzzy matched once
+    def batch_match(word, threshold):
+        if word not in word_matches:
+            word_matches[word] = find_best_fuzzy_match(word, threshold, engine)
+        return word_matches[word]
+    
+    def record_word(word, threshold):
+        if word not in word_matches:
+            pending_words[word] = None
+        return None
+    
+    executor = ProcessPoolExecutor(max_workers=processes) if processes and processes > 1 else None
+    
+    try:
+        inputs = iter(inputs)
+        while True:
+            chunk = list(islice(inputs, SYMPTOM_BATCH_CHUNK_SIZE))
+            if not chunk:
+                break
             
-            # Check for direct mapping first
-            word = input_symptoms[i]
-            if word in common_symptom_mappings:
-                mapped_word = common_symptom_mappings[word]
-                if mapped_word in DATASET_SYMPTOMS:
-                    if mapped_word not in matched_symptoms:
-                        matched_symptoms.append(mapped_word)
-                    i += 1
-                    continue
+            normalized_inputs = [normalize_input(text) if text and DATASET_SYMPTOMS else None for text in chunk]
+            distinct_inputs = {text for text in normalized_inputs if text is not None}
             
-            # Check against all dataset symptoms
-            for dataset_symptom in DATASET_SYMPTOMS:
-                # Calculate similarity
-                score = calculate_similarity(word, dataset_symptom)
+            # With worker processes, first collect the chunk's new words and match them in parallel
+            if executor is not None:
+                pending_words.clear()
+                for text in distinct_inputs:
+                    match_normalized_symptoms(text, threshold, engine, record_word)
                 
-                # If score is above threshold and better than current best
-                if score >= threshold and score > best_score:
-                    best_match = dataset_symptom
-                    best_score = score
+                words = list(pending_words)
+                word_chunks = [words[i:i + SYMPTOM_BATCH_WORKER_CHUNK]
+                               for i in range(0, len(words), SYMPTOM_BATCH_WORKER_CHUNK)]
+                results = executor.map(match_fuzzy_words, word_chunks, repeat(threshold), repeat(engine))
+                for chunk_words, matches in zip(word_chunks, results):
+                    word_matches.update(zip(chunk_words, matches))
             
-            # Add best match if found
-            if best_match and best_match not in matched_symptoms:
-                matched_symptoms.append(best_match)
+            input_matches = {}
+            for text in distinct_inputs:
+                input_matches[text] = match_normalized_symptoms(text, threshold, engine, batch_match)
             
-            i += 1
+            for text in normalized_inputs:
+                yield list(input_matches[text]) if text is not None else []
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+# Thresholds used by /predict: whole input first, then comma-separated symptoms
+PREDICT_MATCH_THRESHOLD = 0.7     # 70% threshold for fuzzy matching
+PREDICT_FALLBACK_THRESHOLD = 0.6  # Lower threshold for individual symptoms
+
+# Function to match /predict input with the full threshold cascade in one pass
+def find_matching_symptoms_cascade(symptoms, engine=None):
+    """Match cleaned input like /predict's three find_matching_symptoms calls, scoring each word only once"""
+    if not symptoms or not DATASET_SYMPTOMS:
+        return []
+    
+    key = (SYMPTOM_CACHE_GENERATION, 'cascade', symptoms, engine or FUZZY_MATCH_ENGINE)
+    cached = get_cached_symptoms(key)
+    if cached is not None:
+        return list(cached)
+    
+    # Best match and similarity of each word at the lowest threshold of the cascade;
+    # the best match at a higher threshold is the same symptom if its score reaches it
+    lowest_threshold = min(PREDICT_MATCH_THRESHOLD, PREDICT_FALLBACK_THRESHOLD)
+    word_scores = {}
+    # Steps often repeat the same text (e.g. a single symptom without commas)
+    step_results = {}
+    
+    def scored_match(word, threshold):
+        if word not in word_scores:
+            best = find_best_fuzzy_match(word, lowest_threshold, engine)
+            word_scores[word] = (best, calculate_similarity_bitparallel(word, best) if best else 0.0)
+        best, score = word_scores[word]
+        return best if best is not None and score >= threshold else None
     
+    def match_step(text, threshold):
+        key = (normalize_input(text), threshold)
+        if key not in step_results:
+            step_results[key] = match_normalized_symptoms(key[0], threshold, engine, scored_match)
+        return list(step_results[key])
+    
+    # Find matching symptoms in the whole input first
+    matched_symptoms = match_step(symptoms, PREDICT_MATCH_THRESHOLD)
+    
+    # If no matches found, try to split by commas for manual input
+    if not matched_symptoms:
+        user_symptoms = [s.strip() for s in symptoms.split(',')]
+        user_symptoms = [symptom.strip("[]' \"") for symptom in user_symptoms]
+        user_symptoms = [s for s in user_symptoms if s]
+        
+        for symptom in user_symptoms:
+            matched_symptoms.extend(match_step(symptom, PREDICT_FALLBACK_THRESHOLD))
+        
+        # Remove duplicates while preserving order
+        seen = set()
+        matched_symptoms = [x for x in matched_symptoms if not (x in seen or seen.add(x))]
+    
+    # For single symptoms, try to match directly with the lower threshold
+    if not matched_symptoms:
+        single_symptom = symptoms.strip().lower()
+        if single_symptom and single_symptom != "symptoms":
+            matched_symptoms = match_step(single_symptom, PREDICT_FALLBACK_THRESHOLD)
+    
+    store_cached_symptoms(key, matched_symptoms)
     return matched_symptoms
 
+# Special-case rules (single-symptom mappings, symptom clusters and disease bonuses); every
+# worker reloads the file when it changes, checking at most every SYMPTOM_RULES_CHECK_INTERVAL seconds
+SYMPTOM_RULES_PATH = os.environ.get('SYMPTOM_RULES_PATH', os.path.join(BASE_DIR, 'dataset/symptom_rules.json'))
+SYMPTOM_RULES_CHECK_INTERVAL = float(os.environ.get('SYMPTOM_RULES_CHECK_INTERVAL', 5))
+
+# Function to load the special-case symptom rules
+def load_symptom_rules(path):
+    """Load the rule file (JSON with single_symptom, clusters and bonuses lists)"""
+    with open(path) as f:
+        return json.load(f)
+
+# Function to compile the symptom rules into lookup tables and bitmasks
+def compile_symptom_rules(rules):
+    """Give every cluster group and bonus a bit and map each symptom to the bits it sets"""
+    compiled = {'single': {}, 'symptom_bits': {}, 'clusters': [], 'bonuses': []}
+    next_bit = 0
+    
+    def add_bit(symptoms):
+        nonlocal next_bit
+        bit = 1 << next_bit
+        next_bit += 1
+        for symptom in symptoms:
+            compiled['symptom_bits'][symptom] = compiled['symptom_bits'].get(symptom, 0) | bit
+        return bit
+    
+    try:
+        for rule in rules.get('single_symptom', []):
+            for symptom in rule['symptoms']:
+                # The first rule listing a symptom wins, as in the original if chain
+                compiled['single'].setdefault(str(symptom), str(rule['disease']))
+        
+        for rule in rules.get('clusters', []):
+            mask = 0
+            for group in rule['groups']:
+                mask |= add_bit([str(symptom) for symptom in group])
+            compiled['clusters'].append((mask, int(rule['min_groups']), str(rule['disease'])))
+        
+        for rule in rules.get('bonuses', []):
+            bit = add_bit([str(symptom) for symptom in rule['symptoms']])
+            compiled['bonuses'].append((bit, str(rule['disease']), float(rule['bonus'])))
+    except (KeyError, TypeError, ValueError, AttributeError) as e:
+        raise ValueError(f"Invalid symptom rules: {e!r}")
+    
+    return compiled
+
+# Function to identify the current version of a rule file
+def get_symptom_rules_stamp(path=None):
+    """Return (path, modification time in ns, size) of the rule file, or None if it cannot be read"""
+    path = path or SYMPTOM_RULES_PATH
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (path, stat.st_mtime_ns, stat.st_size)
+
+# Compiled special-case rules used by predict_disease_from_symptoms and the scoring engines,
+# and the stamp of the file they were loaded from
+SYMPTOM_RULES_STAMP = get_symptom_rules_stamp()
+SYMPTOM_RULES = compile_symptom_rules(load_symptom_rules(SYMPTOM_RULES_PATH))
+SYMPTOM_RULES_NEXT_CHECK = time.monotonic() + SYMPTOM_RULES_CHECK_INTERVAL
+
+# Function to reload the symptom rules without restarting
+def reload_symptom_rules(path=None):
+    """Load and compile the rule file, then swap it in (the old rules stay if it is invalid)"""
+    global SYMPTOM_RULES, SYMPTOM_RULES_STAMP
+    
+    # Taken before reading, so an edit made during the read is picked up by the next check
+    stamp = get_symptom_rules_stamp(path)
+    try:
+        compiled = compile_symptom_rules(load_symptom_rules(path or SYMPTOM_RULES_PATH))
+    except (OSError, json.JSONDecodeError) as e:
+        raise ValueError(f"Cannot load symptom rules: {e}")
+    SYMPTOM_RULES = compiled
+    SYMPTOM_RULES_STAMP = stamp
+    return {'single_symptom': len(compiled['single']), 'clusters': len(compiled['clusters']),
+            'bonuses': len(compiled['bonuses'])}
+
+# Function to pick up edits to the rule file in this worker
+def refresh_symptom_rules(now=None):
+    """Reload the rule file if it changed since it was loaded, checking at most every
+    SYMPTOM_RULES_CHECK_INTERVAL seconds; returns True when new rules were swapped in"""
+    global SYMPTOM_RULES_NEXT_CHECK, SYMPTOM_RULES_STAMP
+    
+    now = time.monotonic() if now is None else now
+    if now < SYMPTOM_RULES_NEXT_CHECK:
+        return False
+    SYMPTOM_RULES_NEXT_CHECK = now + SYMPTOM_RULES_CHECK_INTERVAL
+    
+    stamp = get_symptom_rules_stamp()
+    if stamp is None or stamp == SYMPTOM_RULES_STAMP:
+        return False
+    try:
+        reload_symptom_rules()
+    except ValueError as e:
+        # Keep the current rules until the file changes again
+        SYMPTOM_RULES_STAMP = stamp
+        app.logger.warning("Symptom rules not reloaded: %s", e)
+        return False
+    return True
+
+# Function to apply the single-symptom and cluster rules
+def apply_symptom_rules(matched_symptoms, rules=None, rule_mask=None):
+    """Return the disease a special-case rule maps the matched symptoms to, or None"""
+    rules = rules or SYMPTOM_RULES
+    
+    # A single symptom mapped directly to a disease (e.g. headache -> Sinusitis)
+    if len(matched_symptoms) == 1 and matched_symptoms[0] in rules['single']:
+        return rules['single'][matched_symptoms[0]]
+    
+    # Symptom clusters: enough of the cluster's groups present (e.g. any 2 or more
+    # of fever, cold, cough and headache -> Viral Infection)
+    if rule_mask is None:
+        rule_mask = get_rule_mask(matched_symptoms, rules)
+    for mask, min_groups, disease in rules['clusters']:
+        if (rule_mask & mask).bit_count() >= min_groups:
+            return disease
+    return None
+
+# Function to compute the rule bits set by the matched symptoms
+def get_rule_mask(matched_symptoms, rules=None):
+    """OR together the cluster-group and bonus bits of the matched symptoms"""
+    symptom_bits = (rules or SYMPTOM_RULES)['symptom_bits']
+    mask = 0
+    for symptom in matched_symptoms:
+        mask |= symptom_bits.get(symptom, 0)
+    return mask
+
+# Function to build the disease x symptom incidence matrix
+def build_disease_incidence(disease_symptoms):
+    """Build a CSR matrix with a 1 for each (disease, symptom) pair plus each disease's symptom count"""
+    # Rows follow the dictionary order so ties resolve like the per-disease loop
+    diseases = [disease for disease, symptoms in disease_symptoms.items() if symptoms]
+    symptom_columns = {}
+    rows, columns = [], []
+    
+    for row, disease in enumerate(diseases):
+        for symptom in disease_symptoms[disease]:
+            rows.append(row)
+            columns.append(symptom_columns.setdefault(symptom, len(symptom_columns)))
+    
+    matrix = csr_matrix((np.ones(len(rows)), (rows, columns)), shape=(len(diseases), len(symptom_columns)))
+    symptom_counts = np.array([len(disease_symptoms[disease]) for disease in diseases], dtype=np.float64)
+    
+    return {'diseases': diseases, 'disease_rows': {disease: row for row, disease in enumerate(diseases)},
+            'symptom_columns': symptom_columns, 'matrix': matrix, 'symptom_counts': symptom_counts}
+
+# Function to build the structures used to score diseases
+def build_disease_scoring_indexes(naive_bayes=None):
+    """Build the disease scoring structures from DISEASE_SYMPTOMS (after loading from CSV or the prebuilt index);
+    naive_bayes is the model stored in the prebuilt index, otherwise it is built from Training.csv"""
+    global DISEASE_INCIDENCE, DISEASE_BITSETS, DISEASE_POSTINGS, DISEASE_SEVERITY, NAIVE_BAYES
+    
+    DISEASE_INCIDENCE = build_disease_incidence(DISEASE_SYMPTOMS)
+    DISEASE_BITSETS = build_disease_bitsets(DISEASE_INCIDENCE)
+    DISEASE_POSTINGS = build_disease_postings(SYMPTOM_TO_DISEASES, DISEASE_INCIDENCE)
+    DISEASE_SEVERITY = build_disease_severity(DISEASE_INCIDENCE, SYMPTOM_SEVERITY)
+    NAIVE_BAYES = naive_bayes or build_naive_bayes(load_dataset('training_data'), DISEASE_INCIDENCE)
+
+# Symptoms the severity file does not list count with the lowest weight
+SEVERITY_MIN_WEIGHT = 1
+
+# Function to build the severity-weighted incidence matrix
+def build_disease_severity(incidence, severity):
+    """Weight each incidence column by its symptom's severity and precompute every disease's weight total"""
+    # symptom_columns keeps its keys in column order
+    weights = np.array([max(severity.get(symptom, 0), SEVERITY_MIN_WEIGHT) for symptom in incidence['symptom_columns']],
+                       dtype=np.float64)
+    matrix = csr_matrix(incidence['matrix'].multiply(weights.reshape(1, -1)))
+    return {'weights': weights, 'matrix': matrix, 'totals': np.asarray(matrix.sum(axis=1)).ravel()}
+
+# Laplace smoothing of the Naive Bayes symptom likelihoods
+NAIVE_BAYES_ALPHA = 1.0
+
+# Function to precompute the Bernoulli Naive Bayes model from the training matrix
+def build_naive_bayes(training, incidence, alpha=NAIVE_BAYES_ALPHA):
+    """Return the per-symptom log-likelihood ratios (symptoms x diseases) and each disease's log joint
+    probability with no symptom present, with diseases in incidence row order"""
+    features = training.drop(columns='prognosis')
+    grouped = features.groupby(training['prognosis'])
+    # Diseases without training rows get a zero prior, so they are never predicted
+    present = grouped.sum().reindex(incidence['diseases']).fillna(0).to_numpy(dtype=np.float64)
+    class_counts = grouped.size().reindex(incidence['diseases']).fillna(0).to_numpy(dtype=np.float64)
+    
+    # Smoothed probability of each symptom given each disease
+    probabilities = (present + alpha) / (class_counts[:, None] + 2 * alpha)
+    log_present, log_absent = np.log(probabilities), np.log1p(-probabilities)
+    with np.errstate(divide='ignore'):
+        log_prior = np.log(class_counts / class_counts.sum())
+    
+    return {'symptom_columns': {symptom: column for column, symptom in enumerate(features.columns)},
+            'log_likelihood': np.ascontiguousarray((log_present - log_absent).T),
+            'base': log_prior + log_absent.sum(axis=1)}
+
+# Function to build the posting lists used for candidate generation
+def build_disease_postings(symptom_to_diseases, incidence):
+    """Map each symptom to the sorted incidence rows of its diseases"""
+    disease_rows = incidence['disease_rows']
+    postings = {}
+    for symptom, diseases in symptom_to_diseases.items():
+        rows = sorted(disease_rows[disease] for disease in diseases if disease in disease_rows)
+        if rows:
+            postings[symptom] = np.array(rows, dtype=np.intp)
+    
+    return {'postings': postings}
+
+# Function to weight match counts by the disease and user symptom counts
+def weight_disease_scores(matching_count, symptom_counts, matched_count):
+    """Return the weighted coverage score (favoring diseases that explain more user symptoms)"""
+    # How many of the disease's symptoms are present, and how many of the user's symptoms it explains
+    match_percentage = matching_count / symptom_counts
+    user_match_percentage = matching_count / matched_count
+    return (match_percentage * 0.3) + (user_match_percentage * 0.7)
+
+# Function to compute the bonus of every disease for the matched symptoms
+def get_disease_bonuses(matched_symptoms, incidence):
+    """Return the rule-file bonus of every incidence row as a NumPy array"""
+    common_disease_bonus = np.zeros(len(incidence['diseases']))
+    for row, bonus in get_matched_bonuses(matched_symptoms, incidence).items():
+        common_disease_bonus[row] = bonus
+    return common_disease_bonus
+
+# Function to find the disease bonuses triggered by the matched symptoms
+def get_matched_bonuses(matched_symptoms, incidence):
+    """Return {incidence row: bonus} for the bonus rules whose bit the matched symptoms set"""
+    rules = SYMPTOM_RULES
+    rule_mask = get_rule_mask(matched_symptoms, rules)
+    bonuses = {}
+    if rule_mask:
+        for bit, disease, bonus in rules['bonuses']:
+            row = incidence['disease_rows'].get(disease)
+            # A later rule for the same disease replaces the earlier bonus
+            if rule_mask & bit and row is not None:
+                bonuses[row] = bonus
+    return bonuses
+
+# Function to turn per-disease match counts into combined scores
+def combine_disease_scores(matching_count, matched_symptoms, incidence):
+    """Weight the match counts of every disease into combined scores (-inf where no symptom matches)"""
+    scores = weight_disease_scores(matching_count, incidence['symptom_counts'], len(matched_symptoms))
+    scores += get_disease_bonuses(matched_symptoms, incidence)
+    scores[matching_count == 0] = -np.inf
+    return scores
+
+# Function to score every disease against the matched symptoms at once
+def score_diseases(matched_symptoms, incidence=None):
+    """Return the combined score of every incidence row as a NumPy array (-inf where no symptom matches)"""
+    incidence = incidence or DISEASE_INCIDENCE
+    
+    # Count each matched symptom (repeats count again, as in the per-disease loop)
+    query = np.zeros(len(incidence['symptom_columns']))
+    for symptom in matched_symptoms:
+        column = incidence['symptom_columns'].get(symptom)
+        if column is not None:
+            query[column] += 1
+    
+    # One sparse product counts the matching symptoms of every disease
+    matching_count = incidence['matrix'] @ query
+    return combine_disease_scores(matching_count, matched_symptoms, incidence)
+
+# Function to score every disease by severity-weighted symptom overlap
+def score_diseases_severity(matched_symptoms, incidence=None, severity=None):
+    """Like score_diseases, with each symptom counting its severity weight instead of 1"""
+    incidence = incidence or DISEASE_INCIDENCE
+    severity = severity or DISEASE_SEVERITY
+    
+    query = np.zeros(len(incidence['symptom_columns']))
+    unknown_count = 0
+    for symptom in matched_symptoms:
+        column = incidence['symptom_columns'].get(symptom)
+        if column is not None:
+            query[column] += 1
+        else:
+            unknown_count += 1
+    matched_weight = query @ severity['weights'] + unknown_count * SEVERITY_MIN_WEIGHT
+    
+    # One sparse product sums the weights of the matching symptoms of every disease
+    matching_weight = severity['matrix'] @ query
+    scores = weight_disease_scores(matching_weight, severity['totals'], matched_weight)
+    scores += get_disease_bonuses(matched_symptoms, incidence)
+    scores[matching_weight == 0] = -np.inf
+    return scores
+
+# Function to score every disease with the Bernoulli Naive Bayes model
+def score_diseases_naive_bayes(matched_symptoms, naive_bayes=None):
+    """Return each disease's posterior probability given the matched symptoms (present) and every other
+    Training.csv symptom (absent); -inf everywhere when no matched symptom is a Training.csv column"""
+    naive_bayes = naive_bayes or NAIVE_BAYES
+    columns = naive_bayes['symptom_columns']
+    
+    present = np.zeros(len(columns))
+    for symptom in matched_symptoms:
+        if symptom in columns:
+            present[columns[symptom]] = 1
+    if not present.any():
+        return np.full(len(naive_bayes['base']), -np.inf)
+    
+    # One matrix-vector product gives the log joint probability of every disease
+    return softmax(naive_bayes['base'] + present @ naive_bayes['log_likelihood'])
+
+# Bits set in each byte value, for NumPy versions without np.bitwise_count
+POPCOUNT_TABLE = np.array([bin(value).count('1') for value in range(256)], dtype=np.uint8)
+
+# Function to build the bitset encoding of the disease profiles
+def build_disease_bitsets(incidence):
+    """Encode each incidence row as an int bitmask (bit = symptom column) and as packed uint64 words"""
+    masks = [0] * len(incidence['diseases'])
+    matrix = incidence['matrix']
+    for row in range(len(masks)):
+        for column in matrix.indices[matrix.indptr[row]:matrix.indptr[row + 1]]:
+            masks[row] |= 1 << int(column)
+    
+    # Little-endian words so bit c of a mask is bit c % 64 of word c // 64
+    words = max(1, -(-len(incidence['symptom_columns']) // 64))
+    packed = np.frombuffer(b''.join(mask.to_bytes(words * 8, 'little') for mask in masks), dtype='<u8')
+    
+    # Stored word-major (words x diseases) so the words of a query are contiguous rows
+    packed = np.ascontiguousarray(packed.reshape(len(masks), words).T)
+    return {'masks': masks, 'words': words, 'packed': packed}
+
+# Function to encode matched symptoms as a bitmask
+def get_symptom_mask(matched_symptoms, incidence):
+    """Return the bitmask of the matched symptoms (unknown symptoms are ignored)"""
+    mask = 0
+    for symptom in matched_symptoms:
+        column = incidence['symptom_columns'].get(symptom)
+        if column is not None:
+            mask |= 1 << column
+    return mask
+
+# Function to count set bits in each column of a uint64 matrix
+def popcount_columns(words):
+    """Return the number of set bits in each column of a 2D uint64 array"""
+    if hasattr(np, 'bitwise_count'):
+        return np.bitwise_count(words).sum(axis=0, dtype=np.int64)
+    # Each uint64 becomes 8 bytes along the last axis
+    counts = POPCOUNT_TABLE[np.ascontiguousarray(words).view(np.uint8)].reshape(words.shape[0], words.shape[1], 8)
+    return counts.sum(axis=(0, 2), dtype=np.int64)
+
+# Function to score every disease with int bitmasks
+def score_diseases_bitset(matched_symptoms, incidence=None, bitsets=None):
+    """Like score_diseases, counting matches as (profile & mask).bit_count() (matched symptoms form a set)"""
+    incidence = incidence or DISEASE_INCIDENCE
+    bitsets = bitsets or DISEASE_BITSETS
+    
+    mask = get_symptom_mask(matched_symptoms, incidence)
+    matching_count = np.array([(profile & mask).bit_count() for profile in bitsets['masks']], dtype=np.float64)
+    return combine_disease_scores(matching_count, matched_symptoms, incidence)
+
+# Function to score every disease with a vectorized popcount
+def score_diseases_popcount(matched_symptoms, incidence=None, bitsets=None):
+    """Like score_diseases, counting matches by popcount over the packed profiles (matched symptoms form a set)"""
+    incidence = incidence or DISEASE_INCIDENCE
+    bitsets = bitsets or DISEASE_BITSETS
+    
+    mask = get_symptom_mask(matched_symptoms, incidence)
+    query = np.frombuffer(mask.to_bytes(bitsets['words'] * 8, 'little'), dtype='<u8')
+    
+    # Only the words holding a matched symptom can contribute
+    used = np.flatnonzero(query)
+    matching_count = popcount_columns(bitsets['packed'][used] & query[used, None]).astype(np.float64)
+    return combine_disease_scores(matching_count, matched_symptoms, incidence)
+
+# Function to score only the diseases reachable from the matched symptoms
+def score_candidate_diseases(matched_symptoms, incidence=None, postings=None):
+    """Return the sorted candidate incidence rows and their combined scores, found through the posting lists"""
+    incidence = incidence or DISEASE_INCIDENCE
+    postings = postings or DISEASE_POSTINGS
+    
+    # Each occurrence of a symptom adds its posting list (repeats count again, as in score_diseases)
+    lists = [postings['postings'][symptom] for symptom in matched_symptoms if symptom in postings['postings']]
+    if not lists:
+        return np.empty(0, dtype=np.intp), np.empty(0)
+    rows, matching_count = np.unique(np.concatenate(lists), return_counts=True)
+    return rows, score_candidate_rows(rows, matching_count, matched_symptoms, incidence)
+
+# Function to score candidate diseases from their matching symptom counts
+def score_candidate_rows(rows, matching_count, matched_symptoms, incidence):
+    """Return the combined scores of the sorted candidate rows given how many matched symptoms each has"""
+    scores = weight_disease_scores(matching_count.astype(np.float64), incidence['symptom_counts'][rows],
+                                   len(matched_symptoms))
+    
+    # Bonus rules only touch candidates; other rows have no matching symptom
+    for row, bonus in get_matched_bonuses(matched_symptoms, incidence).items():
+        position = np.searchsorted(rows, row)
+        if position < len(rows) and rows[position] == row:
+            scores[position] += bonus
+    return scores
+
+# Disease scoring engines selectable through DISEASE_SCORING_ENGINE, each returning the scored
+# incidence rows (None for all rows) and their scores; the bitset and Naive Bayes engines treat
+# the matched symptoms as a set (/predict always passes distinct symptoms)
+DISEASE_SCORING_ENGINES = {
+    'inverted': lambda matched_symptoms: score_candidate_diseases(matched_symptoms),
+    'matrix': lambda matched_symptoms: (None, score_diseases(matched_symptoms)),
+    'bitset': lambda matched_symptoms: (None, score_diseases_bitset(matched_symptoms)),
+    'popcount': lambda matched_symptoms: (None, score_diseases_popcount(matched_symptoms)),
+    'severity': lambda matched_symptoms: (None, score_diseases_severity(matched_symptoms)),
+    'naive_bayes': lambda matched_symptoms: (None, score_diseases_naive_bayes(matched_symptoms)),
+}
+DISEASE_SCORING_ENGINE = 'inverted'
+
 # Function to predict disease based on symptoms with enhanced scoring
-def predict_disease_from_symptoms(matched_symptoms):
+def predict_disease_from_symptoms(matched_symptoms, engine=None):
     """Predict disease based on matched symptoms using enhanced scoring mechanism"""
     if not matched_symptoms or not DISEASE_SYMPTOMS:
         return None
     
-    # Special rule-based mappings as per requirements
-    fever_symptoms = {'fever', 'high_fever'}
-    cold_symptoms = {'cold', 'chills'}
-    cough_symptoms = {'cough'}
-    headache_symptoms = {'headache'}
-    
-    # Check for specific symptom mappings
-    if len(matched_symptoms) == 1:
-        symptom = matched_symptoms[0]
-        if symptom in fever_symptoms:
-            return 'Viral Infection'
-        elif symptom in cold_symptoms:
-            return 'Common Cold'
-        elif symptom in cough_symptoms:
-            return 'Viral Respiratory Infection'
-        elif symptom in headache_symptoms:
-            return 'Sinusitis'  # Using Sinusitis for sinus as per requirement
-    
-    # Check for cluster of symptoms (fever, cold, cough, headache)
-    # If any 2 or more of these symptoms are present, return Viral Infection
-    fever_present = any(symptom in fever_symptoms for symptom in matched_symptoms)
-    cold_present = any(symptom in cold_symptoms for symptom in matched_symptoms)
-    cough_present = any(symptom in cough_symptoms for symptom in matched_symptoms)
-    headache_present = any(symptom in headache_symptoms for symptom in matched_symptoms)
-    
-    # Count how many of the key symptoms are present
-    key_symptoms_present = sum([fever_present, cold_present, cough_present, headache_present])
-    
-    # If 2 or more key symptoms are present, return Viral Infection
-    if key_symptoms_present >= 2:
-        return 'Viral Infection'
-    
-    # Special handling for common symptoms that are often misclassified
-    common_symptom_mapping = {
-        'fever': 'Viral Infection',
-        'high_fever': 'Viral Infection',
-        'cold': 'Common Cold',
-        'chills': 'Common Cold',
-        'cough': 'Viral Respiratory Infection',
-        'headache': 'Migraine'
+    # Special rule-based mappings from the rule file (see SYMPTOM_RULES_PATH)
+    rule_disease = apply_symptom_rules(matched_symptoms)
+    if rule_disease:
+        return rule_disease
+    
+    # Score the diseases in one vectorized pass with the selected engine
+    engine = engine or DISEASE_SCORING_ENGINE
+    if engine not in DISEASE_SCORING_ENGINES:
+        raise ValueError(f"Unknown disease scoring engine: {engine}")
+    if not DISEASE_INCIDENCE.get('diseases'):
+        return None
+    rows, scores = DISEASE_SCORING_ENGINES[engine](matched_symptoms)
+    if not len(scores):
+        return None
+    
+    # Return disease with highest score (argmax keeps the first of equal scores; rows are sorted)
+    best = int(np.argmax(scores))
+    # Only return if score is above minimum threshold
+    if scores[best] > 0.1:
+        return DISEASE_INCIDENCE['diseases'][best if rows is None else int(rows[best])]
+    
+    return None
+
+# Number of matched-symptom lists scored together by predict_diseases_batch
+DISEASE_BATCH_CHUNK_SIZE = 10000
+
+# Function to score a chunk of matched-symptom lists with one sparse matrix product
+def score_disease_chunk(chunk, rule_masks, transposed, denominators, incidence, severity=None, rules=None):
+    """Return the best incidence row (-1 when no disease matches) and its score for each matched-symptom list"""
+    rules = rules or SYMPTOM_RULES
+    columns = incidence['symptom_columns']
+    lengths = np.fromiter(map(len, chunk), dtype=np.intp, count=len(chunk))
+    symptom_columns = np.fromiter((columns.get(symptom, -1) for matched_symptoms in chunk for symptom in matched_symptoms),
+                                  dtype=np.intp, count=int(lengths.sum()))
+    symptom_lists = np.repeat(np.arange(len(chunk)), lengths)
+    known = symptom_columns >= 0
+    
+    # N x S indicator matrix (repeated symptoms are summed, so they count again as in score_diseases)
+    query = csr_matrix((np.ones(int(known.sum())), (symptom_lists[known], symptom_columns[known])),
+                       shape=(len(chunk), len(columns)))
+    if severity is not None:
+        unknown_count = np.bincount(symptom_lists[~known], minlength=len(chunk))
+        matched_total = query @ severity['weights'] + unknown_count * SEVERITY_MIN_WEIGHT
+    else:
+        matched_total = lengths.astype(np.float64)
+    
+    # N x D matches of every list against every disease, kept sparse so memory follows the candidates
+    product = (query @ transposed).tocsr()
+    row_lengths = np.diff(product.indptr)
+    entry_lists = np.repeat(np.arange(len(chunk)), row_lengths)
+    scores = weight_disease_scores(product.data, denominators[product.indices], matched_total[entry_lists])
+    
+    # Bonus rules whose bit a list sets; a later rule for the same disease replaces the earlier bonus
+    bonuses = np.zeros(len(scores))
+    masks = np.array(rule_masks, dtype=object)
+    for bit, disease, bonus in rules['bonuses']:
+        row = incidence['disease_rows'].get(disease)
+        if row is not None:
+            lists_with_bit = (masks & bit).astype(bool)
+            bonuses[lists_with_bit[entry_lists] & (product.indices == row)] = bonus
+    scores += bonuses
+    
+    # Best score of each list; equal scores go to the lowest row, as argmax does
+    best_rows = np.full(len(chunk), -1)
+    best_scores = np.full(len(chunk), -np.inf)
+    matched_lists = np.flatnonzero(row_lengths)
+    if len(matched_lists):
+        starts = product.indptr[matched_lists]
+        best_scores[matched_lists] = np.maximum.reduceat(scores, starts)
+        is_best = scores == np.repeat(best_scores[matched_lists], row_lengths[matched_lists])
+        best_rows[matched_lists] = np.minimum.reduceat(np.where(is_best, product.indices, len(incidence['diseases'])), starts)
+    return best_rows, best_scores
+
+# Function to score a chunk of matched-symptom lists with the Naive Bayes model
+def score_naive_bayes_chunk(chunk, naive_bayes):
+    """Return the most probable incidence row (-1 when no symptom is in Training.csv) and its posterior for each list"""
+    columns = naive_bayes['symptom_columns']
+    lengths = np.fromiter(map(len, chunk), dtype=np.intp, count=len(chunk))
+    symptom_columns = np.fromiter((columns.get(symptom, -1) for matched_symptoms in chunk for symptom in matched_symptoms),
+                                  dtype=np.intp, count=int(lengths.sum()))
+    symptom_lists = np.repeat(np.arange(len(chunk)), lengths)
+    known = symptom_columns >= 0
+    
+    # N x S presence matrix (repeated symptoms are present once)
+    present = csr_matrix((np.ones(int(known.sum())), (symptom_lists[known], symptom_columns[known])),
+                         shape=(len(chunk), len(columns)))
+    present.sum_duplicates()
+    present.data[:] = 1
+    log_joint = naive_bayes['base'] + present @ naive_bayes['log_likelihood']
+    
+    # The posterior of the best disease is 1 / sum(exp(log joint - best log joint))
+    best_rows = np.argmax(log_joint, axis=1)
+    best_log_joint = log_joint[np.arange(len(chunk)), best_rows]
+    best_scores = 1 / np.exp(log_joint - best_log_joint[:, None]).sum(axis=1)
+    best_rows[np.diff(present.indptr) == 0] = -1
+    return best_rows, best_scores
+
+# Function to predict diseases for many matched-symptom lists
+def predict_diseases_batch(matched_lists, engine=None, chunk_size=DISEASE_BATCH_CHUNK_SIZE):
+    """Yield (disease, score) for each list in order, with the disease predict_disease_from_symptoms returns
+    (score is None when a special-case rule decided, or no disease matched)"""
+    engine = engine or DISEASE_SCORING_ENGINE
+    if engine not in DISEASE_SCORING_ENGINES:
+        raise ValueError(f"Unknown disease scoring engine: {engine}")
+    incidence = DISEASE_INCIDENCE
+    rules = SYMPTOM_RULES
+    
+    # The severity engine weights the symptoms, Naive Bayes has its own model; every other
+    # engine counts them like score_diseases
+    if engine == 'naive_bayes':
+        transposed, denominators, severity = None, None, None
+    elif engine == 'severity':
+        severity = DISEASE_SEVERITY
+        transposed, denominators = severity['matrix'].T.tocsr(), severity['totals']
+    else:
+        severity = None
+        transposed, denominators = incidence['matrix'].T.tocsr(), incidence['symptom_counts']
+    
+    matched_lists = iter(matched_lists)
+    while True:
+        chunk = list(islice(matched_lists, chunk_size))
+        if not chunk:
+            break
+        
+        # Empty lists and special-case rules are decided per list
+        results = [(None, None)] * len(chunk)
+        to_score, rule_masks = [], []
+        for position, matched_symptoms in enumerate(chunk):
+            if not matched_symptoms or not DISEASE_SYMPTOMS:
+                continue
+            rule_mask = get_rule_mask(matched_symptoms, rules)
+            rule_disease = apply_symptom_rules(matched_symptoms, rules, rule_mask)
+            if rule_disease:
+                results[position] = (rule_disease, None)
+            else:
+                to_score.append(position)
+                rule_masks.append(rule_mask)
+        
+        if to_score and incidence.get('diseases'):
+            if engine == 'naive_bayes':
+                best_rows, best_scores = score_naive_bayes_chunk([chunk[position] for position in to_score], NAIVE_BAYES)
+            else:
+                best_rows, best_scores = score_disease_chunk([chunk[position] for position in to_score], rule_masks,
+                                                             transposed, denominators, incidence, severity, rules)
+            for position, row, score in zip(to_score, best_rows.tolist(), best_scores.tolist()):
+                if row >= 0:
+                    # Only return a disease if its score is above the minimum threshold
+                    results[position] = (incidence['diseases'][row] if score > 0.1 else None, score)
+        
+        yield from results
+
+# Scoring sessions for symptoms entered one at a time (e.g. continuous speech input), kept in
+# least recently used order; each holds running match counts per candidate disease
+SCORING_SESSION_TTL = float(os.environ.get('SCORING_SESSION_TTL', 1800))
+SCORING_SESSION_LIMIT = int(os.environ.get('SCORING_SESSION_LIMIT', 10000))
+SCORING_SESSIONS = OrderedDict()  # session id -> {'symptoms', 'counts', 'postings', 'incidence', 'lock', 'expires_at'}
+SCORING_SESSION_LOCK = threading.Lock()  # guards SCORING_SESSIONS only; each session has its own lock
+NO_POSTINGS = np.empty(0, dtype=np.intp)
+
+# Function to drop expired scoring sessions
+def evict_scoring_sessions(now):
+    """Remove expired sessions and those beyond SCORING_SESSION_LIMIT (caller holds the lock)"""
+    # Every access pushes a session to the end with a later expiry, so expired sessions are at the front
+    while SCORING_SESSIONS:
+        session = next(iter(SCORING_SESSIONS.values()))
+        if session['expires_at'] > now and len(SCORING_SESSIONS) <= SCORING_SESSION_LIMIT:
+            break
+        SCORING_SESSIONS.popitem(last=False)
+
+# Function to add a symptom to a scoring session
+def add_session_symptom(session, symptom):
+    """Add one to the match count of each disease in the symptom's posting list (caller holds the session lock)"""
+    if symptom in session['symptoms']:
+        return False
+    session['symptoms'][symptom] = None
+    
+    counts = session['counts']
+    for row in session['postings']['postings'].get(symptom, NO_POSTINGS).tolist():
+        counts[row] = counts.get(row, 0) + 1
+    return True
+
+# Function to remove a symptom from a scoring session
+def remove_session_symptom(session, symptom):
+    """Subtract one from the match counts of the symptom's posting list, dropping diseases no symptom reaches"""
+    if symptom not in session['symptoms']:
+        return False
+    del session['symptoms'][symptom]
+    
+    counts = session['counts']
+    for row in session['postings']['postings'].get(symptom, NO_POSTINGS).tolist():
+        if counts[row] == 1:
+            del counts[row]
+        else:
+            counts[row] -= 1
+    return True
+
+# Function to copy what scoring needs out of a scoring session
+def snapshot_scoring_session(session):
+    """Return the session's symptoms, its candidate rows (sorted), their match counts and the incidence
+    they refer to (caller holds the session lock)"""
+    counts = session['counts']
+    rows = np.fromiter(counts, dtype=np.intp, count=len(counts))
+    matching_count = np.fromiter(counts.values(), dtype=np.int64, count=len(counts))
+    order = np.argsort(rows)
+    return list(session['symptoms']), rows[order], matching_count[order], session['incidence']
+
+# Function to score a scoring session from its running match counts
+def score_scoring_session(matched_symptoms, rows, matching_count, incidence):
+    """Return the symptoms with the disease and score predict_disease_from_symptoms would give them with a
+    counting engine (score is None when a special-case rule decided, or no disease matched)"""
+    result = {'symptoms': matched_symptoms, 'disease': None, 'score': None}
+    if not matched_symptoms or not DISEASE_SYMPTOMS:
+        return result
+    
+    rule_disease = apply_symptom_rules(matched_symptoms)
+    if rule_disease:
+        result['disease'] = rule_disease
+        return result
+    
+    if not len(rows) or not incidence.get('diseases'):
+        return result
+    scores = score_candidate_rows(rows, matching_count, matched_symptoms, incidence)
+    
+    # argmax keeps the lowest row of equal scores, as predict_disease_from_symptoms does
+    best = int(np.argmax(scores))
+    result['score'] = float(scores[best])
+    if scores[best] > 0.1:
+        result['disease'] = incidence['diseases'][int(rows[best])]
+    return result
+
+# Function to count a session's symptoms against the current scoring indexes
+def recount_scoring_session(session, symptoms):
+    """Reset the session to the current posting lists and add the symptoms (caller holds the session lock)"""
+    session.update(symptoms={}, counts={}, postings=DISEASE_POSTINGS, incidence=DISEASE_INCIDENCE)
+    for symptom in symptoms:
+        add_session_symptom(session, symptom)
+
+# Function to start a scoring session
+def create_scoring_session(symptoms=()):
+    """Create a session holding the given symptoms and return its id"""
+    session_id = secrets.token_hex(16)
+    now = time.monotonic()
+    session = {'lock': threading.Lock(), 'expires_at': now + SCORING_SESSION_TTL}
+    recount_scoring_session(session, symptoms)
+    
+    with SCORING_SESSION_LOCK:
+        SCORING_SESSIONS[session_id] = session
+        evict_scoring_sessions(now)
+    return session_id
+
+# Function to add and remove symptoms of a scoring session
+def update_scoring_session(session_id, add=(), remove=()):
+    """Apply the changes in O(posting list) per symptom and return the rescored session, or None if it expired"""
+    now = time.monotonic()
+    with SCORING_SESSION_LOCK:
+        evict_scoring_sessions(now)
+        session = SCORING_SESSIONS.get(session_id)
+        if session is None:
+            return None
+        session['expires_at'] = now + SCORING_SESSION_TTL
+        SCORING_SESSIONS.move_to_end(session_id)
+    
+    # Only this session is locked while its counts change; it is scored with no lock held
+    with session['lock']:
+        # Rebuilt scoring indexes renumber the diseases, so recount the session's symptoms once
+        if session['postings'] is not DISEASE_POSTINGS:
+            recount_scoring_session(session, list(session['symptoms']))
+        
+        for symptom in remove:
+            remove_session_symptom(session, symptom)
+        for symptom in add:
+            add_session_symptom(session, symptom)
+        snapshot = snapshot_scoring_session(session)
+    return score_scoring_session(*snapshot)
+
+# Function to end a scoring session
+def delete_scoring_session(session_id):
+    """Remove a session, returning False if it did not exist or had expired"""
+    with SCORING_SESSION_LOCK:
+        evict_scoring_sessions(time.monotonic())
+        return SCORING_SESSIONS.pop(session_id, None) is not None
+
+# Function to rank diseases with the selected scoring engine
+def rank_diseases(matched_symptoms, k=DIFFERENTIAL_DEFAULT_RESULTS, engine=None):
+    """Return the k best-scoring diseases sharing a symptom with matched_symptoms, best first, with the engine's
+    raw scores (heuristic match scores, or Naive Bayes posteriors); they are not calibrated probabilities"""
+    engine = engine or DISEASE_SCORING_ENGINE
+    if engine not in DISEASE_SCORING_ENGINES:
+        raise ValueError(f"Unknown disease scoring engine: {engine}")
+    if not matched_symptoms or not DISEASE_INCIDENCE.get('diseases'):
+        return []
+    rows, scores = DISEASE_SCORING_ENGINES[engine](matched_symptoms)
+    
+    # Dense engines score every disease, with -inf where no symptom matches
+    if rows is None:
+        rows = np.flatnonzero(scores > -np.inf)
+        scores = scores[rows]
+    if not len(scores):
+        return []
+    
+    best = top_k_indices(scores, k)
+    return [{'disease': DISEASE_INCIDENCE['diseases'][row], 'score': score}
+            for row, score in zip(rows[best].tolist(), scores[best].tolist())]
+
+# Prebuilt symptom index written by build_symptom_index.py and memory-mapped at startup
+SYMPTOM_INDEX_PATH = os.environ.get('SYMPTOM_INDEX_PATH', os.path.join(BASE_DIR, 'models/symptom_index.bin'))
+SYMPTOM_INDEX_MAGIC = b'SYMPTIDX'
+# Bump when the structures stored in the index change, so old files are rebuilt
+SYMPTOM_INDEX_VERSION = 2
+SYMPTOM_INDEX_ALIGNMENT = 64
+# Dataset files the index is built from; a changed file makes the index stale
+SYMPTOM_INDEX_SOURCES = ['dataset/symtoms_df.csv', 'dataset/Symptom-severity.csv', 'dataset/speech_corrections.csv',
+                         'dataset/Training.csv']
+# Code the stored structures are built with; editing any of it (or the settings hashed
+# by get_symptom_index_settings) also makes the index stale
+SYMPTOM_INDEX_FUNCTIONS = [
+    initialize_dataset_mappings, normalize_input, canonical_symptom_key, get_spacing_variants, build_canonical_index,
+    phonetic_key, get_phonetic_vocabulary, build_phonetic_index, get_correction_vocabulary, generate_deletes,
+    build_symspell_index, get_ngrams, build_ngram_index, build_flat_postings, build_bk_tree, myers_distance,
+    build_char_matrix, build_tfidf_index, get_symptom_phrases, build_phrase_automaton, load_symptom_severity,
+    get_suggestion_entries, suggestion_rank, build_suggestion_trie, build_naive_bayes,
+]
+# Flat postings stored in the index as arrays (their term lists are stored with the objects)
+SYMPTOM_INDEX_POSTINGS = {'symspell': ('keys', 'indptr', 'ids'), 'ngram': ('keys', 'indptr', 'ids', 'counts')}
+
+# Function to fingerprint the dataset files behind the symptom index
+def get_symptom_index_sources():
+    """Return the SHA-256 of each source file of the symptom index"""
+    sources = {}
+    for name in SYMPTOM_INDEX_SOURCES:
+        with open(os.path.join(BASE_DIR, name), 'rb') as f:
+            sources[name] = hashlib.sha256(f.read()).hexdigest()
+    return sources
+
+# Function to fingerprint the code-level settings behind the symptom index
+def get_symptom_index_settings():
+    """Return the SHA-256 of the settings and the source of the functions the symptom index is built with"""
+    settings = json.dumps({
+        'common_symptom_mappings': COMMON_SYMPTOM_MAPPINGS,
+        'ngram_size': NGRAM_SIZE,
+        'symspell_max_distance': SYMSPELL_MAX_DISTANCE,
+        'naive_bayes_alpha': NAIVE_BAYES_ALPHA,
+        'functions': [inspect.getsource(function) for function in SYMPTOM_INDEX_FUNCTIONS],
+    }, sort_keys=True)
+    return hashlib.sha256(settings.encode('utf-8')).hexdigest()
+
+# Function to round a file offset up to the array alignment
+def align_offset(offset):
+    """Round offset up to a multiple of SYMPTOM_INDEX_ALIGNMENT"""
+    return -(-offset // SYMPTOM_INDEX_ALIGNMENT) * SYMPTOM_INDEX_ALIGNMENT
+
+# Function to write the current symptom structures to one binary file
+def save_symptom_index(path=None):
+    """Write the symptom structures as one versioned file: header, aligned NumPy arrays, pickled objects"""
+    path = path or SYMPTOM_INDEX_PATH
+    
+    # Large structures are stored as raw arrays so every process can memory-map the same pages
+    tfidf_matrix = SYMPTOM_TFIDF_INDEX['matrix']
+    postings = {'symspell': SYMSPELL_INDEX, 'ngram': SYMPTOM_NGRAM_INDEX['postings']}
+    arrays = {
+        'char_codes': SYMPTOM_CHAR_MATRIX['codes'],
+        'char_lengths': SYMPTOM_CHAR_MATRIX['lengths'],
+        'tfidf_data': tfidf_matrix.data,
+        'tfidf_indices': tfidf_matrix.indices,
+        'tfidf_indptr': tfidf_matrix.indptr,
+        'tfidf_idf': SYMPTOM_TFIDF_INDEX['idf'],
+        'naive_bayes_log_likelihood': NAIVE_BAYES['log_likelihood'],
+        'naive_bayes_base': NAIVE_BAYES['base'],
     }
+    for prefix, names in SYMPTOM_INDEX_POSTINGS.items():
+        for name in names:
+            arrays[f'{prefix}_{name}'] = postings[prefix][name]
+    # Only the small structures are pickled
+    objects = pickle.dumps({
+        'symptoms': list(DATASET_SYMPTOMS),
+        'symptom_to_diseases': SYMPTOM_TO_DISEASES,
+        'disease_symptoms': DISEASE_SYMPTOMS,
+        'frequency': SYMPTOM_FREQUENCY,
+        'severity': SYMPTOM_SEVERITY,
+        'bk_tree': SYMPTOM_BK_TREE,
+        'postings_terms': {prefix: postings[prefix]['terms'] for prefix in SYMPTOM_INDEX_POSTINGS},
+        'ngram_size': SYMPTOM_NGRAM_INDEX['n'],
+        'naive_bayes_symptoms': list(NAIVE_BAYES['symptom_columns']),
+        'char_terms': SYMPTOM_CHAR_MATRIX['terms'],
+        'tfidf': {key: value for key, value in SYMPTOM_TFIDF_INDEX.items() if key not in ('matrix', 'idf')},
+        'tfidf_shape': tfidf_matrix.shape,
+        'canonical': SYMPTOM_CANONICAL_INDEX,
+        'phonetic': SYMPTOM_PHONETIC_INDEX,
+        'phrases': SYMPTOM_PHRASE_AUTOMATON,
+        'suggestions': SYMPTOM_SUGGESTION_TRIE,
+    }, protocol=pickle.HIGHEST_PROTOCOL)
     
-    # If we have a single common symptom, map it directly
-    if len(matched_symptoms) == 1:
-        symptom = matched_symptoms[0]
-        if symptom in common_symptom_mapping:
-            return common_symptom_mapping[symptom]
+    # Offsets are relative to the start of the data section
+    layout = {}
+    offset = 0
+    for name, array in arrays.items():
+        array = np.ascontiguousarray(array)
+        arrays[name] = array
+        layout[name] = {'dtype': array.dtype.str, 'shape': list(array.shape), 'offset': offset}
+        offset = align_offset(offset + array.nbytes)
     
-    # Score each disease based on symptom matches
-    disease_scores = {}
+    header = json.dumps({
+        'version': SYMPTOM_INDEX_VERSION,
+        'sources': get_symptom_index_sources(),
+        'settings': get_symptom_index_settings(),
+        'arrays': layout,
+        'objects': {'offset': offset, 'length': len(objects)},
+    }).encode('utf-8')
+    data_offset = align_offset(len(SYMPTOM_INDEX_MAGIC) + 8 + len(header))
     
-    for disease, disease_symptoms in DISEASE_SYMPTOMS.items():
-        if not disease_symptoms:
-            continue
-            
-        # Count matching symptoms
-        matching_count = sum(1 for symptom in matched_symptoms if symptom in disease_symptoms)
+    # Write to a temporary file first so running workers never map a half-written index
+    temporary_path = path + '.tmp'
+    with open(temporary_path, 'wb') as f:
+        f.write(SYMPTOM_INDEX_MAGIC)
+        f.write(len(header).to_bytes(8, 'little'))
+        f.write(header)
+        for name, array in arrays.items():
+            f.seek(data_offset + layout[name]['offset'])
+            f.write(array.tobytes())
+        f.seek(data_offset + offset)
+        f.write(objects)
+    os.replace(temporary_path, path)
+    
+    return path
+
+# Function to restore the symptom structures from a prebuilt index file
+def load_symptom_index(path=None):
+    """Memory-map a prebuilt symptom index; returns False if it is missing, unreadable, stale (dataset files or
+    code-level settings changed) or from another version"""
+    global SYMPTOM_BK_TREE, SYMSPELL_INDEX, SYMPTOM_NGRAM_INDEX, SYMPTOM_CHAR_MATRIX, SYMPTOM_TFIDF_INDEX
+    global SYMPTOM_CANONICAL_INDEX, SYMPTOM_PHONETIC_INDEX, SYMPTOM_PHRASE_AUTOMATON, SYMPTOM_SUGGESTION_TRIE
+    
+    path = path or SYMPTOM_INDEX_PATH
+    try:
+        with open(path, 'rb') as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return False
+    
+    magic_length = len(SYMPTOM_INDEX_MAGIC)
+    if mapped[:magic_length] != SYMPTOM_INDEX_MAGIC:
+        return False
+    
+    # A truncated or corrupt file is ignored like a stale one; every structure is built
+    # before any is replaced, so the current ones stay intact
+    try:
+        header_length = int.from_bytes(mapped[magic_length:magic_length + 8], 'little')
+        header = json.loads(mapped[magic_length + 8:magic_length + 8 + header_length].decode('utf-8'))
+        if header['version'] != SYMPTOM_INDEX_VERSION or header['sources'] != get_symptom_index_sources():
+            return False
+        if header.get('settings') != get_symptom_index_settings():
+            return False
+        data_offset = align_offset(magic_length + 8 + header_length)
         
-        # Skip diseases with no matching symptoms
-        if matching_count == 0:
-            continue
+        # Read-only views of the mapped file; the pages are shared by every process mapping it
+        arrays = {}
+        for name, spec in header['arrays'].items():
+            count = int(np.prod(spec['shape']))
+            arrays[name] = np.frombuffer(mapped, dtype=np.dtype(spec['dtype']), count=count,
+                                         offset=data_offset + spec['offset']).reshape(spec['shape'])
         
-        # Calculate match percentage (how many of the disease's symptoms are present)
-        match_percentage = matching_count / len(disease_symptoms) if disease_symptoms else 0
-        
-        # Also consider how many of the user's symptoms match this disease (precision)
-        user_match_percentage = matching_count / len(matched_symptoms) if matched_symptoms else 0
-        
-        # Enhanced scoring with bonus for common disease-symptom combinations
-        common_disease_bonus = 0
-        if disease == 'Common Cold' and any(symptom in ['fever', 'high_fever', 'cold', 'cough', 'chills', 'fatigue'] for symptom in matched_symptoms):
-            common_disease_bonus = 0.2
-        elif disease == 'Migraine' and 'headache' in matched_symptoms:
-            common_disease_bonus = 0.15
-        elif disease == 'Malaria' and any(symptom in ['fever', 'high_fever', 'chills'] for symptom in matched_symptoms):
-            common_disease_bonus = 0.1
-        elif disease == 'Typhoid' and any(symptom in ['fever', 'high_fever', 'chills'] for symptom in matched_symptoms):
-            common_disease_bonus = 0.1
-        
-        # Combined score (weighted average - favor diseases that explain more user symptoms)
-        combined_score = (match_percentage * 0.3) + (user_match_percentage * 0.7) + common_disease_bonus
-        
-        disease_scores[disease] = combined_score
-    
-    # Return disease with highest score
-    if disease_scores:
-        # Convert to list of items and find max
-        items = list(disease_scores.items())
-        if items:
-            predicted_disease, _ = max(items, key=lambda x: x[1])
-            # Only return if score is above minimum threshold
-            if disease_scores[predicted_disease] > 0.1:
-                return predicted_disease
+        start = data_offset + header['objects']['offset']
+        objects = pickle.loads(mapped[start:start + header['objects']['length']])
+        
+        postings = {}
+        for prefix, names in SYMPTOM_INDEX_POSTINGS.items():
+            postings[prefix] = {name: arrays[f'{prefix}_{name}'] for name in names}
+            postings[prefix]['terms'] = objects['postings_terms'][prefix]
+        ngram_index = {'n': objects['ngram_size'], 'postings': postings['ngram'],
+                       'by_length': group_terms_by_length(postings['ngram']['terms'])}
+        char_matrix = {'terms': objects['char_terms'], 'codes': arrays['char_codes'], 'lengths': arrays['char_lengths']}
+        tfidf_index = dict(objects['tfidf'])
+        tfidf_index['idf'] = arrays['tfidf_idf']
+        tfidf_index['matrix'] = csc_matrix((arrays['tfidf_data'], arrays['tfidf_indices'], arrays['tfidf_indptr']),
+                                           shape=objects['tfidf_shape'], copy=False)
+        naive_bayes = {
+            'symptom_columns': {symptom: column for column, symptom in enumerate(objects['naive_bayes_symptoms'])},
+            'log_likelihood': arrays['naive_bayes_log_likelihood'],
+            'base': arrays['naive_bayes_base'],
+        }
+        symptoms, symptom_to_diseases, disease_symptoms, frequency, severity = (
+            objects[key] for key in ('symptoms', 'symptom_to_diseases', 'disease_symptoms', 'frequency', 'severity'))
+        bk_tree, canonical, phonetic, phrases, suggestions = (
+            objects[key] for key in ('bk_tree', 'canonical', 'phonetic', 'phrases', 'suggestions'))
+    except (ValueError, KeyError, TypeError, IndexError, AttributeError, EOFError, ImportError, OverflowError,
+            pickle.UnpicklingError) as e:
+        app.logger.warning("Symptom index %s not loaded: %s", path, e)
+        return False
     
-    return None
+    DATASET_SYMPTOMS.clear()
+    DATASET_SYMPTOMS.update(symptoms)
+    SYMPTOM_TO_DISEASES.clear()
+    SYMPTOM_TO_DISEASES.update(symptom_to_diseases)
+    DISEASE_SYMPTOMS.clear()
+    DISEASE_SYMPTOMS.update(disease_symptoms)
+    SYMPTOM_FREQUENCY.clear()
+    SYMPTOM_FREQUENCY.update(frequency)
+    SYMPTOM_SEVERITY.clear()
+    SYMPTOM_SEVERITY.update(severity)
+    
+    # Set iteration order differs between processes, so it is recorded again here
+    SYMPTOM_ORDER.clear()
+    for position, symptom in enumerate(DATASET_SYMPTOMS):
+        SYMPTOM_ORDER[symptom] = position
+    
+    SYMPTOM_BK_TREE = bk_tree
+    SYMSPELL_INDEX = postings['symspell']
+    SYMPTOM_NGRAM_INDEX = ngram_index
+    SYMPTOM_CHAR_MATRIX = char_matrix
+    SYMPTOM_TFIDF_INDEX = tfidf_index
+    SYMPTOM_CANONICAL_INDEX = canonical
+    SYMPTOM_PHONETIC_INDEX = phonetic
+    SYMPTOM_PHRASE_AUTOMATON = phrases
+    SYMPTOM_SUGGESTION_TRIE = suggestions
+    
+    build_disease_scoring_indexes(naive_bayes)
+    
+    # Cached matches were computed against the old symptoms
+    clear_symptom_cache()
+    return True
+
+# Initialize dataset mappings when the application starts, from the prebuilt index when it is current
+if not load_symptom_index():
+    initialize_dataset_mappings()
 
 # creating routes========================================
 
@@ -675,6 +2883,8 @@ def index():
 def home():
     if request.method == 'POST':
         symptoms = request.form.get('symptoms')
+        # Optional disease scoring engine for this request (e.g. 'severity')
+        scoring_engine = request.form.get('scoring') or None
         
         # Store original symptoms for preservation
         original_symptoms = symptoms
@@ -684,47 +2894,26 @@ def home():
             message = "Please enter your symptoms. Symptoms should be comma-separated (e.g., itching, fever, headache)"
             return render_template('index.html', message=message, symptoms=symptoms)
         
+        if scoring_engine and scoring_engine not in DISEASE_SCORING_ENGINES:
+            message = f"Unknown scoring mode: {scoring_engine}. Use one of {', '.join(DISEASE_SCORING_ENGINES)}."
+            return render_template('index.html', message=message, symptoms=symptoms)
+        
         try:
             # Clean speech input if it comes from speech recognition
             symptoms = clean_speech_input(symptoms)
             
             # Use our new symptom matching approach for both speech and manual input
-            # Find matching symptoms using fuzzy matching
-            matched_symptoms = find_matching_symptoms(symptoms, threshold=0.7)  # 70% threshold for fuzzy matching
-            
-            # If no matches found, try to split by commas for manual input
-            if not matched_symptoms:
-                # Split the user's input into a list of symptoms (assuming they are comma-separated)
-                user_symptoms = [s.strip() for s in symptoms.split(',')]
-                # Remove any extra characters, if any
-                user_symptoms = [symptom.strip("[]' \"") for symptom in user_symptoms]
-                # Remove empty strings
-                user_symptoms = [s for s in user_symptoms if s]
-                
-                # Try to find matches for each symptom
-                for symptom in user_symptoms:
-                    symptom_matches = find_matching_symptoms(symptom, threshold=0.6)  # Lower threshold for individual symptoms
-                    matched_symptoms.extend(symptom_matches)
-                
-                # Remove duplicates while preserving order
-                seen = set()
-                matched_symptoms = [x for x in matched_symptoms if not (x in seen or seen.add(x))]
+            # Find matching symptoms using the whole-input / comma-separated threshold cascade
+            matched_symptoms = find_matching_symptoms_cascade(symptoms)
             
             # Handle case where no valid symptoms remain after cleaning
             # Allow single symptoms to proceed - remove the strict validation
             if not matched_symptoms:
-                # For single symptoms, try to match directly
-                single_symptom = symptoms.strip().lower()
-                if single_symptom and single_symptom != "symptoms":
-                    matched_symptoms = find_matching_symptoms(single_symptom, threshold=0.6)
-                
-                # If still no matches, show a more helpful message but allow processing
-                if not matched_symptoms:
-                    # Try to use the original symptoms as-is for the model
-                    matched_symptoms = [symptoms.strip().lower()] if symptoms.strip() else []
+                # Try to use the original symptoms as-is for the model
+                matched_symptoms = [symptoms.strip().lower()] if symptoms.strip() else []
             
             # Predict disease based on matched symptoms with special rules
-            predicted_disease = predict_disease_from_symptoms(matched_symptoms)
+            predicted_disease = predict_disease_from_symptoms(matched_symptoms, scoring_engine)
             
             # If no disease predicted, try the model-based approach
             if not predicted_disease and matched_symptoms:
@@ -758,6 +2947,98 @@ def home():
 
     return render_template('index.html')
 
+# Symptom matching cache counters for monitoring
+@app.route('/api/symptom-cache/stats')
+def symptom_cache_stats():
+    return jsonify(get_symptom_cache_stats())
+
+# Every worker picks up edits to the special-case rule file on its own
+@app.before_request
+def symptom_rules_refresh():
+    refresh_symptom_rules()
+
+# Symptom autocomplete for the symptom box
+@app.route('/api/symptoms/suggest')
+def symptom_suggestions():
+    query = request.args.get('q', '')
+    ranking = request.args.get('rank', 'weight')
+    try:
+        limit = min(int(request.args.get('k', SUGGEST_DEFAULT_RESULTS)), SUGGEST_MAX_RESULTS)
+    except ValueError:
+        return jsonify({'error': 'k must be an integer'}), 400
+    
+    if ranking not in SUGGESTION_RANKINGS:
+        return jsonify({'error': f"rank must be one of {', '.join(SUGGESTION_RANKINGS)}"}), 400
+    
+    return jsonify({'query': query, 'suggestions': suggest_symptoms(query, limit, ranking)})
+
+# Ranked differential diagnosis from the scoring engine and the trained model
+@app.route('/api/predict/differential', methods=['GET', 'POST'])
+def differential_diagnosis():
+    symptoms = request.values.get('symptoms', '')
+    try:
+        limit = int(request.values.get('k', DIFFERENTIAL_DEFAULT_RESULTS))
+    except ValueError:
+        return jsonify({'error': 'k must be an integer'}), 400
+    if limit < 1:
+        return jsonify({'error': 'k must be at least 1'}), 400
+    limit = min(limit, DIFFERENTIAL_MAX_RESULTS)
+    
+    if not symptoms.strip():
+        return jsonify({'error': 'symptoms is required'}), 400
+    
+    scoring_engine = request.values.get('scoring') or None
+    if scoring_engine and scoring_engine not in DISEASE_SCORING_ENGINES:
+        return jsonify({'error': f"scoring must be one of {', '.join(DISEASE_SCORING_ENGINES)}"}), 400
+    
+    # Scores are raw engine scores and SVC votes (or forest estimates), not calibrated probabilities
+    matched_symptoms = find_matching_symptoms_cascade(clean_speech_input(symptoms))
+    if not matched_symptoms:
+        return jsonify({'symptoms': symptoms, 'matched_symptoms': [], 'rule': None, 'scoring': [], 'model': [],
+                        'calibrated': False})
+    
+    # A special-case rule decides /predict before any scoring; 'rule' is that disease (None when no rule applies)
+    return jsonify({'symptoms': symptoms, 'matched_symptoms': matched_symptoms,
+                    'rule': apply_symptom_rules(matched_symptoms),
+                    'scoring': rank_diseases(matched_symptoms, limit, scoring_engine),
+                    'model': rank_model_diseases(matched_symptoms, limit), 'calibrated': False})
+
+# Incremental scoring sessions: symptoms are added or removed one request at a time
+@app.route('/api/sessions', methods=['POST'])
+def scoring_session_create():
+    symptoms = request.values.get('symptoms', '')
+    matched_symptoms = find_matching_symptoms_cascade(clean_speech_input(symptoms)) if symptoms.strip() else []
+    session_id = create_scoring_session(matched_symptoms)
+    result = update_scoring_session(session_id)
+    return jsonify({'session': session_id, 'ttl': SCORING_SESSION_TTL, **result}), 201
+
+@app.route('/api/sessions/<session_id>', methods=['GET'])
+def scoring_session_get(session_id):
+    result = update_scoring_session(session_id)
+    if result is None:
+        return jsonify({'error': 'Unknown or expired session'}), 404
+    return jsonify({'session': session_id, **result})
+
+@app.route('/api/sessions/<session_id>/symptoms', methods=['POST'])
+def scoring_session_update(session_id):
+    add = request.values.get('add', '')
+    remove = request.values.get('remove', '')
+    if not add.strip() and not remove.strip():
+        return jsonify({'error': 'add or remove is required'}), 400
+    
+    added = find_matching_symptoms_cascade(clean_speech_input(add)) if add.strip() else []
+    removed = find_matching_symptoms_cascade(clean_speech_input(remove)) if remove.strip() else []
+    result = update_scoring_session(session_id, added, removed)
+    if result is None:
+        return jsonify({'error': 'Unknown or expired session'}), 404
+    return jsonify({'session': session_id, 'added': added, 'removed': removed, **result})
+
+@app.route('/api/sessions/<session_id>', methods=['DELETE'])
+def scoring_session_delete(session_id):
+    if not delete_scoring_session(session_id):
+        return jsonify({'error': 'Unknown or expired session'}), 404
+    return jsonify({'session': session_id, 'deleted': True})
+
 # about view funtion and path
 @app.route('/about')
 def about():
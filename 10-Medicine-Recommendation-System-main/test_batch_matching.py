@@ -0,0 +1,121 @@
+"""
+Test script to verify that find_matching_symptoms_batch gives the same matches
+as find_matching_symptoms for each input, in order, matching each word once
+"""
+
+import sys
+import os
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+TEST_INPUTS = [
+    'fever',
+    'itching, skin rash',
+    'nausia and vomitting',
+    '',
+    None,
+    'head ache',
+    'i feel terrible today',
+    'fever',
+    'koff and feaver since yesterday',
+    'xyzzy plugh',
+    'itching, skin rash',
+]
+
+def test_batch_matches_single_calls():
+    """Test the batch results against one find_matching_symptoms call per input"""
+    print("Testing batch matching against single calls...")
+    print("=" * 60)
+
+    # Import the functions from main.py
+    from main import find_matching_symptoms, find_matching_symptoms_batch, clear_symptom_cache
+
+    all_passed = True
+
+    for threshold in [0.6, 0.7, 0.75]:
+        clear_symptom_cache()
+        expected = [find_matching_symptoms(text, threshold) for text in TEST_INPUTS]
+        # Any iterable works, including a generator
+        results = list(find_matching_symptoms_batch((text for text in TEST_INPUTS), threshold))
+        print(f"Threshold {threshold}: {len(results)} results")
+        if results != expected:
+            print(f"  Expected: {expected}")
+            print(f"  Got: {results}")
+            all_passed = False
+
+    print("✅ PASS\n" if all_passed else "❌ FAIL\n")
+
+    return all_passed
+
+def test_each_word_matched_once():
+    """Test that words repeated across the batch are fuzzy matched once"""
+    print("Testing that each distinct word is fuzzy matched once...")
+    print("=" * 60)
+
+    # Import from main.py
+    import main
+
+    calls = []
+    original = main.find_best_fuzzy_match
+
+    def counting_match(word, threshold, engine=None):
+        calls.append(word)
+        return original(word, threshold, engine)
+
+    main.find_best_fuzzy_match = counting_match
+    try:
+        results = list(main.find_matching_symptoms_batch(['terible pain', 'pain is terible', 'terible'] * 50, 0.7))
+    finally:
+        main.find_best_fuzzy_match = original
+
+    print(f"Results: {len(results)}, fuzzy lookups: {sorted(calls)}")
+    if len(results) == 150 and sorted(calls) == sorted(set(calls)):
+        print("✅ PASS\n")
+        return True
+
+    print("❌ FAIL\n")
+    return False
+
+def test_process_pool():
+    """Test that fanning out to worker processes gives the same results across chunks"""
+    print("Testing batch matching with a process pool...")
+    print("=" * 60)
+
+    # Import from main.py
+    import main
+
+    inputs = TEST_INPUTS * 20
+    expected = [main.find_matching_symptoms(text, 0.7) for text in inputs]
+
+    chunk_size, worker_chunk = main.SYMPTOM_BATCH_CHUNK_SIZE, main.SYMPTOM_BATCH_WORKER_CHUNK
+    main.SYMPTOM_BATCH_CHUNK_SIZE, main.SYMPTOM_BATCH_WORKER_CHUNK = 7, 2
+    try:
+        results = list(main.find_matching_symptoms_batch(inputs, 0.7, processes=2))
+    finally:
+        main.SYMPTOM_BATCH_CHUNK_SIZE, main.SYMPTOM_BATCH_WORKER_CHUNK = chunk_size, worker_chunk
+
+    if results == expected:
+        print("✅ PASS\n")
+        return True
+
+    print("❌ FAIL\n")
+    return False
+
+def main():
+    """Main test function"""
+    single_passed = test_batch_matches_single_calls()
+    once_passed = test_each_word_matched_once()
+    pool_passed = test_process_pool()
+
+    print("=" * 60)
+    if single_passed and once_passed and pool_passed:
+        print("🎉 ALL TESTS PASSED! Batch symptom matching works correctly.")
+        return True
+    else:
+        print("❌ SOME TESTS FAILED! Please check the implementation.")
+        return False
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,119 @@
+"""
+Test script to verify that the canonical symptom index resolves spacing,
+underscore and punctuation variants of dataset symptoms without fuzzy matching
+"""
+
+import sys
+import os
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+def test_variants_resolve_to_dataset_symptom():
+    """Test that each way of writing a symptom maps to its dataset name"""
+    print("Testing canonical symptom variants...")
+    print("=" * 60)
+
+    # Import the functions from main.py
+    from main import find_matching_symptoms
+
+    test_cases = [
+        ('skin rash', ['skin_rash']),
+        ('Skin_Rash', ['skin_rash']),
+        ('skin-rash', ['skin_rash']),
+        ('skinrash', ['skin_rash']),
+        ('nodal skin eruptions', ['nodal_skin_eruptions']),
+        ('nodal_skin eruptions', ['nodal_skin_eruptions']),
+        ('dischromic patches', ['dischromic _patches']),
+        ('foul smell of urine', ['foul_smell_of urine']),
+        ('spotting urination', ['spotting_ urination']),
+        ('itching, skin rash', ['itching', 'skin_rash']),
+    ]
+
+    all_passed = True
+
+    for text, expected in test_cases:
+        result = find_matching_symptoms(text, threshold=0.7)
+        print(f"Input: {text!r}")
+        print(f"  Expected: {expected}")
+        print(f"  Got: {result}")
+        if result == expected:
+            print("  ✅ PASS\n")
+        else:
+            print("  ❌ FAIL\n")
+            all_passed = False
+
+    return all_passed
+
+def test_every_symptom_indexed():
+    """Test that every dataset symptom is reachable from its spaced and joined forms"""
+    print("Testing that every dataset symptom is indexed...")
+    print("=" * 60)
+
+    # Import from main.py
+    from main import DATASET_SYMPTOMS, SYMPTOM_CANONICAL_INDEX, canonical_symptom_key
+
+    missing = []
+    for symptom in DATASET_SYMPTOMS:
+        spaced = canonical_symptom_key(symptom)
+        for variant in (spaced, spaced.replace(' ', '')):
+            if SYMPTOM_CANONICAL_INDEX.get(variant) != symptom:
+                missing.append((variant, symptom))
+
+    print(f"{len(SYMPTOM_CANONICAL_INDEX)} variants for {len(DATASET_SYMPTOMS)} symptoms")
+    if not missing:
+        print("✅ PASS\n")
+        return True
+
+    print(f"Missing: {missing}")
+    print("❌ FAIL\n")
+    return False
+
+def test_exact_variants_skip_fuzzy_matching():
+    """Test that exact variants never call the fuzzy matcher"""
+    print("Testing that exact variants skip fuzzy matching...")
+    print("=" * 60)
+
+    # Import from main.py
+    import main
+
+    calls = []
+    original = main.find_best_fuzzy_match
+
+    def counting_match(word, threshold, engine=None):
+        calls.append(word)
+        return original(word, threshold, engine)
+
+    main.find_best_fuzzy_match = counting_match
+    try:
+        main.clear_symptom_cache()
+        result = main.find_matching_symptoms_cascade('itching, skin_rash, nodal skin eruptions, highfever')
+    finally:
+        main.find_best_fuzzy_match = original
+
+    print(f"Matches: {result}")
+    print(f"Fuzzy lookups: {calls}")
+    if result == ['itching', 'skin_rash', 'nodal_skin_eruptions', 'high_fever'] and not calls:
+        print("✅ PASS\n")
+        return True
+
+    print("❌ FAIL\n")
+    return False
+
+def main():
+    """Main test function"""
+    variants_passed = test_variants_resolve_to_dataset_symptom()
+    indexed_passed = test_every_symptom_indexed()
+    skip_passed = test_exact_variants_skip_fuzzy_matching()
+
+    print("=" * 60)
+    if variants_passed and indexed_passed and skip_passed:
+        print("🎉 ALL TESTS PASSED! The canonical symptom index works correctly.")
+        return True
+    else:
+        print("❌ SOME TESTS FAILED! Please check the implementation.")
+        return False
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
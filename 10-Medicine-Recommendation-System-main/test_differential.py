@@ -0,0 +1,182 @@
+"""
+Test script to verify the ranked top-k differential diagnosis from the scoring
+engine and the trained model, and its JSON endpoint
+"""
+
+import copy
+import random
+import sys
+import os
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+def test_top_k_selection():
+    """Test argpartition top-k selection against a stable full sort"""
+    print("Testing top-k selection...")
+    print("=" * 60)
+
+    # Import the function from main.py
+    import numpy as np
+    from main import top_k_indices
+
+    rng = np.random.default_rng(6)
+    mismatches = 0
+    cases = 0
+    for size in [1, 5, 41, 600, 5000]:
+        for k in [1, 5, 20, size + 3]:
+            # Rounded scores and -inf entries produce ties at the k-th score
+            scores = np.round(rng.random(size), 1)
+            scores[rng.random(size) < 0.2] = -np.inf
+            expected = np.argsort(-scores, kind='stable')[:k]
+            cases += 1
+            if not np.array_equal(top_k_indices(scores, k), expected):
+                mismatches += 1
+
+    print(f"{cases} cases, {mismatches} mismatches")
+    if not mismatches:
+        print("✅ PASS\n")
+        return True
+
+    print("❌ FAIL\n")
+    return False
+
+def test_scoring_differential():
+    """Test that the scoring differential is ranked and starts with the single-label prediction"""
+    print("Testing the scoring-engine differential...")
+    print("=" * 60)
+
+    # Import the functions from main.py
+    import numpy as np
+    from main import DISEASE_INCIDENCE, DATASET_SYMPTOMS, rank_diseases, score_diseases
+
+    rng = random.Random(7)
+    vocabulary = sorted(DATASET_SYMPTOMS)
+    failures = 0
+    for _ in range(500):
+        matched = rng.sample(vocabulary, rng.randint(1, 5))
+        ranked = rank_diseases(matched, 5)
+        scores = score_diseases(matched)
+        best = DISEASE_INCIDENCE['diseases'][int(np.argmax(scores))]
+        ordered = all(a['score'] >= b['score'] for a, b in zip(ranked, ranked[1:]))
+        if not ranked or len(ranked) > 5 or ranked[0]['disease'] != best or not ordered:
+            failures += 1
+
+    ranked = rank_diseases(['itching', 'skin_rash', 'nodal_skin_eruptions'], 3)
+    print(f"Example: {[(entry['disease'], round(entry['score'], 3)) for entry in ranked]}")
+    print(f"500 random symptom lists, {failures} failures")
+    if not failures and ranked[0]['disease'] == 'Fungal infection' and rank_diseases(['unknown']) == []:
+        print("✅ PASS\n")
+        return True
+
+    print("❌ FAIL\n")
+    return False
+
+def test_model_differential():
+    """Test that the model differential agrees with the model's own votes and labels"""
+    print("Testing the trained-model differential...")
+    print("=" * 60)
+
+    # Import from main.py
+    import numpy as np
+    import main
+
+    rng = random.Random(8)
+    vocabulary = sorted(main.symptoms_dict)
+    ovo_model = copy.copy(main.model)
+    ovo_model.decision_function_shape = 'ovo'
+    vote_mismatches = 0
+    label_matches = 0
+    for _ in range(300):
+        matched = rng.sample(vocabulary, rng.randint(1, 5))
+        ranked = main.rank_model_diseases(matched, 5)
+        if main.symptom_to_index is None:
+            # Votes equal those of sklearn's pairwise decision values (a copy set to 'ovo')
+            decision = ovo_model.decision_function([main.symptoms_to_vector(matched)])[0]
+            votes = main.count_svc_votes(decision, len(main.model.classes_))
+            if [entry['score'] for entry in ranked] != sorted(votes, reverse=True)[:5]:
+                vote_mismatches += 1
+        label_matches += ranked[0]['disease'] == main.get_predicted_value(matched)
+
+    ranked = main.rank_model_diseases(['itching', 'skin_rash', 'nodal_skin_eruptions'], 3)
+    print(f"Example: {[(entry['disease'], round(entry['score'], 3)) for entry in ranked]}")
+    print(f"300 random symptom lists: {vote_mismatches} vote mismatches, top label equals predict for {label_matches}")
+    # Labels can differ only where a pairwise decision value is exactly zero
+    if not vote_mismatches and label_matches >= 285 and ranked[0]['disease'] == 'Fungal infection':
+        print("✅ PASS\n")
+        return True
+
+    print("❌ FAIL\n")
+    return False
+
+def test_differential_endpoint():
+    """Test the /api/predict/differential endpoint"""
+    print("Testing /api/predict/differential...")
+    print("=" * 60)
+
+    # Import the Flask app from main.py
+    from main import app
+
+    client = app.test_client()
+    response = client.get('/api/predict/differential?symptoms=itching, skin rash&k=3')
+    data = response.get_json()
+    print(f"GET: {response.status_code} {data['matched_symptoms']} "
+          f"{[entry['disease'] for entry in data['scoring']]} {[entry['disease'] for entry in data['model']]}")
+
+    posted = client.post('/api/predict/differential', data={'symptoms': 'itching, skin rash'}).get_json()
+    bad_k = [client.get(f'/api/predict/differential?symptoms=itching&k={k}').status_code for k in ['many', '0', '-2']]
+    missing = client.get('/api/predict/differential').status_code
+    print(f"POST: {len(posted['scoring'])} scoring, {len(posted['model'])} model; bad k: {bad_k}; no symptoms: {missing}; "
+          f"calibrated: {data['calibrated']}")
+
+    if (response.status_code == 200 and len(data['scoring']) == 3 and len(data['model']) == 3
+            and data['scoring'][0]['disease'] == 'Fungal infection' and len(posted['model']) == 5
+            and bad_k == [400, 400, 400] and missing == 400 and data['calibrated'] is False
+            and all(set(entry) == {'disease', 'score'} for entry in data['scoring'] + data['model'])):
+        print("✅ PASS\n")
+        return True
+
+    print("❌ FAIL\n")
+    return False
+
+def test_differential_rules():
+    """Test that the endpoint reports the special-case rule /predict decides by"""
+    print("Testing special-case rules in /api/predict/differential...")
+    print("=" * 60)
+
+    # Import the Flask app from main.py
+    from main import app
+
+    client = app.test_client()
+    all_passed = True
+    for symptoms, expected in [('fever, cough', 'Viral Infection'), ('headache', 'Sinusitis'),
+                               ('itching, skin rash', None)]:
+        data = client.get(f'/api/predict/differential?symptoms={symptoms}').get_json()
+        page = client.post('/predict', data={'symptoms': symptoms})
+        print(f"{symptoms}: rule {data['rule']!r}, scoring top {data['scoring'][0]['disease']!r}")
+        if data['rule'] != expected or (expected and expected.encode() not in page.data):
+            all_passed = False
+
+    print("✅ PASS\n" if all_passed else "❌ FAIL\n")
+
+    return all_passed
+
+def main():
+    """Main test function"""
+    selection_passed = test_top_k_selection()
+    scoring_passed = test_scoring_differential()
+    model_passed = test_model_differential()
+    endpoint_passed = test_differential_endpoint()
+    rules_passed = test_differential_rules()
+
+    print("=" * 60)
+    if selection_passed and scoring_passed and model_passed and endpoint_passed and rules_passed:
+        print("🎉 ALL TESTS PASSED! The differential diagnosis works correctly.")
+        return True
+    else:
+        print("❌ SOME TESTS FAILED! Please check the implementation.")
+        return False
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
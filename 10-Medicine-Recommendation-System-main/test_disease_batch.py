@@ -0,0 +1,91 @@
+"""
+Test script to verify that batch disease scoring returns the same diseases
+and scores as predict_disease_from_symptoms called once per record
+"""
+
+import itertools
+import random
+import sys
+import os
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+def test_batch_matches_single():
+    """Test batch predictions against one call per record, across chunk boundaries"""
+    print("Testing batch predictions against per-record predictions...")
+    print("=" * 60)
+
+    # Import the functions from main.py
+    import numpy as np
+    from main import DATASET_SYMPTOMS, predict_disease_from_symptoms, predict_diseases_batch, score_diseases
+
+    rng = random.Random(10)
+    # Repeated, unknown and rule symptoms and empty records are included on purpose
+    vocabulary = sorted(DATASET_SYMPTOMS) + ['fever', 'cold', 'cough', 'headache', 'unknown']
+    records = [[rng.choice(vocabulary) for _ in range(rng.randint(0, 5))] for _ in range(3000)]
+
+    all_passed = True
+    for engine in [None, 'severity']:
+        results = list(predict_diseases_batch(records, engine, chunk_size=700))
+        disease_mismatches = sum(disease != predict_disease_from_symptoms(matched, engine)
+                                 for (disease, _), matched in zip(results, records))
+        score_mismatches = 0
+        if engine is None:
+            for (_, score), matched in zip(results, records):
+                if score is not None and score != np.max(score_diseases(matched)):
+                    score_mismatches += 1
+
+        print(f"Engine {engine or 'default'}: {len(results)} results, {disease_mismatches} disease mismatches, "
+              f"{score_mismatches} score mismatches")
+        if len(results) != len(records) or disease_mismatches or score_mismatches:
+            all_passed = False
+
+    print("✅ PASS\n" if all_passed else "❌ FAIL\n")
+
+    return all_passed
+
+def test_batch_streams_chunks():
+    """Test that the batch scorer reads its input one chunk at a time"""
+    print("Testing chunked streaming...")
+    print("=" * 60)
+
+    # Import the function from main.py
+    from main import predict_diseases_batch
+
+    consumed = itertools.count()
+    records = ((next(consumed), ['itching', 'skin_rash'])[1] for _ in itertools.repeat(None))
+    results = predict_diseases_batch(records, chunk_size=50)
+    first = [next(results) for _ in range(60)]
+
+    print(f"First result: {first[0]}, records read for 60 results: {next(consumed)}")
+    try:
+        next(predict_diseases_batch([['itching']], 'unknown'))
+        rejected = False
+    except ValueError as e:
+        print(f"Unknown engine rejected: {e}")
+        rejected = True
+
+    if first[0][0] == 'Fungal infection' and next(consumed) <= 101 and rejected:
+        print("✅ PASS\n")
+        return True
+
+    print("❌ FAIL\n")
+    return False
+
+def main():
+    """Main test function"""
+    batch_passed = test_batch_matches_single()
+    stream_passed = test_batch_streams_chunks()
+
+    print("=" * 60)
+    if batch_passed and stream_passed:
+        print("🎉 ALL TESTS PASSED! Batch disease scoring works correctly.")
+        return True
+    else:
+        print("❌ SOME TESTS FAILED! Please check the implementation.")
+        return False
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
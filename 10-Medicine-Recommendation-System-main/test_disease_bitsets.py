@@ -0,0 +1,120 @@
+"""
+Test script to verify that the bitset and popcount disease scoring engines
+give the same scores and predictions as the sparse incidence matrix
+"""
+
+import random
+import sys
+import os
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+def test_bitset_scores_match_matrix():
+    """Test the bitset engines against the incidence matrix on random distinct symptom lists"""
+    print("Testing bitset scoring against the incidence matrix...")
+    print("=" * 60)
+
+    # Import the functions from main.py and the benchmark script
+    import numpy as np
+    from main import (DISEASE_SYMPTOMS, build_disease_incidence, build_disease_bitsets, score_diseases,
+                      score_diseases_bitset, score_diseases_popcount)
+    from benchmark_disease_scoring import build_catalog
+
+    rng = random.Random(1)
+    all_passed = True
+
+    # The synthetic catalog spans several 64-bit words per profile
+    for label, catalog in [('Dataset', DISEASE_SYMPTOMS), ('Synthetic catalog', build_catalog(500))]:
+        incidence = build_disease_incidence(catalog)
+        bitsets = build_disease_bitsets(incidence)
+        vocabulary = sorted({symptom for symptoms in catalog.values() for symptom in symptoms}) + ['unknown']
+        mismatches = 0
+        for _ in range(1000):
+            matched = rng.sample(vocabulary, rng.randint(1, 6))
+            expected = score_diseases(matched, incidence)
+            if not (np.array_equal(score_diseases_bitset(matched, incidence, bitsets), expected)
+                    and np.array_equal(score_diseases_popcount(matched, incidence, bitsets), expected)):
+                mismatches += 1
+
+        print(f"{label}: {len(catalog)} diseases, {bitsets['words']} words per profile, {mismatches} mismatches")
+        if mismatches:
+            all_passed = False
+
+    print("✅ PASS\n" if all_passed else "❌ FAIL\n")
+
+    return all_passed
+
+def test_popcount_fallback():
+    """Test that popcount_columns and its byte lookup table count every set bit"""
+    print("Testing the popcount lookup table...")
+    print("=" * 60)
+
+    # Import from main.py
+    import numpy as np
+    from main import POPCOUNT_TABLE, popcount_columns
+
+    words = np.random.default_rng(2).integers(0, 2 ** 63, size=(5, 40), dtype=np.uint64) * np.uint64(2)
+    expected = np.array([sum(bin(int(value)).count('1') for value in column) for column in words.T])
+    counts = POPCOUNT_TABLE[words.view(np.uint8)].reshape(5, 40, 8).sum(axis=(0, 2))
+
+    print(f"popcount_columns: {popcount_columns(words)[:5]}... Lookup table: {counts[:5]}... Expected: {expected[:5]}...")
+    if np.array_equal(popcount_columns(words), expected) and np.array_equal(counts, expected):
+        print("✅ PASS\n")
+        return True
+
+    print("❌ FAIL\n")
+    return False
+
+def test_engine_predictions():
+    """Test that every symptom-counting scoring engine predicts the same diseases"""
+    print("Testing predictions per scoring engine...")
+    print("=" * 60)
+
+    # Import from main.py
+    from main import DISEASE_SYMPTOMS, predict_disease_from_symptoms
+
+    rng = random.Random(3)
+    vocabulary = sorted({symptom for symptoms in DISEASE_SYMPTOMS.values() for symptom in symptoms})
+    requests = [rng.sample(vocabulary, rng.randint(2, 5)) for _ in range(500)]
+    requests.append(['itching', 'skin_rash', 'nodal_skin_eruptions'])
+
+    all_passed = True
+    expected = [predict_disease_from_symptoms(matched, 'matrix') for matched in requests]
+
+    # Engines that count matching symptoms like the matrix ('severity' weights them instead)
+    for engine in ['matrix', 'inverted', 'bitset', 'popcount']:
+        results = [predict_disease_from_symptoms(matched, engine) for matched in requests]
+        mismatches = sum(result != reference for result, reference in zip(results, expected))
+        print(f"{engine:<9} {mismatches} mismatches, last prediction {results[-1]!r}")
+        if mismatches or results[-1] != 'Fungal infection':
+            all_passed = False
+
+    try:
+        predict_disease_from_symptoms(['itching', 'skin_rash'], 'unknown')
+        print("Unknown engine was accepted")
+        all_passed = False
+    except ValueError as e:
+        print(f"Unknown engine rejected: {e}")
+
+    print("✅ PASS\n" if all_passed else "❌ FAIL\n")
+
+    return all_passed
+
+def main():
+    """Main test function"""
+    scores_passed = test_bitset_scores_match_matrix()
+    fallback_passed = test_popcount_fallback()
+    predictions_passed = test_engine_predictions()
+
+    print("=" * 60)
+    if scores_passed and fallback_passed and predictions_passed:
+        print("🎉 ALL TESTS PASSED! Bitset disease scoring works correctly.")
+        return True
+    else:
+        print("❌ SOME TESTS FAILED! Please check the implementation.")
+        return False
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,115 @@
+"""
+Test script to verify that scoring only the candidate diseases found through
+the symptom posting lists gives the same scores and predictions as scoring
+every disease
+"""
+
+import random
+import sys
+import os
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+def test_candidate_scores_match_matrix():
+    """Test candidate scores against the incidence matrix on random symptom lists"""
+    print("Testing candidate scoring against the incidence matrix...")
+    print("=" * 60)
+
+    # Import the functions from main.py and the benchmark scripts
+    import numpy as np
+    from main import DISEASE_SYMPTOMS, build_disease_incidence, build_disease_postings, score_diseases, score_candidate_diseases
+    from benchmark_disease_scoring import build_catalog
+    from benchmark_disease_candidates import build_symptom_to_diseases
+
+    rng = random.Random(4)
+    all_passed = True
+
+    for label, catalog in [('Dataset', DISEASE_SYMPTOMS), ('Synthetic catalog', build_catalog(500))]:
+        incidence = build_disease_incidence(catalog)
+        postings = build_disease_postings(build_symptom_to_diseases(catalog), incidence)
+        # Repeated and unknown symptoms are included on purpose
+        vocabulary = sorted({symptom for symptoms in catalog.values() for symptom in symptoms}) + ['fever', 'unknown']
+        mismatches = 0
+        for _ in range(2000):
+            matched = [rng.choice(vocabulary) for _ in range(rng.randint(1, 6))]
+            expected = score_diseases(matched, incidence)
+            rows, scores = score_candidate_diseases(matched, incidence, postings)
+            # Candidates are exactly the rows with a matching symptom, with identical scores
+            if not (np.array_equal(rows, np.flatnonzero(expected > -np.inf)) and np.array_equal(scores, expected[rows])):
+                mismatches += 1
+
+        print(f"{label}: {len(catalog)} diseases, {mismatches} mismatches")
+        if mismatches:
+            all_passed = False
+
+    print("✅ PASS\n" if all_passed else "❌ FAIL\n")
+
+    return all_passed
+
+def test_postings_follow_symptom_to_diseases():
+    """Test that the posting lists hold the rows of SYMPTOM_TO_DISEASES"""
+    print("Testing the disease posting lists...")
+    print("=" * 60)
+
+    # Import from main.py
+    from main import SYMPTOM_TO_DISEASES, DISEASE_INCIDENCE, DISEASE_POSTINGS
+
+    mismatches = []
+    for symptom, diseases in SYMPTOM_TO_DISEASES.items():
+        rows = list(DISEASE_POSTINGS['postings'][symptom])
+        if rows != sorted(rows) or {DISEASE_INCIDENCE['diseases'][row] for row in rows} != diseases:
+            mismatches.append(symptom)
+
+    print(f"{len(DISEASE_POSTINGS['postings'])} posting lists for {len(SYMPTOM_TO_DISEASES)} symptoms")
+    if not mismatches:
+        print("✅ PASS\n")
+        return True
+
+    print(f"Mismatches: {mismatches}")
+    print("❌ FAIL\n")
+    return False
+
+def test_inverted_predictions():
+    """Test that the default inverted engine predicts like the matrix engine"""
+    print("Testing inverted-index predictions...")
+    print("=" * 60)
+
+    # Import from main.py
+    from main import DISEASE_SYMPTOMS, DISEASE_SCORING_ENGINE, predict_disease_from_symptoms
+
+    rng = random.Random(5)
+    vocabulary = sorted({symptom for symptoms in DISEASE_SYMPTOMS.values() for symptom in symptoms})
+    requests = [rng.sample(vocabulary, rng.randint(2, 5)) for _ in range(500)]
+    requests += [['itching', 'skin_rash', 'nodal_skin_eruptions'], ['unknown', 'also_unknown']]
+
+    results = [predict_disease_from_symptoms(matched, 'inverted') for matched in requests]
+    expected = [predict_disease_from_symptoms(matched, 'matrix') for matched in requests]
+    mismatches = sum(result != reference for result, reference in zip(results, expected))
+
+    print(f"Default engine: {DISEASE_SCORING_ENGINE}")
+    print(f"{mismatches} mismatches, last predictions {results[-2:]}")
+    if DISEASE_SCORING_ENGINE == 'inverted' and not mismatches and results[-2:] == ['Fungal infection', None]:
+        print("✅ PASS\n")
+        return True
+
+    print("❌ FAIL\n")
+    return False
+
+def main():
+    """Main test function"""
+    scores_passed = test_candidate_scores_match_matrix()
+    postings_passed = test_postings_follow_symptom_to_diseases()
+    predictions_passed = test_inverted_predictions()
+
+    print("=" * 60)
+    if scores_passed and postings_passed and predictions_passed:
+        print("🎉 ALL TESTS PASSED! Candidate disease scoring works correctly.")
+        return True
+    else:
+        print("❌ SOME TESTS FAILED! Please check the implementation.")
+        return False
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
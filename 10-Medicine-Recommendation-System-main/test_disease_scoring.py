@@ -0,0 +1,89 @@
+"""
+Test script to verify that scoring diseases through the sparse incidence
+matrix predicts the same diseases as the per-disease scoring loop
+"""
+
+import random
+import sys
+import os
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+def test_matrix_matches_loop():
+    """Test the incidence-matrix scorer against the loop on random symptom lists"""
+    print("Testing incidence-matrix scoring against the per-disease loop...")
+    print("=" * 60)
+
+    # Import the functions from main.py and the benchmark script
+    from main import DISEASE_SYMPTOMS, build_disease_incidence
+    from benchmark_disease_scoring import best_disease_loop, best_disease_matrix, build_catalog
+
+    rng = random.Random(0)
+    all_passed = True
+
+    for label, catalog in [('Dataset', DISEASE_SYMPTOMS), ('Synthetic catalog', build_catalog(500))]:
+        incidence = build_disease_incidence(catalog)
+        # Repeated and unknown symptoms are included on purpose
+        vocabulary = sorted({symptom for symptoms in catalog.values() for symptom in symptoms}) + ['fever', 'unknown']
+        mismatches = 0
+        for _ in range(2000):
+            matched = [rng.choice(vocabulary) for _ in range(rng.randint(1, 6))]
+            if best_disease_matrix(matched, incidence) != best_disease_loop(matched, catalog):
+                mismatches += 1
+
+        print(f"{label}: {len(catalog)} diseases, {mismatches} mismatches")
+        if mismatches:
+            all_passed = False
+
+    print("✅ PASS\n" if all_passed else "❌ FAIL\n")
+
+    return all_passed
+
+def test_predictions():
+    """Test predictions for known symptom combinations"""
+    print("Testing disease predictions...")
+    print("=" * 60)
+
+    # Import the function from main.py
+    from main import predict_disease_from_symptoms
+
+    test_cases = [
+        (['itching', 'skin_rash', 'nodal_skin_eruptions'], 'Fungal infection'),
+        (['continuous_sneezing', 'shivering', 'chills', 'watering_from_eyes'], 'Allergy'),
+        (['headache', 'chest_pain', 'dizziness', 'loss_of_balance'], 'Hypertension '),
+        (['high_fever'], 'Viral Infection'),
+        (['unknown'], None),
+    ]
+
+    all_passed = True
+
+    for matched, expected in test_cases:
+        result = predict_disease_from_symptoms(matched)
+        print(f"Symptoms: {matched}")
+        print(f"  Expected: {expected!r}")
+        print(f"  Got: {result!r}")
+        if result == expected:
+            print("  ✅ PASS\n")
+        else:
+            print("  ❌ FAIL\n")
+            all_passed = False
+
+    return all_passed
+
+def main():
+    """Main test function"""
+    matrix_passed = test_matrix_matches_loop()
+    predictions_passed = test_predictions()
+
+    print("=" * 60)
+    if matrix_passed and predictions_passed:
+        print("🎉 ALL TESTS PASSED! Disease scoring works correctly.")
+        return True
+    else:
+        print("❌ SOME TESTS FAILED! Please check the implementation.")
+        return False
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,273 @@
+"""
+Test script to verify that the exact fuzzy matching engines return the same
+matches as the original linear scan, and that the typo corrector and the
+TF-IDF engine behave
+"""
+
+import sys
+import os
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+# Misspelled, partial and exact words typed or spoken by users
+TEST_WORDS = [
+    'fever', 'feverr', 'headake', 'headache', 'cough', 'couhg', 'chils', 'itchin',
+    'vomitting', 'nausia', 'fatige', 'diarrhea', 'diarrhoea', 'sweating', 'swetting',
+    'dizzyness', 'consitpation', 'skin', 'rash', 'skinrash', 'joint', 'jointpain',
+    'breathlesness', 'acidty', 'anxeity', 'blister', 'lethargy', 'xyz', 'a', 'pain',
+]
+
+TEST_THRESHOLDS = [0.0, 0.5, 0.6, 0.7, 0.75, 0.9, 1.0]
+
+def test_engines_match_linear_scan():
+    """Test that each exact engine agrees with the linear scan for every word and threshold"""
+    print("Testing fuzzy matching engines against the linear scan...")
+    print("=" * 60)
+
+    # Import the functions from main.py
+    from main import find_best_fuzzy_match, EXACT_FUZZY_MATCH_ENGINES
+
+    all_passed = True
+
+    for engine in sorted(EXACT_FUZZY_MATCH_ENGINES):
+        if engine == 'linear':
+            continue
+
+        mismatches = []
+        for word in TEST_WORDS:
+            for threshold in TEST_THRESHOLDS:
+                expected = find_best_fuzzy_match(word, threshold, 'linear')
+                result = find_best_fuzzy_match(word, threshold, engine)
+                if result != expected:
+                    mismatches.append((word, threshold, expected, result))
+
+        print(f"Engine: {engine}")
+        if mismatches:
+            for word, threshold, expected, result in mismatches:
+                print(f"  {word!r} @ {threshold}: expected {expected}, got {result}")
+            print("  ❌ FAIL\n")
+            all_passed = False
+        else:
+            print("  ✅ PASS\n")
+
+    return all_passed
+
+def test_find_matching_symptoms_engines():
+    """Test that find_matching_symptoms gives the same result with every exact engine"""
+    print("Testing find_matching_symptoms with each engine...")
+    print("=" * 60)
+
+    # Import the functions from main.py
+    from main import find_matching_symptoms, EXACT_FUZZY_MATCH_ENGINES
+
+    test_inputs = ['feverr headake', 'skin rash itchin', 'nausia and vomitting', 'joint pain']
+
+    all_passed = True
+
+    for user_input in test_inputs:
+        expected = find_matching_symptoms(user_input, threshold=0.6, engine='linear')
+        for engine in sorted(EXACT_FUZZY_MATCH_ENGINES):
+            result = find_matching_symptoms(user_input, threshold=0.6, engine=engine)
+            if result != expected:
+                print(f"Input: {user_input} ({engine})")
+                print(f"  Expected: {expected}")
+                print(f"  Got: {result}")
+                print("  ❌ FAIL\n")
+                all_passed = False
+
+    if all_passed:
+        print("✅ PASS\n")
+
+    return all_passed
+
+def test_bitparallel_similarity_scores():
+    """Test that the bit-parallel similarity reproduces calculate_similarity"""
+    print("Testing bit-parallel similarity scores...")
+    print("=" * 60)
+
+    # Import the functions from main.py
+    from main import calculate_similarity, calculate_similarity_bitparallel, DATASET_SYMPTOMS
+
+    all_passed = True
+
+    for word in TEST_WORDS:
+        for symptom in DATASET_SYMPTOMS:
+            expected = calculate_similarity(word, symptom)
+            if calculate_similarity_bitparallel(word, symptom) != expected:
+                print(f"  {word!r} vs {symptom!r}: scores differ")
+                all_passed = False
+            # With a cutoff, pairs below the threshold may score 0.0 but never cross it
+            for threshold in TEST_THRESHOLDS:
+                score = calculate_similarity_bitparallel(word, symptom, threshold)
+                if (score >= threshold) != (expected >= threshold):
+                    print(f"  {word!r} vs {symptom!r} @ {threshold}: threshold outcome differs")
+                    all_passed = False
+
+    print("✅ PASS\n" if all_passed else "❌ FAIL\n")
+
+    return all_passed
+
+def test_myers_distance_cap():
+    """Test that myers_distance gives the Levenshtein distance, or max_distance + 1 once it is exceeded"""
+    print("Testing the bit-parallel distance cap...")
+    print("=" * 60)
+
+    # Import the functions from main.py
+    from main import levenshtein_distance, myers_distance
+
+    words = ['', 'a', 'ab'] + TEST_WORDS[:10]
+    all_passed = True
+
+    for first in words:
+        for second in words:
+            distance = levenshtein_distance(first, second)
+            if myers_distance(first, second) != distance:
+                print(f"  {first!r} vs {second!r}: distance differs")
+                all_passed = False
+            for max_distance in range(4):
+                if myers_distance(first, second, max_distance) != min(distance, max_distance + 1):
+                    print(f"  {first!r} vs {second!r} @ {max_distance}: cap not applied")
+                    all_passed = False
+
+    print("✅ PASS\n" if all_passed else "❌ FAIL\n")
+
+    return all_passed
+
+def test_numpy_similarity_scores():
+    """Test that the NumPy engine reproduces calculate_similarity for every symptom"""
+    print("Testing NumPy similarity scores...")
+    print("=" * 60)
+
+    # Import the functions from main.py
+    from main import calculate_similarity, numpy_similarities, SYMPTOM_CHAR_MATRIX
+
+    all_passed = True
+
+    for word in TEST_WORDS:
+        scores = numpy_similarities(word, SYMPTOM_CHAR_MATRIX)
+        expected = [calculate_similarity(word, term) for term in SYMPTOM_CHAR_MATRIX['terms']]
+        if list(scores) != expected:
+            print(f"Word: {word}")
+            print("  ❌ FAIL (scores differ from calculate_similarity)\n")
+            all_passed = False
+
+    if all_passed:
+        print("✅ PASS\n")
+
+    return all_passed
+
+def test_symspell_corrections():
+    """Test that the deletion dictionary corrects typos within two edits"""
+    print("Testing SymSpell typo correction...")
+    print("=" * 60)
+
+    # Import the functions from main.py
+    from main import find_best_fuzzy_match, symspell_lookup, get_symspell_index_size
+
+    test_cases = [
+        ('chils', 'chills'),
+        ('vomitting', 'vomiting'),
+        ('nausia', 'nausea'),
+        ('skinrash', 'skin_rash'),
+        ('fevr', 'high_fever'),      # speech vocabulary word resolved through the common mappings
+        ('feaver', 'high_fever'),
+        ('xyzzy', None),
+    ]
+
+    all_passed = True
+
+    for word, expected in test_cases:
+        result = find_best_fuzzy_match(word, 0.6, 'symspell')
+        print(f"Word: {word}")
+        print(f"  Expected: {expected}")
+        print(f"  Got: {result}")
+        if result == expected:
+            print("  ✅ PASS\n")
+        else:
+            print("  ❌ FAIL\n")
+            all_passed = False
+
+    # Every candidate must really be within the maximum edit distance
+    if any(distance > 2 for _, distance in symspell_lookup('headake')):
+        print("❌ FAIL (candidate beyond two edits)\n")
+        all_passed = False
+
+    size = get_symspell_index_size()
+    print(f"Deletion dictionary size: {size} bytes")
+    if size <= 0:
+        all_passed = False
+
+    return all_passed
+
+def test_tfidf_engine():
+    """Test that the TF-IDF engine agrees with the linear scan at the thresholds used for matching"""
+    print("Testing the TF-IDF engine...")
+    print("=" * 60)
+
+    # Import the functions from main.py
+    from main import find_best_fuzzy_match, tfidf_candidates, SYMPTOM_TFIDF_INDEX, TFIDF_CANDIDATES
+
+    # The engine only re-scores its top candidates, so it is approximate; on
+    # the dataset vocabulary it finds the same matches as the linear scan
+    mismatches = []
+    for word in TEST_WORDS:
+        for threshold in [0.5, 0.6, 0.7, 0.75, 0.9, 1.0]:
+            expected = find_best_fuzzy_match(word, threshold, 'linear')
+            result = find_best_fuzzy_match(word, threshold, 'tfidf')
+            if result != expected:
+                mismatches.append((word, threshold, expected, result))
+
+    for word, threshold, expected, result in mismatches:
+        print(f"  {word!r} @ {threshold}: expected {expected}, got {result}")
+
+    candidates = tfidf_candidates('itchng', SYMPTOM_TFIDF_INDEX)
+    print(f"Candidates for 'itchng': {candidates}")
+
+    if not mismatches and 'itching' in candidates and len(candidates) <= TFIDF_CANDIDATES:
+        print("✅ PASS\n")
+        return True
+
+    print("❌ FAIL\n")
+    return False
+
+def test_unknown_engine():
+    """Test that an unknown engine name is rejected"""
+    print("Testing unknown engine handling...")
+    print("=" * 60)
+
+    # Import the function from main.py
+    from main import find_best_fuzzy_match
+
+    try:
+        find_best_fuzzy_match('fever', 0.7, 'does-not-exist')
+    except ValueError:
+        print("✅ PASS\n")
+        return True
+
+    print("❌ FAIL (no error raised)\n")
+    return False
+
+def main():
+    """Main test function"""
+    engines_passed = test_engines_match_linear_scan()
+    symptoms_passed = test_find_matching_symptoms_engines()
+    bitparallel_passed = test_bitparallel_similarity_scores()
+    cap_passed = test_myers_distance_cap()
+    numpy_passed = test_numpy_similarity_scores()
+    symspell_passed = test_symspell_corrections()
+    tfidf_passed = test_tfidf_engine()
+    unknown_passed = test_unknown_engine()
+
+    print("=" * 60)
+    if (engines_passed and symptoms_passed and bitparallel_passed and cap_passed and numpy_passed
+            and symspell_passed and tfidf_passed and unknown_passed):
+        print("🎉 ALL TESTS PASSED! All fuzzy engines agree with the linear scan.")
+        return True
+    else:
+        print("❌ SOME TESTS FAILED! Please check the implementation.")
+        return False
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
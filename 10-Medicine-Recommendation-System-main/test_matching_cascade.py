@@ -0,0 +1,103 @@
+"""
+Test script to verify that the one-pass /predict matching cascade gives the
+same matches as the previous three find_matching_symptoms calls
+"""
+
+import sys
+import os
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+TEST_INPUTS = [
+    'fever',
+    'cold',
+    'fever, cough, headache',
+    'itching, skin rash',
+    'nausia and vomitting',
+    'head ache',
+    "['chills', 'fatigue']",
+    'i feel terrible today',
+    'my whole body feels strange, something is wrong, please help',
+    'xyzzy plugh, frobnicate, quux',
+    'feaver and couh',
+    'symptoms',
+]
+
+def test_cascade_matches_three_calls():
+    """Test the cascade against the previous three-call matching for every exact engine"""
+    print("Testing matching cascade against three find_matching_symptoms calls...")
+    print("=" * 60)
+
+    # Import the functions from main.py and the benchmark script
+    from main import find_matching_symptoms_cascade, clean_speech_input, EXACT_FUZZY_MATCH_ENGINES
+    from benchmark_matching_cascade import find_matching_symptoms_three_calls
+
+    all_passed = True
+
+    for text in TEST_INPUTS:
+        symptoms = clean_speech_input(text)
+        for engine in sorted(EXACT_FUZZY_MATCH_ENGINES):
+            expected = find_matching_symptoms_three_calls(symptoms, engine=engine)
+            result = find_matching_symptoms_cascade(symptoms, engine=engine)
+            if result != expected:
+                print(f"Input: {text} ({engine})")
+                print(f"  Expected: {expected}")
+                print(f"  Got: {result}")
+                print("  ❌ FAIL\n")
+                all_passed = False
+
+    if all_passed:
+        print("✅ PASS\n")
+
+    return all_passed
+
+def test_each_word_scored_once():
+    """Test that unmatched input only runs fuzzy matching once per distinct word"""
+    print("Testing that each word is scored once...")
+    print("=" * 60)
+
+    # Import from main.py
+    import main
+
+    calls = []
+    original = main.find_best_fuzzy_match
+
+    def counting_match(word, threshold, engine=None):
+        calls.append(word)
+        return original(word, threshold, engine)
+
+    main.find_best_fuzzy_match = counting_match
+    try:
+        main.clear_symptom_cache()
+        result = main.find_matching_symptoms_cascade('help me doctor, i am not well', engine='linear')
+    finally:
+        main.find_best_fuzzy_match = original
+
+    words = main.normalize_input('help me doctor, i am not well').split()
+    print(f"Matches: {result}")
+    print(f"Fuzzy lookups: {len(calls)} for {len(set(words))} distinct words")
+
+    if result == [] and sorted(calls) == sorted(set(words)):
+        print("✅ PASS\n")
+        return True
+
+    print("❌ FAIL\n")
+    return False
+
+def main():
+    """Main test function"""
+    cascade_passed = test_cascade_matches_three_calls()
+    scored_once_passed = test_each_word_scored_once()
+
+    print("=" * 60)
+    if cascade_passed and scored_once_passed:
+        print("🎉 ALL TESTS PASSED! The matching cascade works correctly.")
+        return True
+    else:
+        print("❌ SOME TESTS FAILED! Please check the implementation.")
+        return False
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
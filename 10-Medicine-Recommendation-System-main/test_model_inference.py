@@ -0,0 +1,147 @@
+"""
+Test script to verify that single-pass model inference on a pre-shaped
+float32 input gives the labels of model.predict and the probabilities of
+predict_proba, for the SVC and a RandomForest, and that only tied SVC votes
+fall back to predict
+"""
+
+import copy
+import random
+import sys
+import os
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+def test_svc_labels_match_predict():
+    """Test get_predicted_value and get_model_prediction against the SVC's predict"""
+    print("Testing single-pass SVC inference against predict...")
+    print("=" * 60)
+
+    # Import from main.py
+    import numpy as np
+    from main import (DATASET_SYMPTOMS, diseases_list, get_model_prediction, get_predicted_value, model,
+                      rank_model_diseases, symptoms_to_model_input, symptoms_to_vector)
+
+    rng = random.Random(12)
+    vocabulary = sorted(DATASET_SYMPTOMS)
+    requests = [rng.sample(vocabulary, rng.randint(1, 6)) for _ in range(1000)]
+    expected = [diseases_list[label] for label in model.predict(np.array([symptoms_to_vector(matched) for matched in requests]))]
+
+    label_mismatches = sum(get_predicted_value(matched) != disease for matched, disease in zip(requests, expected))
+    differential_mismatches = 0
+    for matched, disease in zip(requests[:200], expected):
+        predicted, ranked = get_model_prediction(matched, 3)
+        if predicted != disease or ranked != rank_model_diseases(matched, 3):
+            differential_mismatches += 1
+
+    input_matrix = symptoms_to_model_input(['itching', 'skin_rash'])
+    print(f"Input: shape {input_matrix.shape}, {input_matrix.dtype}, {int(input_matrix.sum())} symptoms set")
+    print(f"1000 random symptom lists: {label_mismatches} label mismatches; "
+          f"200 with differentials: {differential_mismatches} mismatches")
+
+    if (not label_mismatches and not differential_mismatches and input_matrix.shape == (1, len(symptoms_to_vector([])))
+            and input_matrix.dtype == np.float32 and input_matrix.sum() == 2):
+        print("✅ PASS\n")
+        return True
+
+    print("❌ FAIL\n")
+    return False
+
+def test_svc_tied_votes():
+    """Test that the SVC's votes come from its decision values and only tied top votes fall back to predict"""
+    print("Testing SVC votes and tied top votes...")
+    print("=" * 60)
+
+    # Import main.py to count the predict fallbacks
+    import numpy as np
+    import main
+
+    rng = random.Random(14)
+    vocabulary = sorted(main.DATASET_SYMPTOMS)
+    requests = [rng.sample(vocabulary, rng.randint(1, 6)) for _ in range(1000)]
+    # The shared model keeps its own decision_function_shape; a copy gives sklearn's pairwise values
+    shape = main.model.decision_function_shape
+    ovo_model = copy.copy(main.model)
+    ovo_model.decision_function_shape = 'ovo'
+
+    fallbacks = tied = vote_mismatches = 0
+    for matched in requests:
+        decision = ovo_model.decision_function([main.symptoms_to_vector(matched)])[0]
+        expected = main.count_svc_votes(decision, len(main.model.classes_))
+        best, votes = main.get_model_scores(matched)
+        fallbacks += best is None
+        tied += np.count_nonzero(expected == expected.max()) > 1
+        if not np.array_equal(votes, expected):
+            vote_mismatches += 1
+
+    print(f"1000 random symptom lists: {fallbacks} predict fallbacks, {tied} tied top votes, "
+          f"{vote_mismatches} vote mismatches; model decision_function_shape: {shape!r}")
+    if (fallbacks == tied and fallbacks < len(requests) // 10 and not vote_mismatches
+            and main.model.decision_function_shape == shape != 'ovo'):
+        print("✅ PASS\n")
+        return True
+
+    print("❌ FAIL\n")
+    return False
+
+def test_forest_probabilities():
+    """Test forest_probabilities and the forest path of get_model_prediction against predict_proba"""
+    print("Testing single-pass RandomForest inference against predict_proba...")
+    print("=" * 60)
+
+    # Import main.py to swap in a RandomForest like the new model artifact
+    import numpy as np
+    from sklearn.ensemble import RandomForestClassifier
+    import main
+
+    features = main.training_data.drop(columns='prognosis')
+    forest = RandomForestClassifier(n_estimators=20, random_state=42)
+    forest.fit(features.to_numpy(), main.training_data['prognosis'].to_numpy())
+    symptom_to_index = {symptom: column for column, symptom in enumerate(features.columns)}
+
+    rng = random.Random(13)
+    vocabulary = sorted(main.DATASET_SYMPTOMS)
+    requests = [rng.sample(vocabulary, rng.randint(1, 6)) for _ in range(300)]
+
+    saved = main.model, main.symptom_to_index, main.MODEL_LABELS
+    probability_mismatches = 0
+    label_mismatches = 0
+    try:
+        main.model, main.symptom_to_index, main.MODEL_LABELS = forest, symptom_to_index, list(forest.classes_)
+        for matched in requests:
+            input_vector = main.symptoms_to_vector(matched)
+            expected = forest.predict_proba([input_vector])[0]
+            if not np.array_equal(main.forest_probabilities(forest, main.symptoms_to_model_input(matched)), expected):
+                probability_mismatches += 1
+            disease, ranked = main.get_model_prediction(matched, 5)
+            if disease != forest.predict([input_vector])[0] or abs(ranked[0]['score'] - expected.max()) > 1e-12:
+                label_mismatches += 1
+    finally:
+        main.model, main.symptom_to_index, main.MODEL_LABELS = saved
+
+    print(f"300 random symptom lists: {probability_mismatches} probability mismatches, {label_mismatches} label mismatches")
+    if not probability_mismatches and not label_mismatches:
+        print("✅ PASS\n")
+        return True
+
+    print("❌ FAIL\n")
+    return False
+
+def main():
+    """Main test function"""
+    svc_passed = test_svc_labels_match_predict()
+    tied_passed = test_svc_tied_votes()
+    forest_passed = test_forest_probabilities()
+
+    print("=" * 60)
+    if svc_passed and tied_passed and forest_passed:
+        print("🎉 ALL TESTS PASSED! Single-pass model inference works correctly.")
+        return True
+    else:
+        print("❌ SOME TESTS FAILED! Please check the implementation.")
+        return False
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
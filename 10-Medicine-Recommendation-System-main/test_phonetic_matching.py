@@ -0,0 +1,166 @@
+"""
+Test script to verify that sound-alike spellings from speech recognition are
+resolved through the phonetic key index, and that common words sharing a key
+with a symptom are not
+"""
+
+import sys
+import os
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+def test_phonetic_keys():
+    """Test that sound-alike spellings share a phonetic key"""
+    print("Testing phonetic keys...")
+    print("=" * 60)
+
+    # Import the function from main.py
+    from main import phonetic_key
+
+    groups = [
+        ['fever', 'feaver', 'fevr'],
+        ['cough', 'koff', 'cugh'],
+        ['headache', 'headack', 'hedake'],
+        ['nausea', 'nausia'],
+        ['vomiting', 'vomitting'],
+        ['dizziness', 'dizzyness'],
+        ['diarrhoea', 'diarrhea'],
+    ]
+
+    all_passed = True
+
+    for words in groups:
+        keys = [phonetic_key(word) for word in words]
+        print(f"{words} -> {keys}")
+        if len(set(keys)) == 1 and keys[0]:
+            print("  ✅ PASS\n")
+        else:
+            print("  ❌ FAIL\n")
+            all_passed = False
+
+    return all_passed
+
+def test_phonetic_matches():
+    """Test that sound-alike words resolve to dataset symptoms and common words do not"""
+    print("Testing phonetic matches...")
+    print("=" * 60)
+
+    # Import the function from main.py
+    from main import find_phonetic_match
+
+    test_cases = [
+        ('feaver', 'high_fever'),
+        ('nausia', 'nausea'),
+        ('headack', 'headache'),
+        ('sneesing', 'continuous_sneezing'),
+        ('shivring', 'shivering'),
+        ('koff', None),      # sounds like 'cough' but is spelled too differently
+        ('nose', None),      # sounds like 'nausea' but is much shorter
+        ('could', None),     # sounds like 'cold' but is a common word
+        ('very', None),
+        ('kof', None),       # too short to look up by sound
+    ]
+
+    all_passed = True
+
+    for word, expected in test_cases:
+        result = find_phonetic_match(word)
+        print(f"Input: {word!r}")
+        print(f"  Expected: {expected}")
+        print(f"  Got: {result}")
+        if result == expected:
+            print("  ✅ PASS\n")
+        else:
+            print("  ❌ FAIL\n")
+            all_passed = False
+
+    return all_passed
+
+def test_common_words_not_matched():
+    """Test that everyday words sharing a phonetic key with a symptom match nothing"""
+    print("Testing common words that sound like symptoms...")
+    print("=" * 60)
+
+    # Import the functions from main.py
+    from main import clear_symptom_cache, find_matching_symptoms, find_phonetic_match
+
+    test_cases = [
+        ('knees', []),
+        ('noise', []),
+        ('coffee', []),
+        ('cuff', []),
+        ('cove', []),
+        ('cave', []),
+        ('pain in my knees', []),
+        ('i drank coffee', []),
+        ('loud noise, headache', ['headache']),
+        ('stomach pain, noise', ['stomach_pain']),
+    ]
+
+    all_passed = True
+    clear_symptom_cache()
+
+    for text, expected in test_cases:
+        result = find_matching_symptoms(text)
+        phonetic = [find_phonetic_match(word) for word in text.replace(',', ' ').split()]
+        print(f"Input: {text!r}")
+        print(f"  Expected: {expected}")
+        print(f"  Got: {result}, phonetic matches: {phonetic}")
+        if result == expected and (expected or not any(phonetic)):
+            print("  ✅ PASS\n")
+        else:
+            print("  ❌ FAIL\n")
+            all_passed = False
+
+    return all_passed
+
+def test_phonetic_match_skips_fuzzy_matching():
+    """Test that sound-alike words in a transcript never call the fuzzy matcher"""
+    print("Testing that phonetic matches skip fuzzy matching...")
+    print("=" * 60)
+
+    # Import from main.py
+    import main
+
+    calls = []
+    original = main.find_best_fuzzy_match
+
+    def counting_match(word, threshold, engine=None):
+        calls.append(word)
+        return original(word, threshold, engine)
+
+    main.find_best_fuzzy_match = counting_match
+    try:
+        main.clear_symptom_cache()
+        result = main.find_matching_symptoms('feaver headack shivring', threshold=0.7)
+    finally:
+        main.find_best_fuzzy_match = original
+
+    print(f"Matches: {result}")
+    print(f"Fuzzy lookups: {calls}")
+    if result == ['high_fever', 'headache', 'shivering'] and not calls:
+        print("✅ PASS\n")
+        return True
+
+    print("❌ FAIL\n")
+    return False
+
+def main():
+    """Main test function"""
+    keys_passed = test_phonetic_keys()
+    matches_passed = test_phonetic_matches()
+    common_passed = test_common_words_not_matched()
+    skip_passed = test_phonetic_match_skips_fuzzy_matching()
+
+    print("=" * 60)
+    if keys_passed and matches_passed and common_passed and skip_passed:
+        print("🎉 ALL TESTS PASSED! Phonetic matching works correctly.")
+        return True
+    else:
+        print("❌ SOME TESTS FAILED! Please check the implementation.")
+        return False
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,107 @@
+"""
+Test script to verify that the Aho-Corasick phrase extractor finds the longest
+non-overlapping multi-word symptom phrases in a single pass over the tokens
+"""
+
+import random
+import sys
+import os
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+def longest_phrases_by_window(phrases, tokens):
+    """Reference implementation: try every window length at every start position"""
+    matches = {}
+    for start in range(len(tokens)):
+        for length in range(2, len(tokens) - start + 1):
+            window = tuple(tokens[start:start+length])
+            if window in phrases:
+                matches[start] = (length, phrases[window])
+    return matches
+
+def test_automaton_against_window_scan():
+    """Test the automaton against the window scan on random token sequences"""
+    print("Testing phrase automaton against the window scan...")
+    print("=" * 60)
+
+    # Import the functions from main.py
+    from main import build_phrase_automaton, find_phrase_matches
+
+    # Overlapping phrases exercise the failure links
+    phrases = {
+        ('runny', 'nose'): 'runny_nose',
+        ('sore', 'throat'): 'sore_throat',
+        ('pain', 'in', 'chest'): 'chest_pain',
+        ('in', 'chest', 'and', 'back'): 'chest_and_back',
+        ('throat', 'pain'): 'throat_pain',
+        ('nose', 'sore', 'throat', 'pain', 'in'): 'long_phrase',
+    }
+    vocabulary = sorted({token for tokens in phrases for token in tokens} | {'fever', 'and'})
+    automaton = build_phrase_automaton(phrases)
+
+    rng = random.Random(0)
+    all_passed = True
+
+    for _ in range(2000):
+        tokens = [rng.choice(vocabulary) for _ in range(rng.randint(0, 20))]
+        expected = longest_phrases_by_window(phrases, tokens)
+        result = find_phrase_matches(automaton, tokens)
+        if result != expected:
+            print(f"Tokens: {tokens}")
+            print(f"  Expected: {expected}")
+            print(f"  Got: {result}")
+            print("  ❌ FAIL\n")
+            all_passed = False
+            break
+
+    if all_passed:
+        print("✅ PASS\n")
+
+    return all_passed
+
+def test_phrases_in_find_matching_symptoms():
+    """Test that multi-word aliases are picked up inside longer input"""
+    print("Testing phrase matching in find_matching_symptoms...")
+    print("=" * 60)
+
+    # Import the function from main.py
+    from main import find_matching_symptoms
+
+    test_cases = [
+        ('head ache', ['headache']),
+        ('bad head ache today', ['headache']),
+        ('head ache and chills', ['headache', 'chills']),
+    ]
+
+    all_passed = True
+
+    for user_input, expected in test_cases:
+        result = find_matching_symptoms(user_input, threshold=0.7)
+        print(f"Input: {user_input}")
+        print(f"  Expected: {expected}")
+        print(f"  Got: {result}")
+        if result == expected:
+            print("  ✅ PASS\n")
+        else:
+            print("  ❌ FAIL\n")
+            all_passed = False
+
+    return all_passed
+
+def main():
+    """Main test function"""
+    automaton_passed = test_automaton_against_window_scan()
+    symptoms_passed = test_phrases_in_find_matching_symptoms()
+
+    print("=" * 60)
+    if automaton_passed and symptoms_passed:
+        print("🎉 ALL TESTS PASSED! Phrase extraction works correctly.")
+        return True
+    else:
+        print("❌ SOME TESTS FAILED! Please check the implementation.")
+        return False
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
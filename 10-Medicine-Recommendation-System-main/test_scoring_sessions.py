@@ -0,0 +1,206 @@
+"""
+Test script to verify that incremental scoring sessions predict the same
+diseases as scoring the session's symptoms from scratch, and that sessions
+expire and are evicted from the in-memory store
+"""
+
+import random
+import sys
+import os
+import time
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+def test_incremental_matches_full_scoring():
+    """Test random add/remove sequences against predict_disease_from_symptoms"""
+    print("Testing incremental session scoring against full scoring...")
+    print("=" * 60)
+
+    # Import from main.py
+    import numpy as np
+    from main import (DISEASE_SYMPTOMS, create_scoring_session, delete_scoring_session, predict_disease_from_symptoms,
+                      score_candidate_diseases, update_scoring_session)
+
+    rng = random.Random(11)
+    vocabulary = sorted({symptom for symptoms in DISEASE_SYMPTOMS.values() for symptom in symptoms}) + ['unknown']
+    disease_mismatches = 0
+    score_mismatches = 0
+    updates = 0
+
+    for _ in range(100):
+        session_id = create_scoring_session()
+        symptoms = []
+        for _ in range(12):
+            # Mostly additions, with removals of present (and sometimes absent) symptoms
+            if symptoms and rng.random() < 0.35:
+                symptom = rng.choice(symptoms) if rng.random() < 0.9 else rng.choice(vocabulary)
+                result = update_scoring_session(session_id, remove=[symptom])
+                if symptom in symptoms:
+                    symptoms.remove(symptom)
+            else:
+                symptom = rng.choice(vocabulary)
+                result = update_scoring_session(session_id, add=[symptom])
+                if symptom not in symptoms:
+                    symptoms.append(symptom)
+            updates += 1
+
+            if result['symptoms'] != symptoms or result['disease'] != predict_disease_from_symptoms(symptoms, 'matrix'):
+                disease_mismatches += 1
+            rows, scores = score_candidate_diseases(symptoms)
+            expected_score = float(scores.max()) if len(scores) else None
+            if result['score'] is not None and not np.isclose(result['score'], expected_score):
+                score_mismatches += 1
+        delete_scoring_session(session_id)
+
+    print(f"{updates} updates: {disease_mismatches} disease mismatches, {score_mismatches} score mismatches")
+    if not disease_mismatches and not score_mismatches:
+        print("✅ PASS\n")
+        return True
+
+    print("❌ FAIL\n")
+    return False
+
+def test_session_expiry():
+    """Test TTL expiry, the session limit and recounting after the indexes are rebuilt"""
+    print("Testing session expiry and eviction...")
+    print("=" * 60)
+
+    # Import main.py to change the session settings
+    import main
+
+    ttl, limit = main.SCORING_SESSION_TTL, main.SCORING_SESSION_LIMIT
+    try:
+        main.SCORING_SESSION_TTL = 0.05
+        expiring = main.create_scoring_session(['itching'])
+        time.sleep(0.1)
+        expired = main.update_scoring_session(expiring, add=['skin_rash']) is None
+        print(f"Expired after TTL: {expired}")
+
+        main.SCORING_SESSION_TTL = ttl
+        main.SCORING_SESSION_LIMIT = 3
+        sessions = [main.create_scoring_session(['itching']) for _ in range(3)]
+        # Touching the first session makes the second the least recently used
+        main.update_scoring_session(sessions[0])
+        newest = main.create_scoring_session(['itching'])
+        kept = [main.update_scoring_session(session_id) is not None for session_id in sessions + [newest]]
+        print(f"Limit 3, sessions kept: {kept}")
+
+        # A rebuild of the scoring indexes makes the session recount its symptoms
+        main.build_disease_scoring_indexes()
+        rebuilt = main.update_scoring_session(newest, add=['skin_rash', 'nodal_skin_eruptions'])
+        print(f"After rebuilding the indexes: {rebuilt['disease']!r}")
+        deleted = main.delete_scoring_session(newest) and not main.delete_scoring_session(newest)
+    finally:
+        main.SCORING_SESSION_TTL, main.SCORING_SESSION_LIMIT = ttl, limit
+
+    if expired and kept == [True, False, True, True] and rebuilt['disease'] == 'Fungal infection' and deleted:
+        print("✅ PASS\n")
+        return True
+
+    print("❌ FAIL\n")
+    return False
+
+def test_concurrent_sessions():
+    """Test that a busy session does not block others and that concurrent updates to one session all count"""
+    print("Testing concurrent session updates...")
+    print("=" * 60)
+
+    # Import main.py to hold a session's lock
+    import threading
+    import main
+
+    busy = main.create_scoring_session(['itching'])
+    other = main.create_scoring_session(['itching'])
+    results = []
+    with main.SCORING_SESSIONS[busy]['lock']:
+        worker = threading.Thread(target=lambda: results.append(main.update_scoring_session(other, add=['skin_rash'])))
+        worker.start()
+        worker.join(timeout=5)
+    not_blocked = bool(results) and results[0]['symptoms'] == ['itching', 'skin_rash']
+
+    # Threads adding and removing different symptoms of one session
+    shared = main.create_scoring_session()
+    vocabulary = sorted({symptom for symptoms in main.DISEASE_SYMPTOMS.values() for symptom in symptoms})
+    groups = [vocabulary[start::8] for start in range(8)]
+
+    def churn(symptoms):
+        for symptom in symptoms:
+            main.update_scoring_session(shared, add=[symptom])
+        for symptom in symptoms[1:]:
+            main.update_scoring_session(shared, remove=[symptom])
+
+    threads = [threading.Thread(target=churn, args=(group,)) for group in groups]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    remaining = [group[0] for group in groups]
+    session = main.SCORING_SESSIONS[shared]
+    expected = {}
+    for symptom in remaining:
+        for row in main.DISEASE_POSTINGS['postings'].get(symptom, ()):
+            expected[int(row)] = expected.get(int(row), 0) + 1
+    counts_match = sorted(session['symptoms']) == sorted(remaining) and session['counts'] == expected
+    for session_id in (busy, other, shared):
+        main.delete_scoring_session(session_id)
+
+    print(f"Other session updated while one was locked: {not_blocked}; "
+          f"counts after 8 threads of updates: {'match' if counts_match else 'differ'}")
+    if not_blocked and counts_match:
+        print("✅ PASS\n")
+        return True
+
+    print("❌ FAIL\n")
+    return False
+
+def test_session_endpoints():
+    """Test the /api/sessions endpoints"""
+    print("Testing /api/sessions...")
+    print("=" * 60)
+
+    # Import the Flask app from main.py
+    from main import app
+
+    client = app.test_client()
+    created = client.post('/api/sessions', data={'symptoms': 'itching'})
+    session_id = created.get_json()['session']
+    added = client.post(f'/api/sessions/{session_id}/symptoms', data={'add': 'skin rash, nodal skin eruptions'}).get_json()
+    removed = client.post(f'/api/sessions/{session_id}/symptoms', data={'remove': 'itching'}).get_json()
+    current = client.get(f'/api/sessions/{session_id}').get_json()
+    print(f"Created: {created.status_code} {created.get_json()['symptoms']}")
+    print(f"Added: {added['added']} -> {added['disease']!r}; removed: {removed['removed']} -> {removed['symptoms']}")
+
+    empty = client.post(f'/api/sessions/{session_id}/symptoms', data={}).status_code
+    deleted = client.delete(f'/api/sessions/{session_id}').status_code
+    unknown = client.post(f'/api/sessions/{session_id}/symptoms', data={'add': 'itching'}).status_code
+    print(f"No changes: {empty}; delete: {deleted}; after delete: {unknown}")
+
+    if (created.status_code == 201 and added['disease'] == 'Fungal infection'
+            and removed['symptoms'] == ['skin_rash', 'nodal_skin_eruptions'] and current['symptoms'] == removed['symptoms']
+            and empty == 400 and deleted == 200 and unknown == 404):
+        print("✅ PASS\n")
+        return True
+
+    print("❌ FAIL\n")
+    return False
+
+def main():
+    """Main test function"""
+    incremental_passed = test_incremental_matches_full_scoring()
+    expiry_passed = test_session_expiry()
+    concurrent_passed = test_concurrent_sessions()
+    endpoints_passed = test_session_endpoints()
+
+    print("=" * 60)
+    if incremental_passed and expiry_passed and concurrent_passed and endpoints_passed:
+        print("🎉 ALL TESTS PASSED! Incremental scoring sessions work correctly.")
+        return True
+    else:
+        print("❌ SOME TESTS FAILED! Please check the implementation.")
+        return False
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
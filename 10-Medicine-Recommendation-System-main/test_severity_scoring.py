@@ -0,0 +1,127 @@
+"""
+Test script to verify the severity-weighted disease scoring mode and that it
+can be selected per request
+"""
+
+import random
+import sys
+import os
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+def weighted_scores_loop(matched_symptoms, disease_symptoms, severity):
+    """Reference: score each disease by the severity weights of its matching symptoms"""
+    scores = {}
+    for disease, symptoms in disease_symptoms.items():
+        matching_weight = sum(max(severity.get(symptom, 0), 1) for symptom in matched_symptoms if symptom in symptoms)
+        if matching_weight:
+            disease_weight = sum(max(severity.get(symptom, 0), 1) for symptom in symptoms)
+            matched_weight = sum(max(severity.get(symptom, 0), 1) for symptom in matched_symptoms)
+            scores[disease] = (matching_weight / disease_weight) * 0.3 + (matching_weight / matched_weight) * 0.7
+    return scores
+
+def test_weights_aligned():
+    """Test that the weight vector follows the incidence columns and the totals the disease symptoms"""
+    print("Testing severity weights and disease totals...")
+    print("=" * 60)
+
+    # Import from main.py
+    from main import DISEASE_INCIDENCE, DISEASE_SEVERITY, DISEASE_SYMPTOMS, SYMPTOM_SEVERITY
+
+    misaligned = [symptom for symptom, column in DISEASE_INCIDENCE['symptom_columns'].items()
+                  if DISEASE_SEVERITY['weights'][column] != max(SYMPTOM_SEVERITY.get(symptom, 0), 1)]
+    wrong_totals = [disease for row, disease in enumerate(DISEASE_INCIDENCE['diseases'])
+                    if DISEASE_SEVERITY['totals'][row] != sum(max(SYMPTOM_SEVERITY.get(symptom, 0), 1)
+                                                              for symptom in DISEASE_SYMPTOMS[disease])]
+
+    print(f"{len(misaligned)} misaligned weights, {len(wrong_totals)} wrong disease totals")
+    if not misaligned and not wrong_totals:
+        print("✅ PASS\n")
+        return True
+
+    print("❌ FAIL\n")
+    return False
+
+def test_scores_match_loop():
+    """Test the weighted matrix scores against the per-disease reference loop"""
+    print("Testing severity-weighted scores against a per-disease loop...")
+    print("=" * 60)
+
+    # Import from main.py
+    import numpy as np
+    from main import (DISEASE_INCIDENCE, DISEASE_SYMPTOMS, SYMPTOM_SEVERITY, build_disease_severity,
+                      get_disease_bonuses, score_diseases, score_diseases_severity)
+
+    rng = random.Random(9)
+    vocabulary = sorted(DISEASE_INCIDENCE['symptom_columns']) + ['unknown']
+    mismatches = 0
+    for _ in range(1000):
+        matched = rng.sample(vocabulary, rng.randint(1, 5))
+        scores = score_diseases_severity(matched) - get_disease_bonuses(matched, DISEASE_INCIDENCE)
+        expected = weighted_scores_loop(matched, DISEASE_SYMPTOMS, SYMPTOM_SEVERITY)
+        for row, disease in enumerate(DISEASE_INCIDENCE['diseases']):
+            if disease in expected:
+                mismatches += not np.isclose(scores[row], expected[disease])
+            else:
+                mismatches += scores[row] != -np.inf
+
+    # With every weight equal the weighted scores are the unweighted ones
+    uniform = build_disease_severity(DISEASE_INCIDENCE, {})
+    matched = ['itching', 'skin_rash', 'chills', 'unknown']
+    uniform_equal = np.allclose(score_diseases_severity(matched, DISEASE_INCIDENCE, uniform), score_diseases(matched))
+
+    print(f"{mismatches} mismatches, uniform weights equal unweighted scores: {uniform_equal}")
+    if not mismatches and uniform_equal:
+        print("✅ PASS\n")
+        return True
+
+    print("❌ FAIL\n")
+    return False
+
+def test_select_per_request():
+    """Test that the severity mode is selected per request and unknown modes are rejected"""
+    print("Testing per-request scoring selection...")
+    print("=" * 60)
+
+    # Import from main.py
+    from main import app, predict_disease_from_symptoms
+
+    matched = ['itching', 'skin_rash', 'chills']
+    default = predict_disease_from_symptoms(matched)
+    weighted = predict_disease_from_symptoms(matched, 'severity')
+    print(f"{matched}: default {default!r}, severity-weighted {weighted!r}")
+
+    client = app.test_client()
+    response = client.get('/api/predict/differential?symptoms=itching, skin rash, chills&scoring=severity')
+    top = response.get_json()['scoring'][0]['disease']
+    bad_mode = client.get('/api/predict/differential?symptoms=itching&scoring=loudest').status_code
+    page = client.post('/predict', data={'symptoms': 'itching, skin rash, chills', 'scoring': 'severity'})
+    rejected = client.post('/predict', data={'symptoms': 'itching', 'scoring': 'loudest'})
+    print(f"Differential top disease: {top!r}; unknown mode: {bad_mode}")
+
+    if (default == 'Fungal infection' and weighted == 'Dengue' and top == 'Dengue' and bad_mode == 400
+            and b'Dengue' in page.data and b'Unknown scoring mode' in rejected.data):
+        print("✅ PASS\n")
+        return True
+
+    print("❌ FAIL\n")
+    return False
+
+def main():
+    """Main test function"""
+    weights_passed = test_weights_aligned()
+    scores_passed = test_scores_match_loop()
+    select_passed = test_select_per_request()
+
+    print("=" * 60)
+    if weights_passed and scores_passed and select_passed:
+        print("🎉 ALL TESTS PASSED! Severity-weighted scoring works correctly.")
+        return True
+    else:
+        print("❌ SOME TESTS FAILED! Please check the implementation.")
+        return False
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,103 @@
+"""
+Test script to verify that clean_speech_input applies the corrections from
+dataset/speech_corrections.csv in a single pass
+"""
+
+import sys
+import os
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+def test_speech_corrections():
+    """Test the corrections for common mispronunciations"""
+    print("Testing speech input corrections...")
+    print("=" * 60)
+
+    # Import the function from main.py
+    from main import clean_speech_input
+
+    test_cases = [
+        ('Feaver', 'fever'),
+        ('I have a feaver and a couh!', 'i have a fever and a cough'),
+        ('headack, throte pain', 'headache, throat pain'),
+        ('stomache   ache.', 'stomach ache'),
+        ('aching body', 'ache body'),
+        ('colt, codl, cugh', 'cold, cold, cough'),
+        ('fevers', 'fevers'),            # whole words only
+        ('stomachache', 'stomachache'),  # no partial replacement
+        ('', ''),
+    ]
+
+    all_passed = True
+
+    for text, expected in test_cases:
+        result = clean_speech_input(text)
+        print(f"Input: {text!r}")
+        print(f"  Expected: {expected!r}")
+        print(f"  Got: {result!r}")
+        if result == expected:
+            print("  ✅ PASS\n")
+        else:
+            print("  ❌ FAIL\n")
+            all_passed = False
+
+    return all_passed
+
+def test_matches_per_pattern_cleaning():
+    """Test that the single compiled regex gives the same output as one re.sub per correction"""
+    print("Testing single-pass cleaning against per-correction cleaning...")
+    print("=" * 60)
+
+    # Import the functions from main.py and the benchmark script
+    from main import clean_speech_input
+    from benchmark_speech_cleaning import build_transcript, clean_speech_input_per_pattern
+
+    all_passed = True
+
+    for word_count in [10, 100, 1000]:
+        for seed in range(5):
+            transcript = build_transcript(word_count, seed)
+            if clean_speech_input(transcript) != clean_speech_input_per_pattern(transcript):
+                print(f"Transcript ({word_count} words, seed {seed}) differs")
+                all_passed = False
+
+    print("✅ PASS\n" if all_passed else "❌ FAIL\n")
+
+    return all_passed
+
+def test_corrections_loaded_from_file():
+    """Test that the corrections come from the data file"""
+    print("Testing corrections data file...")
+    print("=" * 60)
+
+    # Import from main.py
+    from main import BASE_DIR, SPEECH_FUZZY_CORRECTIONS, load_speech_corrections
+
+    corrections = load_speech_corrections(os.path.join(BASE_DIR, "dataset/speech_corrections.csv"))
+
+    if corrections == SPEECH_FUZZY_CORRECTIONS and corrections.get('feaver') == 'fever':
+        print(f"Loaded {len(corrections)} corrections")
+        print("✅ PASS\n")
+        return True
+
+    print("❌ FAIL\n")
+    return False
+
+def main():
+    """Main test function"""
+    corrections_passed = test_speech_corrections()
+    single_pass_passed = test_matches_per_pattern_cleaning()
+    file_passed = test_corrections_loaded_from_file()
+
+    print("=" * 60)
+    if corrections_passed and single_pass_passed and file_passed:
+        print("🎉 ALL TESTS PASSED! Speech input cleaning works correctly.")
+        return True
+    else:
+        print("❌ SOME TESTS FAILED! Please check the implementation.")
+        return False
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,204 @@
+"""
+Test script to verify the bounded LRU cache in front of find_matching_symptoms:
+hit/miss counters, LRU eviction, TTL expiry and invalidation on reload
+"""
+
+import sys
+import os
+import time
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+def test_hits_and_misses():
+    """Test that repeated inputs are served from the cache"""
+    print("Testing cache hits and misses...")
+    print("=" * 60)
+
+    # Import the functions from main.py
+    from main import find_matching_symptoms, clear_symptom_cache, get_symptom_cache_stats
+
+    clear_symptom_cache()
+    before = get_symptom_cache_stats()
+
+    first = find_matching_symptoms('Itching, skin rash', threshold=0.7)
+    # Same normalized input and threshold is a hit
+    second = find_matching_symptoms('itching skin rash', threshold=0.7)
+    # A different threshold is a separate entry
+    find_matching_symptoms('itching skin rash', threshold=0.6)
+
+    after = get_symptom_cache_stats()
+    hits = after['hits'] - before['hits']
+    misses = after['misses'] - before['misses']
+
+    print(f"Matches: {first}")
+    print(f"Hits: {hits}, misses: {misses}, size: {after['size']}")
+
+    if first == second and hits == 1 and misses == 2 and after['size'] == 2:
+        print("✅ PASS\n")
+        return True
+
+    print("❌ FAIL\n")
+    return False
+
+def test_cached_result_is_copied():
+    """Test that callers modifying the returned list do not change the cache"""
+    print("Testing cached results are copied...")
+    print("=" * 60)
+
+    # Import the functions from main.py
+    from main import find_matching_symptoms, clear_symptom_cache
+
+    clear_symptom_cache()
+    result = find_matching_symptoms('chills', threshold=0.6)
+    result.append('not_a_symptom')
+    result = find_matching_symptoms('chills', threshold=0.6)
+
+    print(f"Matches: {result}")
+    if result == ['chills']:
+        print("✅ PASS\n")
+        return True
+
+    print("❌ FAIL\n")
+    return False
+
+def test_lru_eviction():
+    """Test that the least recently used entry is evicted when the cache is full"""
+    print("Testing LRU eviction...")
+    print("=" * 60)
+
+    # Import the functions from main.py
+    from main import find_matching_symptoms, clear_symptom_cache, configure_symptom_cache, get_symptom_cache_stats
+
+    original_size = get_symptom_cache_stats()['capacity']
+    configure_symptom_cache(size=2)
+    clear_symptom_cache()
+    before = get_symptom_cache_stats()
+
+    find_matching_symptoms('cough', threshold=0.6)
+    find_matching_symptoms('chills', threshold=0.6)
+    find_matching_symptoms('cough', threshold=0.6)      # cough is now most recently used
+    find_matching_symptoms('headache', threshold=0.6)   # evicts chills
+    find_matching_symptoms('cough', threshold=0.6)      # still cached
+
+    after = get_symptom_cache_stats()
+    evictions = after['evictions'] - before['evictions']
+    hits = after['hits'] - before['hits']
+
+    configure_symptom_cache(size=original_size)
+
+    print(f"Evictions: {evictions}, hits: {hits}, size: {after['size']}")
+    if evictions == 1 and hits == 2 and after['size'] == 2:
+        print("✅ PASS\n")
+        return True
+
+    print("❌ FAIL\n")
+    return False
+
+def test_ttl_expiry():
+    """Test that entries older than the TTL are recomputed"""
+    print("Testing TTL expiry...")
+    print("=" * 60)
+
+    # Import the functions from main.py
+    from main import find_matching_symptoms, clear_symptom_cache, configure_symptom_cache, get_symptom_cache_stats
+
+    original_ttl = get_symptom_cache_stats()['ttl']
+    configure_symptom_cache(ttl=0.05)
+    clear_symptom_cache()
+    before = get_symptom_cache_stats()
+
+    find_matching_symptoms('vomiting', threshold=0.6)
+    time.sleep(0.1)
+    find_matching_symptoms('vomiting', threshold=0.6)
+
+    after = get_symptom_cache_stats()
+    expirations = after['expirations'] - before['expirations']
+    hits = after['hits'] - before['hits']
+
+    configure_symptom_cache(ttl=original_ttl)
+
+    print(f"Expirations: {expirations}, hits: {hits}")
+    if expirations == 1 and hits == 0:
+        print("✅ PASS\n")
+        return True
+
+    print("❌ FAIL\n")
+    return False
+
+def test_invalidation_on_reload():
+    """Test that rebuilding the dataset mappings empties the cache"""
+    print("Testing invalidation when the dataset mappings are rebuilt...")
+    print("=" * 60)
+
+    # Import the functions from main.py
+    from main import find_matching_symptoms, initialize_dataset_mappings, get_symptom_cache_stats
+
+    find_matching_symptoms('fatigue', threshold=0.6)
+    before = get_symptom_cache_stats()
+    initialize_dataset_mappings()
+    after = get_symptom_cache_stats()
+
+    print(f"Size before: {before['size']}, after: {after['size']}")
+    if before['size'] > 0 and after['size'] == 0 and after['invalidations'] > before['invalidations']:
+        print("✅ PASS\n")
+        return True
+
+    print("❌ FAIL\n")
+    return False
+
+def test_lookup_during_rebuild_not_served():
+    """Test that a match cached while the mappings are being rebuilt is dropped once the rebuild completes"""
+    print("Testing lookups made while the dataset mappings are rebuilt...")
+    print("=" * 60)
+
+    # Import main.py to look up a symptom from inside the rebuild
+    import main
+
+    rebuild_indexes = main.build_disease_scoring_indexes
+
+    def rebuild_with_lookup():
+        rebuild_indexes()
+        main.find_matching_symptoms('fatigue', threshold=0.6)
+
+    try:
+        main.build_disease_scoring_indexes = rebuild_with_lookup
+        main.initialize_dataset_mappings()
+    finally:
+        main.build_disease_scoring_indexes = rebuild_indexes
+
+    after_rebuild = main.get_symptom_cache_stats()
+    main.find_matching_symptoms('fatigue', threshold=0.6)
+    after_lookup = main.get_symptom_cache_stats()
+
+    print(f"Size after rebuild: {after_rebuild['size']}, "
+          f"misses on the next lookup: {after_lookup['misses'] - after_rebuild['misses']}")
+    if after_rebuild['size'] == 0 and after_lookup['misses'] == after_rebuild['misses'] + 1:
+        print("✅ PASS\n")
+        return True
+
+    print("❌ FAIL\n")
+    return False
+
+def main():
+    """Main test function"""
+    results = [
+        test_hits_and_misses(),
+        test_cached_result_is_copied(),
+        test_lru_eviction(),
+        test_ttl_expiry(),
+        test_invalidation_on_reload(),
+        test_lookup_during_rebuild_not_served(),
+    ]
+
+    print("=" * 60)
+    if all(results):
+        print("🎉 ALL TESTS PASSED! The symptom cache works correctly.")
+        return True
+    else:
+        print("❌ SOME TESTS FAILED! Please check the implementation.")
+        return False
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,217 @@
+"""
+Test script to verify that the prebuilt symptom index round-trips the symptom
+structures and that missing, stale, foreign or damaged files are rejected,
+including files built with other code-level settings
+"""
+
+import subprocess
+import sys
+import os
+import tempfile
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+TEST_INPUTS = ['fever', 'koff and hedake', 'itching, skin rash', 'nausia', 'stomak pain', 'breathlesness', 'xyz']
+
+def test_index_round_trip():
+    """Test that matching gives the same results after loading a saved index"""
+    print("Testing symptom index round trip...")
+    print("=" * 60)
+
+    # Import from main.py
+    import main
+
+    main.initialize_dataset_mappings()
+    engines = sorted(main.FUZZY_MATCH_ENGINES)
+    expected = {(text, engine): main.find_matching_symptoms_cascade(text, engine)
+                for text in TEST_INPUTS for engine in engines}
+    suggestions = main.suggest_symptoms('skin')
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = main.save_symptom_index(os.path.join(directory, 'symptom_index.bin'))
+        loaded = main.load_symptom_index(path)
+
+        results = {(text, engine): main.find_matching_symptoms_cascade(text, engine)
+                   for text in TEST_INPUTS for engine in engines}
+        mapped = not main.SYMPTOM_CHAR_MATRIX['codes'].flags.writeable
+        same_suggestions = main.suggest_symptoms('skin') == suggestions
+
+        # Release the mapped arrays before the file is removed
+        main.initialize_dataset_mappings()
+
+    print(f"Loaded: {loaded}, memory-mapped: {mapped}")
+    if loaded and mapped and results == expected and same_suggestions:
+        print("✅ PASS\n")
+        return True
+
+    print("❌ FAIL\n")
+    return False
+
+def test_rejected_index_files():
+    """Test that missing, foreign and outdated index files are not loaded"""
+    print("Testing rejected index files...")
+    print("=" * 60)
+
+    # Import from main.py
+    import main
+
+    all_passed = True
+
+    with tempfile.TemporaryDirectory() as directory:
+        missing = main.load_symptom_index(os.path.join(directory, 'missing.bin'))
+
+        foreign_path = os.path.join(directory, 'foreign.bin')
+        with open(foreign_path, 'wb') as f:
+            f.write(b'not a symptom index')
+        foreign = main.load_symptom_index(foreign_path)
+
+        path = main.save_symptom_index(os.path.join(directory, 'symptom_index.bin'))
+        original_version = main.SYMPTOM_INDEX_VERSION
+        main.SYMPTOM_INDEX_VERSION = original_version + 1
+        try:
+            outdated = main.load_symptom_index(path)
+        finally:
+            main.SYMPTOM_INDEX_VERSION = original_version
+
+        # Code-level settings baked into the stored structures
+        original_ngram_size = main.NGRAM_SIZE
+        main.NGRAM_SIZE = original_ngram_size + 1
+        try:
+            other_ngram_size = main.load_symptom_index(path)
+        finally:
+            main.NGRAM_SIZE = original_ngram_size
+
+        main.COMMON_SYMPTOM_MAPPINGS['temperature'] = 'high_fever'
+        try:
+            other_mappings = main.load_symptom_index(path)
+        finally:
+            del main.COMMON_SYMPTOM_MAPPINGS['temperature']
+
+        # An edited normalize_input, which every index builder uses (another function's source stands in)
+        position = main.SYMPTOM_INDEX_FUNCTIONS.index(main.normalize_input)
+        main.SYMPTOM_INDEX_FUNCTIONS[position] = main.normalize_disease_name
+        try:
+            other_normalization = main.load_symptom_index(path)
+        finally:
+            main.SYMPTOM_INDEX_FUNCTIONS[position] = main.normalize_input
+
+        current = main.load_symptom_index(path)
+        # Release the mapped arrays before the file is removed
+        main.initialize_dataset_mappings()
+
+    for label, result in [('Missing file', missing), ('Foreign file', foreign), ('Other version', outdated),
+                          ('Other NGRAM_SIZE', other_ngram_size), ('Other COMMON_SYMPTOM_MAPPINGS', other_mappings),
+                          ('Other normalize_input', other_normalization)]:
+        print(f"{label}: loaded {result}")
+        if result:
+            all_passed = False
+
+    print(f"Unchanged settings: loaded {current}")
+    if not current:
+        all_passed = False
+
+    print("✅ PASS\n" if all_passed else "❌ FAIL\n")
+
+    return all_passed
+
+def test_damaged_index_files():
+    """Test that truncated and corrupt index files are not loaded and leave the current structures intact"""
+    print("Testing damaged index files...")
+    print("=" * 60)
+
+    # Import from main.py
+    import main
+
+    main.initialize_dataset_mappings()
+    expected = main.find_matching_symptoms_cascade('koff and hedake')
+    symptoms = len(main.DATASET_SYMPTOMS)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = main.save_symptom_index(os.path.join(directory, 'symptom_index.bin'))
+        with open(path, 'rb') as f:
+            data = f.read()
+        header_end = len(main.SYMPTOM_INDEX_MAGIC) + 8
+
+        damaged = {
+            'Truncated file': data[:len(data) // 2],
+            'Truncated header': data[:header_end + 10],
+            'Corrupt header': data[:header_end] + b'\xff' * 32 + data[header_end + 32:],
+            'Corrupt objects': data[:-200] + b'\x00' * 200,
+        }
+        results = {}
+        for label, content in damaged.items():
+            damaged_path = os.path.join(directory, 'damaged.bin')
+            with open(damaged_path, 'wb') as f:
+                f.write(content)
+            results[label] = main.load_symptom_index(damaged_path)
+
+        # Startup falls back to the dataset files
+        check = "import main; print(len(main.DATASET_SYMPTOMS))"
+        startup = subprocess.run([sys.executable, '-W', 'ignore', '-c', check], capture_output=True, text=True,
+                                 cwd=os.path.dirname(os.path.abspath(__file__)),
+                                 env=dict(os.environ, SYMPTOM_INDEX_PATH=damaged_path))
+
+    all_passed = True
+    for label, result in results.items():
+        print(f"{label}: loaded {result}")
+        if result:
+            all_passed = False
+
+    intact = main.find_matching_symptoms_cascade('koff and hedake') == expected and len(main.DATASET_SYMPTOMS) == symptoms
+    print(f"Current structures intact: {intact}; startup with a corrupt file: "
+          f"exit {startup.returncode}, {startup.stdout.strip()} symptoms")
+    if not intact or startup.returncode != 0 or startup.stdout.strip() != str(symptoms):
+        all_passed = False
+
+    print("✅ PASS\n" if all_passed else "❌ FAIL\n")
+
+    return all_passed
+
+def test_startup_from_index():
+    """Test that starting from a current index reads no dataset CSV and keeps the large structures mapped"""
+    print("Testing startup from the prebuilt index...")
+    print("=" * 60)
+
+    # Import from main.py
+    import main
+
+    # A fresh interpreter, so the imports above have not read any CSV yet
+    check = ("import main; "
+             "print(sorted(main.DATASET_FRAMES), main.SYMSPELL_INDEX['keys'].flags.writeable, "
+             "main.SYMPTOM_NGRAM_INDEX['postings']['ids'].flags.writeable, "
+             "main.NAIVE_BAYES['log_likelihood'].flags.writeable)")
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = main.save_symptom_index(os.path.join(directory, 'symptom_index.bin'))
+        result = subprocess.run([sys.executable, '-W', 'ignore', '-c', check], capture_output=True, text=True,
+                                cwd=os.path.dirname(os.path.abspath(__file__)),
+                                env=dict(os.environ, SYMPTOM_INDEX_PATH=path))
+
+    output = result.stdout.strip()
+    print(f"CSV files read, writeable SymSpell / n-gram / Naive Bayes arrays: {output}")
+    if output == "[] False False False":
+        print("✅ PASS\n")
+        return True
+
+    print("❌ FAIL\n")
+    return False
+
+def main():
+    """Main test function"""
+    round_trip_passed = test_index_round_trip()
+    rejected_passed = test_rejected_index_files()
+    damaged_passed = test_damaged_index_files()
+    startup_passed = test_startup_from_index()
+
+    print("=" * 60)
+    if round_trip_passed and rejected_passed and damaged_passed and startup_passed:
+        print("🎉 ALL TESTS PASSED! The symptom index works correctly.")
+        return True
+    else:
+        print("❌ SOME TESTS FAILED! Please check the implementation.")
+        return False
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,185 @@
+"""
+Test script to verify that the compiled rule table gives the same results as
+the hard-coded special-case rules and that the rule file is reloaded when it
+changes
+"""
+
+import json
+import tempfile
+import sys
+import os
+import time
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+def test_rules_match_legacy():
+    """Test the compiled single-symptom and cluster rules against the hard-coded ones"""
+    print("Testing compiled rules against the hard-coded rules...")
+    print("=" * 60)
+
+    # Import the functions from main.py and the benchmark script
+    from main import apply_symptom_rules
+    from benchmark_symptom_rules import apply_rules_legacy, build_requests
+
+    requests = build_requests(20000)
+    mismatches = [matched for matched in requests if apply_symptom_rules(matched) != apply_rules_legacy(matched)]
+
+    print(f"{len(requests)} symptom lists, {len(mismatches)} mismatches")
+    if not mismatches:
+        print("✅ PASS\n")
+        return True
+
+    print(f"First mismatches: {mismatches[:3]}")
+    print("❌ FAIL\n")
+    return False
+
+def test_bonuses_match_legacy():
+    """Test the bitmask bonuses against any() scans over the bonus symptom sets"""
+    print("Testing compiled disease bonuses...")
+    print("=" * 60)
+
+    # Import from main.py and the benchmark scripts
+    from main import DISEASE_INCIDENCE, get_disease_bonuses
+    from benchmark_disease_scoring import DISEASE_BONUS_RULES
+    from benchmark_symptom_rules import build_requests
+
+    mismatches = 0
+    for matched in build_requests(5000, seed=14):
+        bonuses = get_disease_bonuses(matched, DISEASE_INCIDENCE)
+        for disease, symptoms, bonus in DISEASE_BONUS_RULES:
+            row = DISEASE_INCIDENCE['disease_rows'].get(disease)
+            expected = bonus if any(symptom in symptoms for symptom in matched) else 0
+            if row is not None and bonuses[row] != expected:
+                mismatches += 1
+
+    print(f"{mismatches} mismatches")
+    if not mismatches:
+        print("✅ PASS\n")
+        return True
+
+    print("❌ FAIL\n")
+    return False
+
+def test_reload_rules():
+    """Test that an edited rule file takes effect on reload and an invalid one is rejected"""
+    print("Testing rule reloading...")
+    print("=" * 60)
+
+    # Import from main.py
+    import main
+
+    with open(main.SYMPTOM_RULES_PATH) as f:
+        rules = json.load(f)
+    # Map a lone headache to Migraine instead of Sinusitis
+    rules['single_symptom'] = [rule for rule in rules['single_symptom'] if 'headache' not in rule['symptoms']]
+    rules['single_symptom'].append({'symptoms': ['headache'], 'disease': 'Migraine'})
+
+    all_passed = True
+    with tempfile.TemporaryDirectory() as directory:
+        edited_path = os.path.join(directory, 'rules.json')
+        invalid_path = os.path.join(directory, 'invalid.json')
+        with open(edited_path, 'w') as f:
+            json.dump(rules, f)
+        with open(invalid_path, 'w') as f:
+            json.dump({'clusters': [{'groups': [['fever']]}]}, f)
+
+        before = main.predict_disease_from_symptoms(['headache'])
+        try:
+            counts = main.reload_symptom_rules(edited_path)
+            after = main.predict_disease_from_symptoms(['headache'])
+            try:
+                main.reload_symptom_rules(invalid_path)
+                rejected = False
+            except ValueError as e:
+                print(f"Invalid rule file rejected: {e}")
+                rejected = True
+            kept = main.predict_disease_from_symptoms(['headache'])
+        finally:
+            main.reload_symptom_rules()
+        restored = main.predict_disease_from_symptoms(['headache'])
+
+    print(f"Reloaded {counts}")
+    print(f"headache: before {before!r}, after reload {after!r}, after invalid file {kept!r}, restored {restored!r}")
+    if not (before == 'Sinusitis' and after == 'Migraine' and rejected and kept == 'Migraine' and restored == 'Sinusitis'):
+        all_passed = False
+
+    print("✅ PASS\n" if all_passed else "❌ FAIL\n")
+
+    return all_passed
+
+def test_refresh_on_file_change():
+    """Test that a worker reloads the rule file after it changes, once the check interval has passed"""
+    print("Testing rule refresh when the rule file changes...")
+    print("=" * 60)
+
+    # Import from main.py
+    import main
+
+    with open(main.SYMPTOM_RULES_PATH) as f:
+        rules = json.load(f)
+    edited = dict(rules, single_symptom=[rule for rule in rules['single_symptom'] if 'headache' not in rule['symptoms']]
+                  + [{'symptoms': ['headache'], 'disease': 'Migraine'}])
+
+    def write_rules(path, content, mtime):
+        with open(path, 'w') as f:
+            json.dump(content, f)
+        # Explicit times, so each write is seen as a change even on coarse file systems
+        os.utime(path, (mtime, mtime))
+
+    def rule_for_headache():
+        return client.get('/api/predict/differential?symptoms=headache').get_json()['rule']
+
+    client = main.app.test_client()
+    original_path = main.SYMPTOM_RULES_PATH
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'rules.json')
+        write_rules(path, rules, 1000000000)
+        try:
+            main.SYMPTOM_RULES_PATH = path
+            main.reload_symptom_rules()
+            write_rules(path, edited, 1000000010)
+
+            # Within the check interval the worker keeps its rules
+            main.SYMPTOM_RULES_NEXT_CHECK = time.monotonic() + 60
+            refreshed_early = main.refresh_symptom_rules()
+            early = rule_for_headache()
+            main.SYMPTOM_RULES_NEXT_CHECK = 0
+            changed = rule_for_headache()
+
+            # An invalid edit is ignored and the last good rules stay
+            write_rules(path, {'clusters': [{'groups': [['fever']]}]}, 1000000020)
+            main.SYMPTOM_RULES_NEXT_CHECK = 0
+            invalid = rule_for_headache()
+        finally:
+            main.SYMPTOM_RULES_PATH = original_path
+            main.reload_symptom_rules()
+
+    removed = client.post('/api/symptom-rules/reload').status_code
+    print(f"headache: before the interval {early!r} (refreshed {refreshed_early}), after {changed!r}, "
+          f"after an invalid edit {invalid!r}; POST /api/symptom-rules/reload: {removed}")
+    if not refreshed_early and early == 'Sinusitis' and changed == 'Migraine' and invalid == 'Migraine' and removed in (404, 405):
+        print("✅ PASS\n")
+        return True
+
+    print("❌ FAIL\n")
+    return False
+
+def main():
+    """Main test function"""
+    rules_passed = test_rules_match_legacy()
+    bonuses_passed = test_bonuses_match_legacy()
+    reload_passed = test_reload_rules()
+    refresh_passed = test_refresh_on_file_change()
+
+    print("=" * 60)
+    if rules_passed and bonuses_passed and reload_passed and refresh_passed:
+        print("🎉 ALL TESTS PASSED! The symptom rule table works correctly.")
+        return True
+    else:
+        print("❌ SOME TESTS FAILED! Please check the implementation.")
+        return False
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
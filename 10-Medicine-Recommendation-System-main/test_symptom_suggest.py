@@ -0,0 +1,116 @@
+"""
+Test script to verify the /api/symptoms/suggest autocomplete endpoint and the
+compressed prefix trie behind it
+"""
+
+import sys
+import os
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+def test_suggestions():
+    """Test the completions and their ranking for typed prefixes"""
+    print("Testing symptom suggestions...")
+    print("=" * 60)
+
+    # Import the function from main.py
+    from main import suggest_symptoms
+
+    test_cases = [
+        ('it', 'weight', ['itching']),
+        ('Skin_r', 'weight', ['skin_rash']),
+        ('rash', 'weight', ['skin_rash']),                      # matches from any word
+        ('head', 'weight', ['headache']),
+        ('fev', 'weight', ['high_fever']),                      # through the 'fever' alias
+        ('cough, nau', 'weight', ['nausea']),                   # last comma-separated symptom
+        ('skin ', 'weight', ['nodal_skin_eruptions', 'skin_rash', 'skin_peeling']),
+        ('skin ', 'frequency', ['skin_rash', 'skin_peeling', 'nodal_skin_eruptions']),
+        ('xyz', 'weight', []),
+        ('', 'weight', []),
+    ]
+
+    all_passed = True
+
+    for query, ranking, expected in test_cases:
+        result = [suggestion['symptom'] for suggestion in suggest_symptoms(query, 5, ranking)]
+        print(f"Input: {query!r} ({ranking})")
+        print(f"  Expected: {expected}")
+        print(f"  Got: {result}")
+        if result == expected:
+            print("  ✅ PASS\n")
+        else:
+            print("  ❌ FAIL\n")
+            all_passed = False
+
+    return all_passed
+
+def test_trie_matches_prefix_scan():
+    """Test every prefix of every entry against a scan of all entries"""
+    print("Testing the prefix trie against a full scan...")
+    print("=" * 60)
+
+    # Import from main.py
+    from main import (SYMPTOM_SUGGESTION_TRIE, SUGGESTION_RANKINGS, SUGGEST_MAX_RESULTS,
+                      get_suggestion_entries, search_suggestion_trie, suggestion_rank)
+
+    entries = get_suggestion_entries()
+    prefixes = {text[:i] for text in entries for i in range(1, len(text) + 1)}
+    mismatches = 0
+
+    for prefix in prefixes:
+        matching = {symptom for text, symptoms in entries.items() if text.startswith(prefix) for symptom in symptoms}
+        for ranking in SUGGESTION_RANKINGS:
+            expected = sorted(matching, key=lambda symptom: suggestion_rank(symptom, ranking))[:SUGGEST_MAX_RESULTS]
+            if search_suggestion_trie(SYMPTOM_SUGGESTION_TRIE, prefix, ranking) != expected:
+                mismatches += 1
+
+    print(f"{len(prefixes)} prefixes, {mismatches} mismatches")
+    if mismatches == 0:
+        print("✅ PASS\n")
+        return True
+
+    print("❌ FAIL\n")
+    return False
+
+def test_suggest_endpoint():
+    """Test the JSON endpoint and its parameter validation"""
+    print("Testing the /api/symptoms/suggest endpoint...")
+    print("=" * 60)
+
+    # Import the Flask app from main.py
+    from main import app
+
+    client = app.test_client()
+    response = client.get('/api/symptoms/suggest?q=sk&k=2')
+    data = response.get_json()
+    bad_rank = client.get('/api/symptoms/suggest?q=sk&rank=alphabetical')
+    bad_limit = client.get('/api/symptoms/suggest?q=sk&k=many')
+
+    print(f"Response: {data}")
+    if (response.status_code == 200 and data['query'] == 'sk' and len(data['suggestions']) == 2
+            and data['suggestions'][0]['label'] == 'nodal skin eruptions'
+            and bad_rank.status_code == 400 and bad_limit.status_code == 400):
+        print("✅ PASS\n")
+        return True
+
+    print("❌ FAIL\n")
+    return False
+
+def main():
+    """Main test function"""
+    suggestions_passed = test_suggestions()
+    trie_passed = test_trie_matches_prefix_scan()
+    endpoint_passed = test_suggest_endpoint()
+
+    print("=" * 60)
+    if suggestions_passed and trie_passed and endpoint_passed:
+        print("🎉 ALL TESTS PASSED! Symptom suggestions work correctly.")
+        return True
+    else:
+        print("❌ SOME TESTS FAILED! Please check the implementation.")
+        return False
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)